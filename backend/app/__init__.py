@@ -7,6 +7,7 @@ create_app() 함수를 통해 Flask 앱을 생성하고 초기화합니다.
 
 import os
 import logging
+import click
 from logging.handlers import RotatingFileHandler
 from flask import Flask
 from flask_cors import CORS
@@ -15,13 +16,14 @@ from app.config import get_config
 from app.extensions import db, jwt, limiter
 
 
-def create_app(config_name=None):
+def create_app(config_name=None, **config_overrides):
     """
     Flask 애플리케이션 팩토리
     
     Args:
         config_name (str): 설정 환경 ('development', 'production', 'testing')
                           None이면 FLASK_ENV 환경 변수 사용
+        **config_overrides: 설정 클래스 값 대신 사용할 설정 (예: SQLALCHEMY_DATABASE_URI)
     
     Returns:
         Flask: 초기화된 Flask 앱
@@ -32,6 +34,7 @@ def create_app(config_name=None):
     # 설정 로드
     config_class = get_config(config_name)
     app.config.from_object(config_class)
+    app.config.update(config_overrides)
     
     # 확장 초기화
     initialize_extensions(app)
@@ -193,6 +196,19 @@ def register_cli_commands(app):
             db.create_all()
             print('✓ 데이터베이스 테이블이 생성되었습니다.')
     
+    @app.cli.command('migrate-db')
+    def migrate_db():
+        """기존 데이터베이스에 스키마 변경 사항 적용"""
+        from app.utils.migrations import run_migrations
+        
+        with app.app_context():
+            db.create_all()
+            applied = run_migrations()
+            if applied:
+                print(f'✓ 적용된 마이그레이션: {", ".join(applied)}')
+            else:
+                print('✓ 적용할 마이그레이션이 없습니다.')
+    
     @app.cli.command('drop-db')
     def drop_db():
         """데이터베이스 삭제 (주의!)"""
@@ -225,6 +241,38 @@ def register_cli_commands(app):
             db.session.commit()
             
             print(f'✓ 관리자 계정이 생성되었습니다: {username}')
-    
+
+    @app.cli.command('build-relations')
+    @click.option('--threshold', default=0.3, show_default=True, help='관계로 저장할 최소 유사도')
+    @click.option('--top-k', default=10, show_default=True, help='개념별 최대 유사 개념 수')
+    @click.option('--max-keyword-df', default=None, type=int, help='이 개수보다 많은 개념에 등장하는 흔한 키워드 제외 (rules: 후보 생성, tfidf: 벡터)')
+    @click.option('--mode', type=click.Choice(['rules', 'tfidf']), default='rules', show_default=True,
+                  help='rules: 규칙 기반 점수, tfidf: TF-IDF 코사인 (numpy/scipy 필요)')
+    def build_relations(threshold, top_k, max_keyword_df, mode):
+        """전체 개념의 유사도 관계(similar_to) 재계산"""
+        from etl.similarity_index import build_similarity_relations
+
+        with app.app_context():
+            stats = build_similarity_relations(
+                threshold=threshold,
+                top_k=top_k,
+                max_keyword_df=max_keyword_df,
+                mode=mode
+            )
+            print(
+                f"✓ {stats['concepts']}개 개념, {stats['pairs']}개 유사 쌍 "
+                f"(신규 {stats['inserted']}, 갱신 {stats['updated']}, "
+                f"그래프 캐시 삭제 {stats['graph_caches_cleared']})"
+            )
+
+    @app.cli.command('index-concepts')
+    def index_concepts():
+        """증분 유사도 계산용 개념 키워드 색인(Concept_Keyword) 재작성"""
+        from etl.incremental_relations import IncrementalRelationUpdater
+
+        with app.app_context():
+            indexed = IncrementalRelationUpdater().rebuild_index()
+            print(f'✓ {indexed}개 개념의 키워드 색인을 재작성했습니다.')
+
     app.logger.info('CLI 명령 등록 완료')
 
@@ -24,7 +24,8 @@ class Config:
     DB_PORT = os.getenv('DB_PORT', '3306')
     DB_NAME = os.getenv('DB_NAME', 'foreigneye_db')
     
-    SQLALCHEMY_DATABASE_URI = (
+    # DATABASE_URL이 있으면 우선 사용 (예: ETL 벤치마크용 SQLite 파일)
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL') or (
         f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
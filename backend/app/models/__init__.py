@@ -7,7 +7,11 @@
 from app.models.user import User
 from app.models.article import Article
 from app.models.concept import Concept
-from app.models.relations import Article_Concept, Concept_Relation, User_Collection
+from app.models.relations import (
+    Article_Concept, Concept_Relation, Concept_Keyword, Article_Simhash_Band,
+    User_Collection
+)
+from app.models.work_item import ETL_WorkItem
 
 __all__ = [
     'User',
@@ -15,6 +19,9 @@ __all__ = [
     'Concept',
     'Article_Concept',
     'Concept_Relation',
-    'User_Collection'
+    'Concept_Keyword',
+    'Article_Simhash_Band',
+    'User_Collection',
+    'ETL_WorkItem'
 ]
 
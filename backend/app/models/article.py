@@ -7,6 +7,12 @@ Article 모델
 from datetime import datetime
 import json
 from app.extensions import db
+from app.utils.url_utils import url_hash
+
+
+def _default_url_hash(context):
+    """INSERT 시 original_url로 url_hash 자동 계산"""
+    return url_hash(context.get_current_parameters()['original_url'])
 
 
 class Article(db.Model):
@@ -17,7 +23,9 @@ class Article(db.Model):
         article_id (int): 기사 ID (Primary Key)
         title (str): 원본 영문 제목
         title_ko (str): 한국어 번역 제목
-        original_url (str): 원본 기사 URL (Unique)
+        original_url (str): 원본 기사 URL
+        url_hash (bytes): 정규화된 URL의 sha256 (Unique, 중복 확인용 고정 길이 키)
+        content_simhash (int): 본문 64비트 SimHash (부호 있는 정수, 유사 기사 탐지용)
         summary_ko (str): AI 생성 한국어 요약
         graph_cache (str): 사전 계산된 지식 그래프 JSON
         created_at (datetime): 기사 생성 시각
@@ -30,8 +38,10 @@ class Article(db.Model):
     article_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title = db.Column(db.String(255), nullable=False)
     title_ko = db.Column(db.String(255), nullable=True)
-    original_url = db.Column(db.String(512), unique=True, nullable=False, index=True)
+    original_url = db.Column(db.String(512), nullable=False)
+    url_hash = db.Column(db.BINARY(32), nullable=False, default=_default_url_hash)
     summary_ko = db.Column(db.Text, nullable=False)
+    content_simhash = db.Column(db.BigInteger, nullable=True)
     graph_cache = db.Column(db.Text, nullable=True)  # JSON 형식의 그래프 캐시
     created_at = db.Column(
         db.DateTime,
@@ -40,6 +50,11 @@ class Article(db.Model):
         index=True
     )
     
+    # 유니크 제약 조건 (URL 중복 확인은 가변 길이 URL 대신 32바이트 해시로)
+    __table_args__ = (
+        db.UniqueConstraint('url_hash', name='article_url_hash_UNIQUE'),
+    )
+    
     # 관계 정의
     concepts = db.relationship(
         'Article_Concept',
@@ -47,6 +62,12 @@ class Article(db.Model):
         lazy=True,
         cascade='all, delete-orphan'
     )
+    simhash_bands = db.relationship(
+        'Article_Simhash_Band',
+        backref='article',
+        lazy=True,
+        cascade='all, delete-orphan'
+    )
     
     # 시리얼라이저
     def to_dict(self, include_preview=False, include_concepts=False, include_graph=False):
@@ -20,6 +20,7 @@ class Concept(db.Model):
         relations_from (relationship): 이 개념에서 시작하는 관계들
         relations_to (relationship): 이 개념으로 향하는 관계들
         collections (relationship): 이 개념을 수집한 사용자들
+        keywords (relationship): 증분 유사도 계산용 키워드 색인
     """
     
     __tablename__ = 'Concept'
@@ -61,6 +62,13 @@ class Concept(db.Model):
         cascade='all, delete-orphan'
     )
     
+    keywords = db.relationship(
+        'Concept_Keyword',
+        backref='concept',
+        lazy=True,
+        cascade='all, delete-orphan'
+    )
+    
     # 시리얼라이저
     def to_dict(self, include_articles=False, include_relations=False, is_collected=None):
         """
@@ -3,6 +3,7 @@
 
 Article_Concept: 기사-개념 관계 (N:M)
 Concept_Relation: 개념-개념 관계 (방향성 그래프)
+Concept_Keyword: 개념 키워드 역색인 (증분 유사도 계산용)
 User_Collection: 사용자-개념 수집 관계 (N:M)
 """
 
@@ -39,9 +40,9 @@ class Article_Concept(db.Model):
         index=True
     )
     
-    # 복합 인덱스 (성능 최적화)
+    # 유니크 제약 조건 (중복 연결 방지, ETL 일괄 적재의 upsert 키)
     __table_args__ = (
-        db.Index('idx_article_concept', 'article_id', 'concept_id'),
+        db.UniqueConstraint('article_id', 'concept_id', name='article_concept_UNIQUE'),
     )
     
     def __repr__(self):
@@ -81,11 +82,13 @@ class Concept_Relation(db.Model):
     relation_type = db.Column(db.String(50), nullable=True)
     strength = db.Column(db.Integer, nullable=False, default=1)
     
-    # 복합 인덱스 (성능 최적화)
+    # 복합 인덱스 (성능 최적화). 유니크 키가 (from, to) 조회 인덱스 역할도 함
     __table_args__ = (
+        db.UniqueConstraint(
+            'from_concept_id', 'to_concept_id', 'relation_type', name='concept_relation_UNIQUE'
+        ),
         db.Index('idx_from_concept', 'from_concept_id'),
         db.Index('idx_to_concept', 'to_concept_id'),
-        db.Index('idx_concept_relation', 'from_concept_id', 'to_concept_id'),
         db.Index('idx_strength', 'strength'),
     )
     
@@ -103,6 +106,81 @@ class Concept_Relation(db.Model):
         return f'<Concept_Relation {self.from_concept_id}→{self.to_concept_id} (strength={self.strength})>'
 
 
+class Concept_Keyword(db.Model):
+    """
+    개념 키워드 역색인 테이블
+    
+    새 개념이 추가될 때 전체 개념을 다시 비교하지 않고,
+    토큰을 공유하는 개념만 후보로 조회하기 위해 사용합니다.
+    
+    Attributes:
+        keyword_id (int): 색인 ID (Primary Key)
+        concept_id (int): 개념 ID (Foreign Key)
+        token_type (str): 토큰 종류
+                          ('kw': 이름+설명 키워드, 'nw': 이름 단어,
+                           'tri': 이름 trigram, 'name': 소문자 전체 이름)
+        token (str): 토큰
+    """
+    
+    __tablename__ = 'Concept_Keyword'
+    
+    keyword_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    concept_id = db.Column(
+        db.Integer,
+        db.ForeignKey('Concept.concept_id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    token_type = db.Column(db.String(8), nullable=False)
+    token = db.Column(db.String(100), nullable=False)
+    
+    # 유니크 제약 조건 및 토큰 조회 인덱스
+    __table_args__ = (
+        db.UniqueConstraint('concept_id', 'token_type', 'token', name='concept_token_UNIQUE'),
+        db.Index('idx_keyword_token', 'token_type', 'token', 'concept_id'),
+    )
+    
+    def __repr__(self):
+        return f'<Concept_Keyword concept={self.concept_id} {self.token_type}:{self.token}>'
+
+
+class Article_Simhash_Band(db.Model):
+    """
+    기사 SimHash 밴드 색인 테이블
+    
+    64비트 SimHash를 16비트씩 4개 밴드로 나눠 저장합니다.
+    해밍 거리가 3 이하인 두 SimHash는 적어도 한 밴드가 같으므로,
+    (band_no, band_value) 조회만으로 유사 기사 후보를 찾을 수 있습니다.
+    
+    Attributes:
+        band_id (int): 색인 ID (Primary Key)
+        article_id (int): 기사 ID (Foreign Key)
+        band_no (int): 밴드 번호 (0~3)
+        band_value (int): 밴드 값 (0~65535)
+    """
+    
+    __tablename__ = 'Article_Simhash_Band'
+    
+    band_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    article_id = db.Column(
+        db.Integer,
+        db.ForeignKey('Article.article_id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    band_no = db.Column(db.SmallInteger, nullable=False)
+    band_value = db.Column(db.Integer, nullable=False)
+    
+    # 유니크 제약 조건 및 밴드 조회 인덱스
+    __table_args__ = (
+        db.UniqueConstraint('article_id', 'band_no', name='article_band_UNIQUE'),
+        db.Index('idx_simhash_band', 'band_no', 'band_value', 'article_id'),
+    )
+    
+    def __repr__(self):
+        return f'<Article_Simhash_Band article={self.article_id} {self.band_no}:{self.band_value}>'
+
+
 class User_Collection(db.Model):
     """
     사용자 개념 수집 테이블 (N:M 관계)
@@ -0,0 +1,77 @@
+"""
+ETL_WorkItem 모델
+
+ETL 파이프라인에서 기사 URL 하나의 처리 상태와 중간 결과를 저장합니다.
+실행이 중단돼도 다음 실행은 각 기사를 마지막으로 완료된 단계부터 이어서 처리합니다.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+
+class ETL_WorkItem(db.Model):
+    """
+    ETL 작업 항목 모델
+
+    상태 흐름: fetched → scraped → analyzed → loaded
+    실패하면 상태는 그대로 두고 attempts를 늘린 뒤 next_attempt_at 이후에 다시 시도하며,
+    최대 시도 횟수를 넘으면 failed가 됩니다. 관련도 필터에서 제외된 기사는 skipped이며,
+    개념 용어 사전이 그때보다 충분히 커지면 최근 항목부터 fetched로 되돌려 저장된 본문으로 다시 평가합니다.
+    여러 워커 프로세스가 처리할 때는 lease_owner/lease_expires_at으로 항목을 한 워커에만 할당하고,
+    lease가 만료된 항목(워커가 죽은 경우)은 다른 워커가 다시 가져갑니다.
+
+    Attributes:
+        item_id (int): 작업 항목 ID (Primary Key)
+        url_hash (bytes): 정규화된 URL의 sha256 (Unique, Article.url_hash와 같은 값)
+        url (str): 기사 URL
+        state (str): 마지막으로 완료된 단계 ('fetched', 'scraped', 'analyzed', 'loaded', 'failed', 'skipped')
+        payload (JSON): 중간 결과 {'article': GNews 기사 정보, 'content': 본문, 'analysis': AI 분석 결과}
+        attempts (int): 실패한 시도 횟수
+        last_error (str): 마지막 오류 메시지
+        next_attempt_at (datetime): 다음 시도 가능 시각 (None이면 즉시)
+        article_id (int): 적재된 기사 ID
+        lease_owner (str): 항목을 처리 중인 워커 ID
+        lease_expires_at (datetime): lease 만료 시각 (None이면 아무도 처리하지 않음)
+        vocabulary_size (int): skipped로 표시할 때 관련도 필터의 용어 수
+        created_at (datetime): 항목 생성 시각
+        updated_at (datetime): 마지막 상태 변경 시각
+    """
+
+    __tablename__ = 'ETL_WorkItem'
+
+    # 처리할 단계가 남은 상태
+    ACTIVE_STATES = ('fetched', 'scraped', 'analyzed')
+
+    # 컬럼 정의
+    item_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    url_hash = db.Column(db.BINARY(32), nullable=False)
+    url = db.Column(db.String(512), nullable=False)
+    state = db.Column(db.String(16), nullable=False, default='fetched')
+    payload = db.Column(db.JSON, nullable=False)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    next_attempt_at = db.Column(db.DateTime, nullable=True)
+    article_id = db.Column(
+        db.Integer,
+        db.ForeignKey('Article.article_id', ondelete='SET NULL'),
+        nullable=True
+    )
+    lease_owner = db.Column(db.String(64), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    vocabulary_size = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+
+    # 유니크 제약 조건 및 처리 대상 조회 인덱스
+    __table_args__ = (
+        db.UniqueConstraint('url_hash', name='work_item_url_hash_UNIQUE'),
+        db.Index('idx_work_item_due', 'state', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f'<ETL_WorkItem {self.item_id}: {self.state} {self.url[:50]}>'
@@ -11,7 +11,7 @@ import os
 from typing import Dict, Optional
 from textwrap import dedent
 
-from openai import OpenAI
+from app.utils.llm_client import LLMClient, get_llm_client
 
 
 class KnowledgeService:
@@ -19,32 +19,46 @@ class KnowledgeService:
 
     MODEL_DEFAULT = "anthropic/claude-3-haiku"
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        llm_client: Optional[LLMClient] = None,
+        base_url: Optional[str] = None
+    ):
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not found. Please set it before running the ETL pipeline.")
 
         self.model = model or self.MODEL_DEFAULT
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=self.api_key,
-            default_headers={
-                "HTTP-Referer": "https://techexplained.project",
-                "X-Title": "TechExplained Project"
-            }
-        )
+        # Shared pooled client (rate-limit backoff and adaptive concurrency).
+        self.llm = llm_client or get_llm_client(self.api_key, base_url)
 
     def define_concept(self, concept_name: str, article_summary: str) -> Dict:
         """Retrieve a structured definition for the given concept name within article context."""
         prompt = self._build_prompt(concept_name, article_summary)
 
-        response = self.client.chat.completions.create(
+        response = self.llm.complete(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=1200
+        )
+        return self._parse_definition(response, concept_name)
+
+    async def adefine_concept(self, concept_name: str, article_summary: str) -> Dict:
+        """Async variant of define_concept for callers running many definitions concurrently."""
+        prompt = self._build_prompt(concept_name, article_summary)
+
+        response = await self.llm.acomplete(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
             max_tokens=1200
         )
+        return self._parse_definition(response, concept_name)
 
+    def _parse_definition(self, response, concept_name: str) -> Dict:
         if not response or not response.choices:
             raise RuntimeError("Empty response from OpenRouter while defining concept")
 
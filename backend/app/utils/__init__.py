@@ -18,6 +18,7 @@ from app.utils.validators import (
     validate_password,
     validate_pagination
 )
+from app.utils.url_utils import canonicalize_url, url_hash
 
 __all__ = [
     # Response formatters
@@ -37,5 +38,9 @@ __all__ = [
     'validate_email_address',
     'validate_password',
     'validate_pagination',
+    
+    # URL
+    'canonicalize_url',
+    'url_hash',
 ]
 
@@ -0,0 +1,429 @@
+"""
+공유 LLM 클라이언트
+
+AIAnalyzer와 KnowledgeService가 함께 사용하는 OpenRouter(OpenAI 호환) 클라이언트입니다.
+
+- 하나의 비동기 HTTP 연결 풀을 프로세스 전체에서 공유
+- 429 응답 시 Retry-After(없으면 지수 백오프)만큼 전체 요청을 잠시 멈춤
+- 성공/실패 비율에 따라 동시 요청 수를 자동 조절 (AIMD)
+- 요청마다 최대 처리 시간(deadline) 적용
+- 완료된 요청마다 등록된 관찰자(observer)에 응답과 재시도 횟수 전달 (ETL 비용/재시도 계측)
+
+동기 코드(ETL 워커 스레드)에서는 complete()를, 비동기 코드에서는 acomplete()를 사용합니다.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+DEFAULT_HEADERS = {
+    "HTTP-Referer": "https://techexplained.project",
+    "X-Title": "TechExplained Project"
+}
+
+
+class AdaptiveLimiter:
+    """
+    동시 요청 수 제한기 (AIMD)
+
+    - 성공이 현재 한도만큼 쌓이면 한도 +1
+    - 429 응답이면 한도를 절반으로 줄이고 cooldown 동안 새 요청 중지
+    - 타임아웃/서버 오류면 한도 -1
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+
+        self._in_flight = 0
+        self._successes = 0
+        self._cooldown_until = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    async def acquire(self):
+        """요청 슬롯 확보 (한도 초과 또는 cooldown 중이면 대기)"""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                delay = self._cooldown_until - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+
+                await condition.wait()
+
+    async def release(self, outcome: str, retry_after: float = 0.0):
+        """
+        요청 슬롯 반납 및 한도 조정
+
+        Args:
+            outcome (str): 'success', 'rate_limited', 'error' 중 하나
+            retry_after (float): rate_limited일 때 새 요청을 멈출 시간 (초)
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+
+            if outcome == 'success':
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self._successes = 0
+                    self.limit = min(self.maximum, self.limit + 1)
+
+            elif outcome == 'rate_limited':
+                self._successes = 0
+                self.limit = max(self.minimum, self.limit // 2)
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
+
+            else:
+                self._successes = 0
+                self.limit = max(self.minimum, self.limit - 1)
+
+            condition.notify_all()
+
+    def _get_condition(self) -> asyncio.Condition:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+
+class LLMClient:
+    """rate limit을 고려하는 공유 비동기 LLM 클라이언트"""
+
+    # 재시도 대상 오류 (429 제외)
+    RETRYABLE_ERRORS = (APITimeoutError, APIConnectionError, InternalServerError, asyncio.TimeoutError)
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = OPENROUTER_BASE_URL,
+        max_concurrency: int = 16,
+        initial_concurrency: int = 4,
+        request_timeout: float = 60.0,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0
+    ):
+        """
+        Args:
+            api_key (str): OpenRouter API 키
+            base_url (str): OpenAI 호환 API 주소
+            max_concurrency (int): 동시 요청 수 상한 (연결 풀 크기)
+            initial_concurrency (int): 시작 동시 요청 수
+            request_timeout (float): 요청 1회의 최대 처리 시간 (초)
+            max_retries (int): 429/타임아웃/서버 오류 시 최대 재시도 횟수
+            backoff_base (float): 지수 백오프 기본 대기 시간 (초)
+            backoff_max (float): 백오프 최대 대기 시간 (초)
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_concurrency = max(1, max_concurrency)
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.limiter = AdaptiveLimiter(
+            initial=initial_concurrency,
+            maximum=self.max_concurrency
+        )
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'failures': 0}
+
+        self._observers: List[Callable] = []
+
+        self._client: Optional[AsyncOpenAI] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    async def acomplete(
+        self,
+        model: str,
+        messages: List[Dict],
+        temperature: float = 0.5,
+        max_tokens: int = 1000,
+        timeout: Optional[float] = None
+    ):
+        """
+        Chat Completions 요청 (재시도/동시성 제어 포함)
+
+        요청은 클라이언트 전용 이벤트 루프에서 실행되므로, 어떤 이벤트 루프에서
+        호출하든 같은 연결 풀과 동시성 제한을 공유합니다.
+
+        Args:
+            model (str): 모델 이름
+            messages (list): 대화 메시지
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 출력 토큰
+            timeout (float, optional): 요청 1회의 deadline. None이면 request_timeout
+
+        Returns:
+            ChatCompletion: OpenAI SDK 응답 객체
+
+        Raises:
+            openai.APIError: 재시도 후에도 실패하거나 재시도 대상이 아닌 오류
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(model, messages, temperature, max_tokens, timeout),
+            self._get_loop()
+        )
+        response, retries = await asyncio.wrap_future(future)
+        self._notify(response, retries)
+        return response
+
+    def complete(
+        self,
+        model: str,
+        messages: List[Dict],
+        temperature: float = 0.5,
+        max_tokens: int = 1000,
+        timeout: Optional[float] = None
+    ):
+        """
+        acomplete()의 동기 버전 (여러 스레드에서 동시에 호출 가능)
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(model, messages, temperature, max_tokens, timeout),
+            self._get_loop()
+        )
+        response, retries = future.result()
+        self._notify(response, retries)
+        return response
+
+    def add_observer(self, observer: Callable):
+        """
+        완료된 요청 관찰자 등록 (같은 함수는 한 번만 등록)
+
+        관찰자는 complete()/acomplete()를 호출한 스레드에서 실행되므로
+        호출 스레드의 스레드 로컬 상태(예: ETL 계측 span)에 기록할 수 있습니다.
+
+        Args:
+            observer (callable): observer(response, retries). response.usage에 토큰 사용량이 있음
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        요청 통계
+
+        Returns:
+            dict: {'requests', 'retries', 'rate_limited', 'failures', 'concurrency_limit'}
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['concurrency_limit'] = self.limiter.limit
+        return stats
+
+    def close(self):
+        """연결 풀과 이벤트 루프 종료"""
+        with self._loop_lock:
+            loop = self._loop
+            self._loop = None
+
+        if loop is None:
+            return
+
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.close(), loop).result()
+            self._client = None
+
+        loop.call_soon_threadsafe(loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join()
+            self._loop_thread = None
+
+        # 동시성 제한기의 Condition은 닫힌 루프에 묶여 있으므로 재생성
+        self.limiter._condition = None
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    async def _request(
+        self,
+        model: str,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int,
+        timeout: Optional[float]
+    ):
+        """
+        이벤트 루프 스레드에서 실행되는 실제 요청/재시도 루프
+
+        Returns:
+            tuple: (ChatCompletion, 재시도 횟수)
+        """
+        client = self._get_client()
+        deadline = timeout or self.request_timeout
+        attempt = 0
+
+        while True:
+            await self.limiter.acquire()
+            self._count('requests')
+
+            try:
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    ),
+                    timeout=deadline
+                )
+
+            except RateLimitError as e:
+                delay = self._retry_after(e) or self._backoff(attempt)
+                self._count('rate_limited')
+                await self.limiter.release('rate_limited', retry_after=delay)
+
+                if attempt >= self.max_retries:
+                    self._count('failures')
+                    raise
+
+            except self.RETRYABLE_ERRORS:
+                delay = self._backoff(attempt)
+                await self.limiter.release('error')
+
+                if attempt >= self.max_retries:
+                    self._count('failures')
+                    raise
+
+            except Exception:
+                await self.limiter.release('error')
+                self._count('failures')
+                raise
+
+            else:
+                await self.limiter.release('success')
+                return response, attempt
+
+            attempt += 1
+            self._count('retries')
+            await asyncio.sleep(delay)
+
+    def _notify(self, response, retries: int):
+        for observer in self._observers:
+            try:
+                observer(response, retries)
+            except Exception as e:
+                # 계측 실패가 요청 결과를 버리게 해서는 안 됨
+                print(f"  ✗ LLM observer failed: {e}")
+
+    def _get_client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                default_headers=DEFAULT_HEADERS,
+                max_retries=0,  # 재시도는 이 클래스에서 직접 처리
+                timeout=self.request_timeout,
+                http_client=httpx.AsyncClient(
+                    timeout=self.request_timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency
+                    )
+                )
+            )
+        return self._client
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name='llm-client-loop',
+                    daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._loop_thread = thread
+            return self._loop
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _retry_after(self, error: RateLimitError) -> float:
+        try:
+            value = error.response.headers.get('retry-after')
+            return min(self.backoff_max, float(value)) if value else 0.0
+        except (AttributeError, TypeError, ValueError):
+            return 0.0
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+
+_shared_clients: Dict[tuple, LLMClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_llm_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> LLMClient:
+    """
+    프로세스 공유 LLM 클라이언트 반환
+
+    같은 API 키/주소를 쓰는 호출자는 같은 연결 풀과 동시성 제한을 공유합니다.
+
+    Args:
+        api_key (str, optional): OpenRouter API 키. None이면 OPENROUTER_API_KEY 환경 변수
+        base_url (str, optional): OpenAI 호환 API 주소. None이면 OPENROUTER_BASE_URL 환경 변수 또는
+                                  OpenRouter 주소 (로컬 스텁 서버로 바꿔서 벤치마크할 때 사용)
+
+    Returns:
+        LLMClient: 공유 클라이언트
+
+    Raises:
+        ValueError: API 키가 없을 때
+    """
+    api_key = api_key or os.getenv('OPENROUTER_API_KEY')
+    if not api_key:
+        raise ValueError("OPENROUTER_API_KEY not found. Please set it in .env file.")
+    base_url = base_url or os.getenv('OPENROUTER_BASE_URL') or OPENROUTER_BASE_URL
+
+    key = (api_key, base_url)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = LLMClient(
+                api_key=api_key,
+                base_url=base_url,
+                max_concurrency=int(os.getenv('LLM_MAX_CONCURRENCY', 16)),
+                initial_concurrency=int(os.getenv('LLM_INITIAL_CONCURRENCY', 4)),
+                request_timeout=float(os.getenv('LLM_REQUEST_TIMEOUT', 60))
+            )
+            _shared_clients[key] = client
+        return client
@@ -0,0 +1,316 @@
+"""
+스키마 마이그레이션
+
+db.create_all()은 이미 존재하는 테이블을 변경하지 않으므로,
+기존 DB에 필요한 변경(제약 조건, 컬럼 추가 등)을 여기서 멱등하게 적용합니다.
+각 단계는 이미 적용되어 있으면 아무것도 하지 않습니다.
+
+사용법:
+    flask migrate-db
+"""
+
+import hashlib
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Index, bindparam, delete, inspect, text, update
+
+from app.extensions import db
+from app.models import Article, Article_Concept, Concept_Relation
+from app.utils.url_utils import url_hash
+
+
+def _has_unique(inspector, table_name: str, columns: List[str]) -> bool:
+    """해당 컬럼 조합의 유니크 제약/인덱스 존재 여부"""
+    for constraint in inspector.get_unique_constraints(table_name):
+        if constraint['column_names'] == columns:
+            return True
+    for index in inspector.get_indexes(table_name):
+        if index.get('unique') and index['column_names'] == columns:
+            return True
+    return False
+
+
+def add_article_concept_unique(connection) -> bool:
+    """
+    Article_Concept (article_id, concept_id) 유니크 제약 추가
+
+    중복 연결이 있으면 가장 먼저 생성된 행만 남기고 삭제한 뒤,
+    유니크 인덱스를 만들고 중복이 된 기존 복합 인덱스를 제거합니다.
+
+    Returns:
+        bool: 변경 적용 여부
+    """
+    inspector = inspect(connection)
+    if _has_unique(inspector, 'Article_Concept', ['article_id', 'concept_id']):
+        return False
+
+    connection.execute(text(
+        '''
+        DELETE FROM Article_Concept WHERE ac_id NOT IN (
+            SELECT keep_id FROM (
+                SELECT MIN(ac_id) AS keep_id FROM Article_Concept GROUP BY article_id, concept_id
+            ) AS keepers
+        )
+        '''
+    ))
+
+    table = Article_Concept.__table__
+    Index('article_concept_UNIQUE', table.c.article_id, table.c.concept_id, unique=True).create(connection)
+
+    if any(index['name'] == 'idx_article_concept' for index in inspector.get_indexes('Article_Concept')):
+        Index('idx_article_concept', table.c.article_id, table.c.concept_id).drop(connection)
+
+    return True
+
+
+def backfill_url_hashes(connection, batch_size: int = 1000) -> int:
+    """
+    url_hash가 비어 있거나 다른 기사와 겹치는 기사에 정규화 URL 해시 채우기
+
+    정규화하면 같은 URL이 되는 기존 기사가 여러 개면 가장 먼저 저장된 기사만
+    정규화 URL 해시를 갖고, 나머지는 "원본 URL#article_id"의 해시를 사용합니다.
+    (원본 URL이 이미 정규화된 형태면 원본 URL 해시가 정규화 URL 해시와 같아지므로 article_id를 섞음)
+
+    이전 버전의 백필이 겹치는 해시를 남겨 유니크 인덱스 생성이 실패한 DB도
+    다시 실행하면 겹치는 행을 고친 뒤 인덱스를 만들 수 있습니다.
+
+    Returns:
+        int: 채우거나 고친 행 수
+    """
+    table = Article.__table__
+    used = set()
+    repairs = []
+    for article_id, original_url, value in connection.execute(
+        text('SELECT article_id, original_url, url_hash FROM Article WHERE url_hash IS NOT NULL ORDER BY article_id')
+    ):
+        if value in used:
+            repairs.append((article_id, original_url))
+        else:
+            used.add(value)
+
+    def unique_hash(article_id, original_url):
+        value = url_hash(original_url)
+        suffix = article_id
+        while value in used:
+            value = hashlib.sha256(f"{original_url}#{suffix}".encode('utf-8')).digest()
+            suffix = f"{suffix}#"
+        used.add(value)
+        return value
+
+    def apply(rows):
+        connection.execute(
+            update(table)
+            .where(table.c.article_id == bindparam('b_article_id'))
+            .values(url_hash=bindparam('b_url_hash')),
+            [
+                {'b_article_id': article_id, 'b_url_hash': unique_hash(article_id, original_url)}
+                for article_id, original_url in rows
+            ]
+        )
+
+    for start in range(0, len(repairs), batch_size):
+        apply(repairs[start:start + batch_size])
+    filled = len(repairs)
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            text(
+                'SELECT article_id, original_url FROM Article '
+                'WHERE url_hash IS NULL AND article_id > :last_id '
+                'ORDER BY article_id LIMIT :limit'
+            ),
+            {'last_id': last_id, 'limit': batch_size}
+        ).all()
+        if not rows:
+            return filled
+
+        apply(rows)
+        filled += len(rows)
+        last_id = rows[-1][0]
+
+
+def add_article_url_hash(connection) -> bool:
+    """
+    Article.url_hash (BINARY(32), 유니크) 추가 및 original_url 인덱스 제거
+
+    1. url_hash 컬럼 추가 (NULL 허용)
+    2. 기존 기사 백필
+    3. 유니크 인덱스 생성 (MySQL은 NOT NULL로 변경)
+    4. original_url의 유니크/보조 인덱스 제거
+
+    Returns:
+        bool: 변경 적용 여부
+    """
+    inspector = inspect(connection)
+    changed = False
+
+    columns = {column['name'] for column in inspector.get_columns('Article')}
+    if 'url_hash' not in columns:
+        connection.execute(text('ALTER TABLE Article ADD COLUMN url_hash BINARY(32) NULL'))
+        changed = True
+
+    if backfill_url_hashes(connection):
+        changed = True
+
+    if not _has_unique(inspector, 'Article', ['url_hash']):
+        table = Article.__table__
+        Index('article_url_hash_UNIQUE', table.c.url_hash, unique=True).create(connection)
+        if connection.dialect.name == 'mysql':
+            connection.execute(text('ALTER TABLE Article MODIFY url_hash BINARY(32) NOT NULL'))
+        changed = True
+
+    for index in inspector.get_indexes('Article'):
+        if index['column_names'] == ['original_url']:
+            _drop_index(connection, 'Article', index['name'])
+            changed = True
+    for constraint in inspector.get_unique_constraints('Article'):
+        if constraint['column_names'] == ['original_url'] and constraint.get('name'):
+            _drop_index(connection, 'Article', constraint['name'])
+            changed = True
+
+    return changed
+
+
+def _drop_index(connection, table_name: str, index_name: str):
+    """인덱스(MySQL 유니크 제약 포함) 삭제"""
+    if connection.dialect.name == 'mysql':
+        connection.execute(text(f'ALTER TABLE `{table_name}` DROP INDEX `{index_name}`'))
+    else:
+        connection.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+
+
+def add_article_content_simhash(connection) -> bool:
+    """
+    Article.content_simhash (BIGINT) 컬럼 추가
+
+    밴드 색인 테이블(Article_Simhash_Band)은 db.create_all()이 만듭니다.
+    기존 기사는 본문을 저장하지 않으므로 백필하지 않고, 새로 적재되는 기사부터 지문이 채워집니다.
+
+    Returns:
+        bool: 변경 적용 여부
+    """
+    columns = {column['name'] for column in inspect(connection).get_columns('Article')}
+    if 'content_simhash' in columns:
+        return False
+
+    connection.execute(text('ALTER TABLE Article ADD COLUMN content_simhash BIGINT NULL'))
+    return True
+
+
+def add_work_item_lease(connection) -> bool:
+    """
+    ETL_WorkItem lease 컬럼 (lease_owner, lease_expires_at) 추가
+
+    Returns:
+        bool: 변경 적용 여부
+    """
+    columns = {column['name'] for column in inspect(connection).get_columns('ETL_WorkItem')}
+    changed = False
+
+    if 'lease_owner' not in columns:
+        connection.execute(text('ALTER TABLE ETL_WorkItem ADD COLUMN lease_owner VARCHAR(64) NULL'))
+        changed = True
+    if 'lease_expires_at' not in columns:
+        connection.execute(text('ALTER TABLE ETL_WorkItem ADD COLUMN lease_expires_at DATETIME NULL'))
+        changed = True
+
+    return changed
+
+
+def add_concept_relation_unique(connection) -> bool:
+    """
+    Concept_Relation (from_concept_id, to_concept_id, relation_type) 유니크 제약 추가
+
+    중복 관계가 있으면 가장 먼저 생성된 행에 가장 큰 strength를 남기고 나머지를 삭제한 뒤,
+    유니크 인덱스를 만들고 중복이 된 기존 (from, to) 복합 인덱스를 제거합니다.
+
+    Returns:
+        bool: 변경 적용 여부
+    """
+    inspector = inspect(connection)
+    if _has_unique(inspector, 'Concept_Relation', ['from_concept_id', 'to_concept_id', 'relation_type']):
+        return False
+
+    duplicates = connection.execute(text(
+        '''
+        SELECT from_concept_id, to_concept_id, relation_type, MIN(relation_id), MAX(strength)
+        FROM Concept_Relation
+        WHERE relation_type IS NOT NULL
+        GROUP BY from_concept_id, to_concept_id, relation_type
+        HAVING COUNT(*) > 1
+        '''
+    )).all()
+
+    table = Concept_Relation.__table__
+    if duplicates:
+        rows = [
+            {'b_from': from_id, 'b_to': to_id, 'b_type': relation_type, 'b_keep': keep_id, 'b_strength': strength}
+            for from_id, to_id, relation_type, keep_id, strength in duplicates
+        ]
+        connection.execute(
+            update(table)
+            .where(table.c.relation_id == bindparam('b_keep'))
+            .values(strength=bindparam('b_strength')),
+            rows
+        )
+        connection.execute(
+            delete(table)
+            .where(table.c.from_concept_id == bindparam('b_from'))
+            .where(table.c.to_concept_id == bindparam('b_to'))
+            .where(table.c.relation_type == bindparam('b_type'))
+            .where(table.c.relation_id != bindparam('b_keep')),
+            rows
+        )
+
+    Index(
+        'concept_relation_UNIQUE',
+        table.c.from_concept_id, table.c.to_concept_id, table.c.relation_type,
+        unique=True
+    ).create(connection)
+
+    if any(index['name'] == 'idx_concept_relation' for index in inspector.get_indexes('Concept_Relation')):
+        _drop_index(connection, 'Concept_Relation', 'idx_concept_relation')
+
+    return True
+
+
+def add_work_item_vocabulary_size(connection) -> bool:
+    """
+    ETL_WorkItem.vocabulary_size 컬럼 추가 (관련도 필터로 건너뛴 기사의 재평가 기준)
+
+    Returns:
+        bool: 변경 적용 여부
+    """
+    columns = {column['name'] for column in inspect(connection).get_columns('ETL_WorkItem')}
+    if 'vocabulary_size' in columns:
+        return False
+
+    connection.execute(text('ALTER TABLE ETL_WorkItem ADD COLUMN vocabulary_size INTEGER NULL'))
+    return True
+
+
+# (이름, 적용 함수) - 순서대로 실행
+MIGRATIONS: List[Tuple[str, Callable]] = [
+    ('article_concept_unique', add_article_concept_unique),
+    ('article_url_hash', add_article_url_hash),
+    ('article_content_simhash', add_article_content_simhash),
+    ('work_item_lease', add_work_item_lease),
+    ('work_item_vocabulary_size', add_work_item_vocabulary_size),
+    ('concept_relation_unique', add_concept_relation_unique),
+]
+
+
+def run_migrations() -> List[str]:
+    """
+    모든 마이그레이션 적용 (앱 컨텍스트 안에서 호출)
+
+    Returns:
+        list: 이번에 실제로 적용된 마이그레이션 이름들
+    """
+    applied = []
+    for name, migrate in MIGRATIONS:
+        with db.engine.begin() as connection:
+            if migrate(connection):
+                applied.append(name)
+    return applied
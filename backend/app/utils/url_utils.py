@@ -0,0 +1,83 @@
+"""
+URL 유틸리티
+
+같은 문서를 가리키는 URL을 하나의 형태로 맞춥니다.
+"""
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# 스킴별 기본 포트 (정규화 시 제거)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# 문서 내용과 무관한 추적용 쿼리 파라미터 (정규화 시 제거)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', '_ga', '_gl', 'ocid', 'cmpid', 'ncid', 'smid',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig',
+}
+TRACKING_PARAM_PREFIXES = ('utm_',)
+
+
+def is_tracking_param(name):
+    """추적용 쿼리 파라미터 여부 (utm_* 등)"""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url):
+    """
+    URL 정규화
+
+    - 스킴과 호스트를 소문자로 변환
+    - 기본 포트(80/443)와 fragment(#...) 제거
+    - 추적용 쿼리 파라미터(utm_*, fbclid, gclid 등) 제거
+    - 쿼리 파라미터 정렬
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        str: 정규화된 URL (파싱할 수 없으면 앞뒤 공백만 제거한 원본)
+    """
+    url = (url or '').strip()
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if not scheme or not host:
+        return url
+
+    netloc = host
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f'{host}:{port}'
+
+    path = parts.path or '/'
+
+    query_params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    ]
+    query = urlencode(sorted(query_params))
+
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def url_hash(url):
+    """
+    정규화된 URL의 sha256 해시 (Article.url_hash 값)
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        bytes: 32바이트 digest
+    """
+    return hashlib.sha256(canonicalize_url(url).encode('utf-8')).digest()
@@ -9,11 +9,15 @@ from etl.web_scraper import WebScraper
 from etl.ai_analyzer import AIAnalyzer
 from etl.db_loader import DBLoader
 from etl.similarity_calculator import SimilarityCalculator
+from etl.similarity_index import SimilarityIndex
+from etl.pipeline import ETLPipeline
 
 __all__ = [
     'GNewsFetcher',
     'WebScraper',
     'AIAnalyzer',
     'DBLoader',
-    'SimilarityCalculator'
+    'SimilarityCalculator',
+    'SimilarityIndex',
+    'ETLPipeline'
 ]
@@ -7,18 +7,47 @@ OpenRouter API를 사용하여 기사를 분석하고 개념을 추출합니다.
 import os
 import json
 import re
-from typing import Optional, Dict
-from openai import OpenAI
+from typing import Optional, Dict, List
+from app.utils.llm_client import LLMClient, get_llm_client
+from etl import metrics
+from etl.analysis_cache import AnalysisCache
 
 
 class AIAnalyzer:
     """AI 기반 기사 분석 클래스"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "anthropic/claude-3-haiku"):
+    # 프롬프트 템플릿 버전 (프롬프트를 바꾸면 올려서 캐시를 무효화).
+    # 단건/배치 프롬프트는 따로 관리하며 캐시 키와 코퍼스 기록에 사용한 프롬프트의 버전이 들어감
+    PROMPT_VERSION = "v1"
+    BATCH_PROMPT_VERSION = "batch-v1"
+    
+    # 프롬프트에 넣는 기사 본문 최대 길이
+    MAX_ARTICLE_CHARS = 3000
+    
+    # 배치 요청 시 기사당/요청당 최대 출력 토큰
+    BATCH_TOKENS_PER_ARTICLE = 800
+    BATCH_MAX_TOKENS = 4000
+    
+    # 파싱 실패 시 응답을 debug_*.txt로 저장할지 여부 (코퍼스 재생 시 끔)
+    save_debug_responses = True
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "anthropic/claude-3-haiku",
+        cache: Optional[AnalysisCache] = None,
+        llm_client: Optional[LLMClient] = None,
+        base_url: Optional[str] = None,
+        recorder=None
+    ):
         """
         Args:
             api_key (str, optional): OpenRouter API 키. None이면 환경 변수에서 로드
             model (str): 사용할 AI 모델 (기본값: claude-3-haiku)
+            cache (AnalysisCache, optional): 분석 결과 캐시
+            llm_client (LLMClient, optional): LLM 클라이언트. None이면 프로세스 공유 클라이언트 사용
+            base_url (str, optional): OpenAI 호환 API 주소. None이면 OPENROUTER_BASE_URL 환경 변수 또는 OpenRouter
+            recorder (CorpusRecorder, optional): 지정하면 LLM 응답을 재생용 코퍼스에 기록
         """
         self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
         
@@ -26,14 +55,9 @@ class AIAnalyzer:
             raise ValueError("OPENROUTER_API_KEY not found. Please set it in .env file.")
         
         self.model = model
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=self.api_key,
-            default_headers={
-                "HTTP-Referer": "https://techexplained.project",
-                "X-Title": "TechExplained Project"
-            }
-        )
+        self.cache = cache
+        self.recorder = recorder
+        self.llm = llm_client or get_llm_client(self.api_key, base_url)
     
     def analyze_article(self, article_text: str) -> Optional[Dict]:
         """
@@ -54,6 +78,28 @@ class AIAnalyzer:
             print(f"     ✗ Article text too short (length: {len(article_text) if article_text else 0})")
             return None
         
+        # 캐시 조회
+        cached = self._get_cached(article_text, self.PROMPT_VERSION)
+        if cached:
+            print(f"     ✓ Using cached analysis ({len(cached['concept_names'])} concepts)")
+            return cached
+        
+        analysis_result = self._request_analysis(article_text)
+        if analysis_result:
+            self._put_cached(article_text, self.PROMPT_VERSION, analysis_result)
+        
+        return analysis_result
+    
+    def _request_analysis(self, article_text: str) -> Optional[Dict]:
+        """
+        단일 기사 분석 요청 (캐시 미사용)
+        
+        Args:
+            article_text (str): 분석할 기사 텍스트
+            
+        Returns:
+            dict: 검증된 분석 결과 또는 None
+        """
         # 프롬프트 생성
         prompt = self._build_prompt(article_text)
         
@@ -62,7 +108,7 @@ class AIAnalyzer:
             print(f"     → Model: {self.model}")
             print(f"     → Article length: {len(article_text)} chars")
             
-            response = self.client.chat.completions.create(
+            response = self.llm.complete(
                 model=self.model,
                 messages=[
                     {
@@ -80,6 +126,7 @@ class AIAnalyzer:
             
             ai_response = response.choices[0].message.content.strip()
             print(f"     ✓ Received response ({len(ai_response)} chars)")
+            self._record('analysis', [article_text], ai_response, response)
             
             # JSON 파싱
             analysis_result = self._parse_response(ai_response)
@@ -96,6 +143,257 @@ class AIAnalyzer:
             print(f"     ✗ Error during AI analysis: {type(e).__name__}: {e}")
             return None
     
+    def analyze_articles(self, article_texts: List[str], batch_size: int = 4) -> List[Optional[Dict]]:
+        """
+        여러 기사를 묶어서 분석
+        
+        batch_size개씩 하나의 요청으로 보내고 JSON 배열로 결과를 받습니다.
+        항목별로 _validate_analysis를 통과하지 못한 기사는 analyze_article로 다시 분석합니다.
+        
+        Args:
+            article_texts (list): 분석할 기사 텍스트 리스트
+            batch_size (int): 한 요청에 넣을 기사 수
+            
+        Returns:
+            list: article_texts와 같은 순서의 분석 결과 (실패한 항목은 None)
+        """
+        results: List[Optional[Dict]] = [None] * len(article_texts)
+        pending = []
+        
+        for idx, article_text in enumerate(article_texts):
+            if not article_text or len(article_text.strip()) < 100:
+                print(f"     ✗ Article text too short (length: {len(article_text) if article_text else 0})")
+                continue
+            
+            cached = self._get_cached(article_text, self.BATCH_PROMPT_VERSION)
+            if cached:
+                print(f"     ✓ Using cached analysis ({len(cached['concept_names'])} concepts)")
+                results[idx] = cached
+                continue
+            
+            pending.append(idx)
+        
+        batch_size = max(1, batch_size)
+        retry = []
+        
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            
+            if len(batch) == 1:
+                retry.extend(batch)
+                continue
+            
+            batch_results = self._analyze_batch([article_texts[idx] for idx in batch])
+            
+            for idx, analysis_result in zip(batch, batch_results):
+                if analysis_result:
+                    results[idx] = analysis_result
+                    self._put_cached(article_texts[idx], self.BATCH_PROMPT_VERSION, analysis_result)
+                else:
+                    retry.append(idx)
+        
+        # 배치에서 실패한 항목은 개별 요청으로 재시도
+        if retry:
+            print(f"     → Falling back to single-article analysis for {len(retry)} articles")
+        for idx in retry:
+            analysis_result = self._request_analysis(article_texts[idx])
+            if analysis_result:
+                results[idx] = analysis_result
+                self._put_cached(article_texts[idx], self.PROMPT_VERSION, analysis_result)
+        
+        return results
+    
+    def _analyze_batch(self, article_texts: List[str]) -> List[Optional[Dict]]:
+        """
+        기사 묶음을 하나의 요청으로 분석
+        
+        Args:
+            article_texts (list): 기사 텍스트 리스트
+            
+        Returns:
+            list: 같은 순서의 검증된 분석 결과 (실패한 항목은 None)
+        """
+        prompt = self._build_batch_prompt(article_texts)
+        
+        try:
+            print(f"     ⟳ Sending batch request to OpenRouter AI ({len(article_texts)} articles)...")
+            print(f"     → Model: {self.model}")
+            
+            response = self.llm.complete(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.5,
+                max_tokens=min(
+                    self.BATCH_MAX_TOKENS,
+                    self.BATCH_TOKENS_PER_ARTICLE * len(article_texts)
+                )
+            )
+            
+            if not response or not response.choices:
+                print("     ✗ Empty response from OpenRouter API")
+                return [None] * len(article_texts)
+            
+            ai_response = response.choices[0].message.content.strip()
+            print(f"     ✓ Received batch response ({len(ai_response)} chars)")
+            self._record('batch', article_texts, ai_response, response)
+            
+            return self._parse_batch_response(ai_response, len(article_texts))
+        
+        except Exception as e:
+            print(f"     ✗ Error during batch AI analysis: {type(e).__name__}: {e}")
+            return [None] * len(article_texts)
+    
+    def _build_batch_prompt(self, article_texts: List[str]) -> str:
+        """
+        배치 분석 프롬프트 생성
+        
+        Args:
+            article_texts (list): 기사 텍스트 리스트
+            
+        Returns:
+            str: 프롬프트
+        """
+        articles_block = "\n\n".join(
+            f"[Article {idx}]\n{article_text[:self.MAX_ARTICLE_CHARS]}"
+            for idx, article_text in enumerate(article_texts, 1)
+        )
+        
+        prompt = f"""
+You are 'TechExplained', an expert technology scout.
+Analyse each of the {len(article_texts)} news articles below independently and return ONLY a valid JSON array. No commentary, markdown, or extra text.
+
+For every article:
+1. Translate the article title into natural Korean (title_ko).
+2. Provide a detailed Korean summary in 3-5 sentences that captures the article's key developments, 주요 인물/기업, 그리고 영향 (summary_ko).
+3. List up to five distinct technology-related concepts that are explicitly mentioned in that article. Provide only their canonical names (prefer English terms). Do not invent new concepts. Output them as an array "concept_names".
+
+{articles_block}
+
+Return a JSON array with exactly one object per article, in this shape:
+[
+  {{
+    "index": 1,
+    "title_ko": "한국어 제목",
+    "summary_ko": "한국어 요약",
+    "concept_names": ["Concept 1", "Concept 2"]
+  }}
+]
+
+Important rules:
+- Respond with JSON only.
+- "index" must match the article number above.
+- Never mix information between articles.
+- If fewer than five valid concepts exist, return only the ones that are explicitly mentioned.
+- Remove duplicates and keep the order they appear in the article.
+"""
+        
+        return prompt
+    
+    def _parse_batch_response(self, ai_response: str, expected_count: int) -> List[Optional[Dict]]:
+        """
+        배치 응답(JSON 배열) 파싱
+        
+        Args:
+            ai_response (str): AI 응답 텍스트
+            expected_count (int): 요청한 기사 수
+            
+        Returns:
+            list: 기사 순서대로 검증된 분석 결과 (누락/검증 실패 항목은 None)
+        """
+        results: List[Optional[Dict]] = [None] * expected_count
+        
+        try:
+            entries = json.loads(ai_response)
+        except json.JSONDecodeError:
+            json_match = re.search(r'\[.*\]', ai_response, re.DOTALL)
+            if not json_match:
+                print("     ✗ No JSON array found in batch response")
+                self._save_debug_response(ai_response, prefix="debug_batch_response")
+                return results
+            try:
+                entries = json.loads(json_match.group(0))
+            except json.JSONDecodeError as e:
+                print(f"     ✗ Failed to parse batch JSON: {e}")
+                self._save_debug_response(json_match.group(0), prefix="debug_batch_json")
+                return results
+        
+        if not isinstance(entries, list):
+            print("     ✗ Batch response is not a JSON array")
+            return results
+        
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                continue
+            
+            # index가 없거나 잘못되었으면 배열 순서를 사용
+            index = entry.pop('index', None)
+            if not isinstance(index, int) or not 1 <= index <= expected_count:
+                index = position + 1
+            if index > expected_count or results[index - 1] is not None:
+                continue
+            
+            results[index - 1] = self._validate_analysis(entry)
+        
+        succeeded = sum(1 for result in results if result)
+        print(f"     ✓ Batch analysis parsed: {succeeded}/{expected_count} valid")
+        
+        return results
+    
+    def _get_cached(self, article_text: str, prompt_version: str) -> Optional[Dict]:
+        """
+        캐시된 분석 결과 조회 (캐시 미사용 시 None)
+        
+        요청할 프롬프트(prompt_version)의 결과를 먼저 찾고, 없으면 다른 프롬프트(단건/배치)의
+        결과를 사용합니다. 두 결과는 키와 prompt_version이 다르므로 캐시에서 구분됩니다.
+        """
+        if self.cache is None:
+            return None
+        versions = [prompt_version] + [
+            version for version in (self.PROMPT_VERSION, self.BATCH_PROMPT_VERSION) if version != prompt_version
+        ]
+        for version in versions:
+            cached = self.cache.get(self._cache_key(article_text, version))
+            if cached:
+                metrics.record(cache_hits=1)
+                return cached
+        return None
+    
+    def _put_cached(self, article_text: str, prompt_version: str, analysis_result: Dict):
+        """분석 결과를 만든 프롬프트의 버전으로 캐시에 저장"""
+        if self.cache is None:
+            return
+        self.cache.put(
+            self._cache_key(article_text, prompt_version),
+            self.model,
+            prompt_version,
+            analysis_result
+        )
+    
+    def _record(self, kind: str, article_texts: List[str], ai_response: str, response):
+        """코퍼스 기록기가 있으면 LLM 응답 기록"""
+        if self.recorder is None:
+            return
+        self.recorder.record_llm(
+            kind,
+            self.model,
+            self.BATCH_PROMPT_VERSION if kind == 'batch' else self.PROMPT_VERSION,
+            article_texts,
+            ai_response,
+            getattr(response, 'usage', None)
+        )
+    
+    def _cache_key(self, article_text: str, prompt_version: str) -> str:
+        return AnalysisCache.make_key(
+            self.model,
+            prompt_version,
+            article_text[:self.MAX_ARTICLE_CHARS]
+        )
+    
     def _build_prompt(self, article_text: str) -> str:
         """
         AI 분석 프롬프트 생성
@@ -107,7 +405,7 @@ class AIAnalyzer:
             str: 프롬프트
         """
         # 텍스트 길이 제한 (3000자)
-        truncated_text = article_text[:3000]
+        truncated_text = article_text[:self.MAX_ARTICLE_CHARS]
         
         prompt = f"""
 You are 'TechExplained', an expert technology scout.
@@ -227,6 +525,8 @@ Important rules:
             content (str): 저장할 내용
             prefix (str): 파일명 접두사
         """
+        if not self.save_debug_responses:
+            return
         try:
             filename = f'{prefix}.txt'
             with open(filename, 'w', encoding='utf-8') as f:
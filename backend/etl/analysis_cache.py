@@ -0,0 +1,179 @@
+"""
+AI 분석 결과 캐시
+
+AIAnalyzer.analyze_article 결과를 로컬 SQLite에 저장합니다.
+키는 (모델, 프롬프트 버전, 잘라낸 기사 본문)의 해시이므로
+같은 본문(재실행, 신디케이션 기사 등)은 LLM을 다시 호출하지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class AnalysisCache:
+    """분석 결과 영속 캐시 (TTL + 항목 수 제한)"""
+
+    # put() 몇 번마다 만료/용량 정리를 할지
+    EVICT_INTERVAL = 100
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Args:
+            cache_dir (str, optional): 캐시 디렉토리. None이면 ETL_CACHE_DIR 환경 변수 또는 '.etl_cache'
+            ttl_seconds (int, optional): 항목 유효 기간. None이면 ETL_ANALYSIS_CACHE_TTL 또는 30일
+            max_entries (int, optional): 최대 항목 수. None이면 ETL_ANALYSIS_CACHE_MAX_ENTRIES 또는 50000
+        """
+        cache_dir = cache_dir or os.getenv('ETL_CACHE_DIR', '.etl_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.ttl_seconds = ttl_seconds or int(os.getenv('ETL_ANALYSIS_CACHE_TTL', 30 * 24 * 3600))
+        self.max_entries = max_entries or int(os.getenv('ETL_ANALYSIS_CACHE_MAX_ENTRIES', 50000))
+
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, 'analysis.sqlite3'),
+            check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS analyses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            '''
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses (created_at)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_analyses_accessed ON analyses (accessed_at)')
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, article_text: str) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            model (str): 모델 이름
+            prompt_version (str): 프롬프트 템플릿 버전
+            article_text (str): 프롬프트에 들어가는 (잘라낸) 기사 본문
+
+        Returns:
+            str: sha256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in (model, prompt_version, article_text):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict]:
+        """
+        캐시된 분석 결과 조회 (만료된 항목은 없는 것으로 처리)
+
+        Args:
+            cache_key (str): make_key() 결과
+
+        Returns:
+            dict: 분석 결과 또는 None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT result FROM analyses WHERE cache_key = ? AND created_at >= ?',
+                (cache_key, now - self.ttl_seconds)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                'UPDATE analyses SET accessed_at = ? WHERE cache_key = ?',
+                (now, cache_key)
+            )
+            self._conn.commit()
+
+        return json.loads(row[0])
+
+    def put(self, cache_key: str, model: str, prompt_version: str, result: Dict):
+        """
+        분석 결과 저장
+
+        Args:
+            cache_key (str): make_key() 결과
+            model (str): 모델 이름
+            prompt_version (str): 프롬프트 템플릿 버전
+            result (dict): 검증된 분석 결과
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                '''
+                INSERT OR REPLACE INTO analyses
+                    (cache_key, model, prompt_version, result, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ''',
+                (cache_key, model, prompt_version, json.dumps(result, ensure_ascii=False), now, now)
+            )
+
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= self.EVICT_INTERVAL:
+                self._evict(now)
+                self._puts_since_evict = 0
+
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        적중/미스 횟수
+
+        Returns:
+            dict: {'hits': int, 'misses': int}
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        """캐시 닫기 (남은 정리 작업 수행)"""
+        with self._lock:
+            self._evict(time.time())
+            self._conn.commit()
+            self._conn.close()
+
+    def _evict(self, now: float):
+        """만료 항목 삭제 후, 항목 수가 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        self._conn.execute(
+            'DELETE FROM analyses WHERE created_at < ?',
+            (now - self.ttl_seconds,)
+        )
+
+        count = self._conn.execute('SELECT COUNT(*) FROM analyses').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                '''
+                DELETE FROM analyses WHERE cache_key IN (
+                    SELECT cache_key FROM analyses ORDER BY accessed_at ASC LIMIT ?
+                )
+                ''',
+                (overflow,)
+            )
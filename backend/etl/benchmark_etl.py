@@ -0,0 +1,144 @@
+"""
+ETL 처리량 벤치마크 (로컬 스텁 사용)
+
+etl/stub_servers.py의 GNews/chat completions/언론사 스텁을 띄우고, 임시 SQLite DB와 임시 캐시 디렉토리로
+수집 → 스크래핑 → 분석 → 적재 (→ 개념 정의) 전체를 실행해 기사/초를 측정합니다.
+실제 API 키나 토큰 비용 없이 동시성/배치 설정을 바꿔 가며 처리량을 비교할 수 있습니다.
+
+사용법:
+    python -m etl.benchmark_etl --articles 200
+    python -m etl.benchmark_etl --articles 200 --llm-latency 1.5 --error-rate 0.05 --analyze-batch-size 4
+    python -m etl.benchmark_etl --database-url mysql+pymysql://user:pw@localhost/bench_db
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from app import create_app
+from app import models  # noqa: F401  (create_all 대상 모델 등록)
+from app.extensions import db
+from etl.components import ETLComponents
+from etl.gnews_fetcher import GNewsFetcher
+from etl.run import print_stage_totals
+from etl.stub_servers import StubEnvironment
+from etl.url_deduper import UrlDeduplicator
+
+
+def run_benchmark(args, database_url: str) -> dict:
+    """
+    스텁과 임시 환경에서 파이프라인 한 번 실행
+
+    Args:
+        args (argparse.Namespace): main()의 명령행 인자
+        database_url (str): 사용할 DB (SQLite면 테이블 생성)
+
+    Returns:
+        dict: 파이프라인 통계 + 'seconds', 'articles_per_second'
+    """
+    app = create_app('development', SQLALCHEMY_DATABASE_URI=database_url)
+    with app.app_context():
+        if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+            db.create_all()
+
+        components = ETLComponents(
+            app,
+            scrape_concurrency=args.scrape_concurrency,
+            analyze_concurrency=args.analyze_concurrency,
+            load_concurrency=args.load_concurrency,
+            analyze_batch_size=args.analyze_batch_size,
+            load_batch_size=args.load_batch_size,
+            parse_processes=args.parse_processes,
+            define_concepts=not args.no_define,
+            resume=not args.no_resume,
+            run_kind='benchmark'
+        )
+        fetcher = GNewsFetcher()
+
+        print(f"({components.describe()})")
+        started = time.perf_counter()
+        try:
+            articles = []
+            while len(articles) < args.articles:
+                articles.extend(fetcher.fetch_articles(max_results=min(100, args.articles - len(articles))))
+            summary = components.pipeline.run(UrlDeduplicator().filter_new(articles))
+        finally:
+            seconds = time.perf_counter() - started
+            components.close()
+            fetcher.close()
+
+        summary['seconds'] = round(seconds, 2)
+        summary['articles_per_second'] = round(summary['processed'] / seconds, 2) if seconds else 0.0
+
+        print()
+        print("=" * 70)
+        print(
+            f"✓ {summary['processed']}/{len(articles)} articles in {seconds:.1f}s "
+            f"→ {summary['articles_per_second']:.2f} articles/sec"
+        )
+        print(f"  errors {summary['errors']}, filtered {summary['filtered']}, near-duplicates {summary['near_duplicates']}")
+        if components.metrics is not None:
+            print_stage_totals(components.metrics.stage_totals())
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ETL 처리량 벤치마크 (로컬 스텁 서버)')
+    parser.add_argument('--articles', type=int, default=100, help='처리할 기사 수')
+    parser.add_argument('--gnews-latency', type=float, default=0.2, help='GNews 스텁 응답 지연 (초)')
+    parser.add_argument('--llm-latency', type=float, default=0.8, help='LLM 스텁 응답 지연 (초)')
+    parser.add_argument('--page-latency', type=float, default=0.3, help='언론사 스텁 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.5, help='지연 변동 비율')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='LLM/언론사 500 응답 비율')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='LLM 429 응답 비율')
+    parser.add_argument('--seed', type=int, help='지연/오류 난수 시드')
+    parser.add_argument('--database-url', help='사용할 DB (기본값: 임시 SQLite 파일)')
+    parser.add_argument('--keep', action='store_true', help='임시 DB/캐시 디렉토리를 지우지 않음')
+    parser.add_argument('--scrape-concurrency', type=int, default=4)
+    parser.add_argument('--analyze-concurrency', type=int, default=2)
+    parser.add_argument('--load-concurrency', type=int, default=1)
+    parser.add_argument('--analyze-batch-size', type=int, default=1)
+    parser.add_argument('--load-batch-size', type=int, default=10)
+    parser.add_argument('--parse-processes', type=int, default=0)
+    parser.add_argument('--no-define', action='store_true', help='새 개념 정의 단계 생략')
+    parser.add_argument('--no-resume', action='store_true', help='작업 큐 체크포인트 없이 실행')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='etl-bench-')
+    stubs = StubEnvironment(
+        gnews_latency=args.gnews_latency,
+        llm_latency=args.llm_latency,
+        page_latency=args.page_latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed
+    ).start()
+
+    # GNews/LLM 클라이언트와 스크래퍼는 생성 시점에 환경 변수에서 스텁 주소를 읽음
+    os.environ.update(stubs.env())
+    os.environ['ETL_CACHE_DIR'] = os.path.join(workdir, 'cache')
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    print("=" * 70)
+    print(
+        f"ETL benchmark: {args.articles} articles, latency gnews={args.gnews_latency}s "
+        f"llm={args.llm_latency}s page={args.page_latency}s, error rate {args.error_rate}"
+    )
+    print(f"Work directory: {workdir}")
+    print("=" * 70)
+
+    try:
+        run_benchmark(args, database_url)
+    finally:
+        print(f"⟳ Stub requests: {stubs.stats()}")
+        print("=" * 70)
+        stubs.stop()
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
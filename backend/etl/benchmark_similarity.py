@@ -0,0 +1,131 @@
+"""
+개념 유사도 계산 벤치마크
+
+같은 개념 집합에 대해 세 가지 방식의 실행 시간을 비교합니다.
+- pairwise: 모든 쌍에 SimilarityCalculator.calculate_similarity 호출 (기존 방식)
+- index:    SimilarityIndex (역색인 후보 생성, pairwise와 같은 결과)
+- tfidf:    TfidfSimilarity (희소 행렬 곱, numpy/scipy 필요)
+
+pairwise는 --pairwise-sample개 개념에서만 측정하고 전체 N에 대한 시간을 추정합니다.
+
+사용법:
+    python -m etl.benchmark_similarity --concepts 20000
+    python -m etl.benchmark_similarity --from-db
+"""
+
+import argparse
+import itertools
+import os
+import random
+import time
+from types import SimpleNamespace
+from typing import List
+
+from etl.similarity_calculator import SimilarityCalculator
+from etl.similarity_index import SimilarityIndex
+
+
+def synthetic_concepts(count: int, seed: int = 42) -> List[SimpleNamespace]:
+    """기술 키워드와 임의 단어를 섞은 가상 개념 생성"""
+    rng = random.Random(seed)
+    tech = sorted(SimilarityCalculator.TECH_KEYWORDS)
+    vocabulary = [f"term{i}" for i in range(max(200, count // 4))]
+
+    concepts = []
+    for concept_id in range(1, count + 1):
+        name_words = rng.sample(tech, 1) + rng.sample(vocabulary, rng.randint(0, 2))
+        description = rng.sample(tech, 3) + rng.sample(vocabulary, 12)
+        concepts.append(SimpleNamespace(
+            concept_id=concept_id,
+            name=f"{' '.join(name_words)} {concept_id}",
+            description_ko=' '.join(description)
+        ))
+    return concepts
+
+
+def load_concepts() -> List[SimpleNamespace]:
+    """DB의 개념 로드 (앱 컨텍스트 생성)"""
+    from dotenv import load_dotenv
+
+    from app import create_app
+    from app.extensions import db
+    from app.models import Concept
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        rows = db.session.query(Concept.concept_id, Concept.name, Concept.description_ko).all()
+
+    return [
+        SimpleNamespace(concept_id=concept_id, name=name, description_ko=description_ko)
+        for concept_id, name, description_ko in rows
+    ]
+
+
+def bench_pairwise(concepts) -> float:
+    start = time.perf_counter()
+    for first, second in itertools.combinations(concepts, 2):
+        SimilarityCalculator.calculate_similarity(first, second)
+    return time.perf_counter() - start
+
+
+def bench_engine(engine, concepts):
+    start = time.perf_counter()
+    for concept in concepts:
+        engine.add(concept.concept_id, concept.name, concept.description_ko)
+    neighbors = engine.neighbors()
+    return time.perf_counter() - start, neighbors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='개념 유사도 계산 벤치마크')
+    parser.add_argument('--concepts', type=int, default=5000, help='가상 개념 수')
+    parser.add_argument('--from-db', action='store_true', help='가상 개념 대신 DB의 개념 사용')
+    parser.add_argument('--threshold', type=float, default=0.3)
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--pairwise-sample', type=int, default=1000, help='pairwise 측정에 사용할 개념 수')
+    args = parser.parse_args()
+
+    concepts = load_concepts() if args.from_db else synthetic_concepts(args.concepts)
+    total = len(concepts)
+    if total < 2:
+        print("✗ Not enough concepts to benchmark.")
+        return
+
+    print("=" * 70)
+    print(f"Concept similarity benchmark ({total} concepts, threshold={args.threshold}, top_k={args.top_k})")
+    print("=" * 70)
+
+    sample = concepts[:min(total, args.pairwise_sample)]
+    sample_pairs = len(sample) * (len(sample) - 1) // 2
+    sample_time = bench_pairwise(sample)
+    estimated = sample_time / sample_pairs * (total * (total - 1) // 2)
+    print(f"pairwise : {sample_time:8.2f}s for {len(sample)} concepts → ~{estimated:,.1f}s estimated for {total}")
+
+    index_time, index_neighbors = bench_engine(
+        SimilarityIndex(threshold=args.threshold, top_k=args.top_k), concepts
+    )
+    print(f"index    : {index_time:8.2f}s ({estimated / index_time:,.1f}x vs pairwise estimate)")
+
+    try:
+        from etl.tfidf_similarity import TfidfSimilarity
+        tfidf = TfidfSimilarity(threshold=args.threshold, top_k=args.top_k)
+    except ImportError as e:
+        print(f"tfidf    : skipped ({e})")
+        return
+
+    tfidf_time, tfidf_neighbors = bench_engine(tfidf, concepts)
+    print(f"tfidf    : {tfidf_time:8.2f}s ({estimated / tfidf_time:,.1f}x vs pairwise estimate)")
+
+    overlap = sum(
+        len({other for other, _ in index_neighbors.get(concept_id, [])} & {other for other, _ in others})
+        for concept_id, others in tfidf_neighbors.items()
+    )
+    returned = sum(len(others) for others in tfidf_neighbors.values())
+    if returned:
+        print(f"tfidf/index top-k agreement: {overlap / returned:.1%} of tfidf neighbours")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+대량 DB 작업 유틸리티
+
+여러 행을 한 번의 쿼리/executemany로 처리하기 위한 공통 함수들입니다.
+모든 함수는 활성화된 앱 컨텍스트 안에서 호출해야 합니다.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from sqlalchemy import func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.extensions import db
+from app.models import Concept
+
+
+# IN 절 하나에 넣을 최대 값 개수
+IN_CHUNK_SIZE = 500
+
+# Concept.name 컬럼 길이
+CONCEPT_NAME_MAX_LENGTH = 100
+
+
+def chunked(values: Sequence, size: int = IN_CHUNK_SIZE) -> Iterable[Sequence]:
+    """시퀀스를 size개씩 나누기"""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def insert_ignore(model, rows: List[Dict]):
+    """
+    유니크 키가 충돌하는 행은 건너뛰는 executemany INSERT
+
+    - MySQL: INSERT IGNORE
+    - SQLite/PostgreSQL: INSERT ... ON CONFLICT DO NOTHING
+    여러 워커가 같은 행을 동시에 넣어도 오류 없이 한 행만 남습니다.
+
+    MySQL에서 ON DUPLICATE KEY UPDATE pk = pk를 쓰지 않는 이유: SQLAlchemy의 pymysql 드라이버는
+    항상 CLIENT_FOUND_ROWS로 연결하므로 이미 있던 행도 rowcount 1로 보고되어,
+    rowcount로 "이 워커가 넣은 행"을 판단할 수 없습니다. INSERT IGNORE는 건너뛴 행을 0으로 셉니다.
+    (INSERT IGNORE는 길이 초과 등 다른 오류도 경고로 바꾸므로, 값은 호출하는 쪽에서 미리 정리)
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        rows (list): 삽입할 행 딕셔너리 리스트
+
+    Returns:
+        CursorResult: 실행 결과 (모든 백엔드에서 rowcount = 실제로 삽입된 행 수). rows가 비어 있으면 None
+    """
+    if not rows:
+        return None
+
+    table = model.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        statement = insert(table).prefix_with('IGNORE', dialect='mysql')
+    elif dialect == 'sqlite':
+        statement = sqlite_insert(table).on_conflict_do_nothing()
+    elif dialect == 'postgresql':
+        statement = postgresql_insert(table).on_conflict_do_nothing()
+    else:
+        statement = insert(table)
+
+    return db.session.connection().execute(statement, rows)
+
+
+def upsert_max(model, rows: List[Dict], keys: List[str], column: str):
+    """
+    유니크 키(keys)가 충돌하면 column을 기존 값과 새 값 중 큰 값으로 갱신하는 executemany INSERT
+
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE column = GREATEST(column, VALUES(column))
+    - SQLite: INSERT ... ON CONFLICT (keys) DO UPDATE SET column = MAX(column, excluded.column)
+    - PostgreSQL: INSERT ... ON CONFLICT (keys) DO UPDATE SET column = GREATEST(column, excluded.column)
+    조회 후 INSERT와 달리 여러 워커가 같은 행을 동시에 써도 한 행만 남습니다.
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        rows (list): 삽입할 행 딕셔너리 리스트
+        keys (list): 유니크 제약의 컬럼 이름들
+        column (str): 충돌 시 큰 값으로 갱신할 컬럼
+
+    Returns:
+        CursorResult: 실행 결과 (rowcount는 백엔드마다 의미가 다름). rows가 비어 있으면 None
+    """
+    if not rows:
+        return None
+
+    table = model.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        statement = mysql_insert(table)
+        statement = statement.on_duplicate_key_update(
+            {column: func.greatest(table.c[column], statement.inserted[column])}
+        )
+    elif dialect == 'sqlite':
+        statement = sqlite_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={column: func.max(table.c[column], statement.excluded[column])}
+        )
+    elif dialect == 'postgresql':
+        statement = postgresql_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={column: func.greatest(table.c[column], statement.excluded[column])}
+        )
+    else:
+        statement = insert(table)
+
+    return db.session.connection().execute(statement, rows)
+
+
+def clean_concept_name(name) -> str:
+    """개념 이름 정리 (저장할 수 없는 이름이면 빈 문자열)"""
+    cleaned = (name or '').strip() if isinstance(name, str) else ''
+    if len(cleaned) > CONCEPT_NAME_MAX_LENGTH:
+        return ''
+    return cleaned
+
+
+def fetch_concept_ids(names: Iterable[str]) -> Dict[str, int]:
+    """
+    개념 이름 → ID 조회 (IN 쿼리, 대소문자 무시)
+
+    Args:
+        names (iterable): 개념 이름들
+
+    Returns:
+        dict: {소문자 이름: concept_id}
+    """
+    lowered = sorted({name.lower() for name in names if name})
+    found: Dict[str, int] = {}
+
+    for chunk in chunked(lowered):
+        rows = db.session.query(Concept.concept_id, Concept.name).filter(
+            func.lower(Concept.name).in_(chunk)
+        ).all()
+        for concept_id, name in rows:
+            found.setdefault(name.lower(), concept_id)
+
+    return found
+
+
+def resolve_concept_ids(names: Iterable[str], description_ko: str) -> Tuple[Dict[str, int], Set[int]]:
+    """
+    개념 이름 → ID 일괄 조회, 없는 개념은 일괄 생성
+
+    Args:
+        names (iterable): 개념 이름들
+        description_ko (str): 새로 만드는 개념의 기본 설명
+
+    Returns:
+        tuple: ({소문자 이름: concept_id}, 새로 생성된 concept_id 집합)
+    """
+    cleaned = {}
+    for name in names:
+        name = clean_concept_name(name)
+        if name:
+            cleaned.setdefault(name.lower(), name)
+
+    found = fetch_concept_ids(cleaned.values())
+
+    missing = [
+        {'name': name, 'description_ko': description_ko, 'real_world_examples_ko': []}
+        for key, name in cleaned.items()
+        if key not in found
+    ]
+    created: Set[int] = set()
+    if missing:
+        created_names = _insert_concepts(missing)
+        created_ids = fetch_concept_ids(row['name'] for row in missing)
+        found.update(created_ids)
+        created.update(concept_id for name, concept_id in created_ids.items() if name in created_names)
+
+    return found, created
+
+
+def _insert_concepts(rows: List[Dict]) -> Set[str]:
+    """
+    개념 일괄 INSERT
+
+    보통은 executemany 한 번으로 끝나고, 다른 워커가 같은 개념을 먼저 만들어
+    유니크 키가 충돌하면 행 단위로 다시 시도해 이 워커가 만든 개념만 돌려줍니다.
+
+    Returns:
+        set: 이번에 실제로 생성된 개념의 소문자 이름
+    """
+    try:
+        with db.session.begin_nested():
+            db.session.connection().execute(insert(Concept.__table__), rows)
+        return {row['name'].lower() for row in rows}
+    except IntegrityError:
+        return {
+            row['name'].lower()
+            for row in rows
+            if insert_ignore(Concept, [row]).rowcount
+        }
@@ -0,0 +1,170 @@
+"""
+ETL 구성 요소 조립
+
+run_etl_pipeline(), ETL 워커(python -m etl.worker), 데몬(python -m etl.run --daemon)이 같은 설정으로
+스크래퍼, AI 분석기, 캐시, 파이프라인을 만들고 정리할 수 있도록 모아 둡니다.
+"""
+
+from typing import Optional
+
+from flask import Flask
+
+from app.services.knowledge_service import KnowledgeService
+from etl.ai_analyzer import AIAnalyzer
+from etl.analysis_cache import AnalysisCache
+from etl.concept_definer import ConceptDefiner
+from etl.db_loader import DBLoader
+from etl.fingerprint import NearDuplicateDetector
+from etl.html_extractor import ExtractionPool
+from etl.incremental_relations import IncrementalRelationUpdater
+from etl.metrics import RunMetrics, record_llm_usage
+from etl.pipeline import ETLPipeline
+from etl.relevance_filter import RelevanceFilter
+from etl.scrape_cache import ScrapeCache
+from etl.web_scraper import WebScraper
+from etl.work_queue import WorkQueue
+
+
+class ETLComponents:
+    """파이프라인과 파이프라인이 사용하는 공유 자원 (close()로 정리)"""
+
+    def __init__(
+        self,
+        app: Flask,
+        scrape_concurrency: int = 4,
+        analyze_concurrency: int = 2,
+        load_concurrency: int = 1,
+        analyze_batch_size: int = 1,
+        load_batch_size: int = 1,
+        parse_processes: int = 0,
+        use_scrape_cache: bool = True,
+        use_analysis_cache: bool = True,
+        define_concepts: bool = True,
+        define_concurrency: int = 2,
+        incremental_relations: bool = True,
+        near_duplicate_distance: int = 3,
+        relevance_threshold: float = 1.0,
+        resume: bool = True,
+        worker_id: Optional[str] = None,
+        claim_limit: Optional[int] = None,
+        record_metrics: bool = True,
+        run_kind: str = 'run',
+        recorder=None
+    ):
+        """
+        Args:
+            app (Flask): DB 작업에 사용할 앱 (활성화된 앱 컨텍스트 안에서 생성)
+            worker_id (str, optional): 작업 항목 lease 소유자 이름 (None이면 호스트/프로세스 기반으로 생성)
+            claim_limit (int, optional): 한 번에 lease할 최대 작업 항목 수 (None이면 WorkQueue 기본값).
+                                         파이프라인은 이만큼씩 가져와 처리하기를 처리할 항목이 없을 때까지 반복
+            record_metrics (bool): 단계별 span을 계측해 실행 기록 파일(etl_runs.jsonl)에 저장할지 여부
+            run_kind (str): 실행 기록에 남길 실행 종류 ('run', 'daemon', 'worker', 'benchmark')
+            recorder (CorpusRecorder, optional): 지정하면 원본 HTML과 LLM 응답을 재생용 코퍼스에 기록.
+                                                 기록 중에는 스크래핑/분석 캐시를 사용하지 않음
+            그 외: run_etl_pipeline()의 같은 이름 인자 참고
+        """
+        self.app = app
+        if recorder is not None:
+            # 캐시 적중이나 304 응답은 원본 HTML/LLM 응답이 없어 코퍼스에 남지 않으므로 모든 기사를 새로 받고 분석
+            use_scrape_cache = use_analysis_cache = False
+
+        self.extraction_pool = ExtractionPool(parse_processes) if parse_processes > 0 else None
+        self.scrape_cache = ScrapeCache() if use_scrape_cache else None
+        self.scraper = WebScraper(
+            extraction_pool=self.extraction_pool,
+            cache=self.scrape_cache,
+            recorder=recorder
+        )
+        self.analysis_cache = AnalysisCache() if use_analysis_cache else None
+        self.analyzer = AIAnalyzer(cache=self.analysis_cache, recorder=recorder)
+
+        relation_updater = IncrementalRelationUpdater() if incremental_relations else None
+        knowledge_service = KnowledgeService() if define_concepts else None
+        self.definer = (
+            ConceptDefiner(knowledge_service, app, relation_updater=relation_updater)
+            if define_concepts else None
+        )
+        self.near_duplicates = (
+            NearDuplicateDetector(app, max_distance=near_duplicate_distance)
+            if near_duplicate_distance >= 0 else None
+        )
+        self.relevance_filter = (
+            RelevanceFilter.from_database(threshold=relevance_threshold)
+            if relevance_threshold > 0 else None
+        )
+        self.work_queue = (
+            WorkQueue(app, worker_id=worker_id, claim_limit=claim_limit)
+            if resume else None
+        )
+
+        self._reactivate_skipped()
+
+        self.metrics = None
+        if record_metrics:
+            self.metrics = RunMetrics(
+                kind=run_kind,
+                worker_id=self.work_queue.worker_id if self.work_queue is not None else None
+            )
+            # 토큰 사용량/재시도는 LLM을 호출한 단계 스레드의 span에 기록
+            self.analyzer.llm.add_observer(record_llm_usage)
+            if knowledge_service is not None:
+                knowledge_service.llm.add_observer(record_llm_usage)
+
+        self.pipeline = ETLPipeline(
+            scraper=self.scraper,
+            analyzer=self.analyzer,
+            loader_factory=lambda: DBLoader(app.app_context(), relation_updater=relation_updater),
+            scrape_concurrency=scrape_concurrency,
+            analyze_concurrency=analyze_concurrency,
+            load_concurrency=load_concurrency,
+            analyze_batch_size=analyze_batch_size,
+            load_batch_size=load_batch_size,
+            definer=self.definer,
+            define_concurrency=define_concurrency,
+            near_duplicates=self.near_duplicates,
+            relevance_filter=self.relevance_filter,
+            work_queue=self.work_queue,
+            metrics=self.metrics
+        )
+
+    def refresh_vocabulary(self):
+        """관련도 필터 용어 사전을 현재 DB의 개념 이름으로 다시 생성 (장시간 실행 시 주기마다 호출)"""
+        if self.relevance_filter is None:
+            return
+        self.relevance_filter = RelevanceFilter.from_database(
+            threshold=self.relevance_filter.threshold,
+            min_terms=self.relevance_filter.min_terms
+        )
+        self.pipeline.relevance_filter = self.relevance_filter
+        self._reactivate_skipped()
+
+    def _reactivate_skipped(self):
+        """용어 사전이 커졌으면 관련도 필터로 건너뛴 작업 항목을 다시 평가 대상으로"""
+        if self.relevance_filter is None or self.work_queue is None:
+            return
+        reactivated = self.work_queue.reactivate_skipped(self.relevance_filter.vocabulary_size)
+        if reactivated:
+            print(
+                f"⟳ Re-evaluating {reactivated} previously filtered articles "
+                f"(vocabulary now {self.relevance_filter.vocabulary_size} terms)"
+            )
+
+    def describe(self) -> str:
+        """워커 구성 요약 (로그 출력용)"""
+        pipeline = self.pipeline
+        return (
+            f"workers: scrape={pipeline.scrape_concurrency}, "
+            f"analyze={pipeline.analyze_concurrency}x{pipeline.analyze_batch_size}, "
+            f"load={pipeline.load_concurrency}x{pipeline.load_batch_size}, "
+            f"define={pipeline.define_concurrency if self.definer is not None else 0}"
+        )
+
+    def close(self):
+        """스크래퍼 세션, 파싱 프로세스, 캐시 연결 정리"""
+        self.scraper.close()
+        if self.extraction_pool is not None:
+            self.extraction_pool.close()
+        if self.scrape_cache is not None:
+            self.scrape_cache.close()
+        if self.analysis_cache is not None:
+            self.analysis_cache.close()
@@ -0,0 +1,278 @@
+"""
+개념 정의 단계
+
+DB 적재 후 아직 Placeholder 설명만 있는 개념을 KnowledgeService로 정의하고,
+정의에 포함된 상위/하위/관련 개념을 Concept_Relation으로 저장합니다.
+
+- 한 번의 실행에서 같은 개념은 한 번만 정의 (여러 기사에 등장해도 LLM 호출 1회)
+- 기사 하나의 개념들은 공유 LLM 클라이언트로 동시에 정의
+- 정의 결과는 모아 두었다가 배치 단위로 개념 ID 일괄 조회/생성, 관계 upsert
+"""
+
+import asyncio
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from flask import Flask
+from sqlalchemy import bindparam, func, update
+
+from app.extensions import db
+from app.models import Concept
+from app.services.knowledge_service import KnowledgeService
+from etl.bulk_ops import chunked, clean_concept_name, resolve_concept_ids
+from etl.db_loader import PLACEHOLDER_DESCRIPTION
+from etl.incremental_relations import IncrementalRelationUpdater
+from etl.relation_writer import RelationWriter
+
+
+class ConceptDefiner:
+    """KnowledgeService 기반 개념 정의 + 관계 적재"""
+
+    # 관계 타입별 기본 강도 (목록의 뒤쪽일수록 1씩 감소)
+    PARENT_STRENGTH = 8
+    CHILD_STRENGTH = 7
+    RELATED_STRENGTH = 6
+    MIN_STRENGTH = 3
+
+    def __init__(
+        self,
+        knowledge_service: KnowledgeService,
+        app: Flask,
+        batch_size: int = 20,
+        relation_updater: Optional[IncrementalRelationUpdater] = None
+    ):
+        """
+        Args:
+            knowledge_service (KnowledgeService): 개념 정의 서비스
+            app (Flask): DB 작업에 사용할 앱 (스레드마다 새 앱 컨텍스트 생성)
+            batch_size (int): 몇 개의 정의가 모이면 DB에 반영할지
+            relation_updater (IncrementalRelationUpdater, optional): 설명이 바뀌거나 새로 생긴 개념의
+                                                                    유사도 관계 증분 갱신기
+        """
+        self.knowledge = knowledge_service
+        self.app = app
+        self.batch_size = max(1, batch_size)
+        self.relation_updater = relation_updater
+
+        self._lock = threading.Lock()
+        self._seen = set()
+        self._buffer: Dict[str, Dict] = {}
+        self.stats = self._empty_stats()
+
+    def reset(self):
+        """새 실행 시작 (중복 제거 집합과 통계 초기화)"""
+        with self._lock:
+            self._seen = set()
+            self._buffer = {}
+            self.stats = self._empty_stats()
+
+    def define_for_article(self, concept_names: Iterable[str], article_summary: str) -> int:
+        """
+        기사에 등장한 개념 중 아직 정의되지 않은 개념 정의
+
+        Args:
+            concept_names (iterable): 기사 분석 결과의 개념 이름들
+            article_summary (str): 정의 문맥으로 사용할 기사 요약
+
+        Returns:
+            int: 이번 호출에서 정의에 성공한 개념 수
+        """
+        names = self._claim(concept_names)
+        if not names:
+            return 0
+
+        with self.app.app_context():
+            names = self._placeholder_names(names)
+        if not names:
+            return 0
+
+        definitions = asyncio.run(self._define_all(names, article_summary))
+
+        with self._lock:
+            self.stats['concepts_defined'] += len(definitions)
+            self.stats['definition_errors'] += len(names) - len(definitions)
+            self._buffer.update(definitions)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+        return len(definitions)
+
+    def flush(self) -> Dict[str, int]:
+        """
+        남은 정의를 DB에 반영
+
+        Returns:
+            dict: 실행 통계
+        """
+        with self._lock:
+            self._flush_locked()
+            return dict(self.stats)
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _claim(self, concept_names: Iterable[str]) -> List[str]:
+        """이번 실행에서 처음 보는 개념 이름만 반환 (스레드 안전)"""
+        claimed = []
+        with self._lock:
+            for name in concept_names or []:
+                name = clean_concept_name(name)
+                key = name.lower()
+                if name and key not in self._seen:
+                    self._seen.add(key)
+                    claimed.append(name)
+        return claimed
+
+    @staticmethod
+    def _placeholder_names(names: List[str]) -> List[str]:
+        """아직 Placeholder 설명만 있는 개념 이름만 반환 (IN 쿼리)"""
+        pending = set()
+        for chunk in chunked(sorted({name.lower() for name in names})):
+            rows = db.session.query(Concept.name).filter(
+                func.lower(Concept.name).in_(chunk),
+                Concept.description_ko == PLACEHOLDER_DESCRIPTION
+            ).all()
+            pending.update(name.lower() for (name,) in rows)
+
+        return [name for name in names if name.lower() in pending]
+
+    async def _define_all(self, names: List[str], article_summary: str) -> Dict[str, Dict]:
+        """개념들을 동시에 정의 (실패한 개념은 결과에서 제외)"""
+        results = await asyncio.gather(
+            *(self.knowledge.adefine_concept(name, article_summary) for name in names),
+            return_exceptions=True
+        )
+
+        definitions = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                print(f"  ✗ Failed to define concept '{name}': {result}")
+                continue
+            print(f"  ✓ Defined concept: {name}")
+            definitions[name] = result
+        return definitions
+
+    def _flush_locked(self):
+        """모인 정의를 DB에 반영 (lock 보유 상태에서 호출)"""
+        definitions, self._buffer = self._buffer, {}
+        if not definitions:
+            return
+
+        with self.app.app_context():
+            try:
+                names = set(definitions)
+                for definition in definitions.values():
+                    for key in ('parent_concepts', 'child_concepts', 'related_concepts'):
+                        names.update(definition.get(key, []))
+
+                concept_ids, created_ids = resolve_concept_ids(names, PLACEHOLDER_DESCRIPTION)
+
+                self._update_descriptions(definitions, concept_ids)
+
+                writer = RelationWriter()
+                for name, definition in definitions.items():
+                    concept_id = concept_ids.get(name.lower())
+                    if concept_id is not None:
+                        self._add_relations(writer, concept_id, definition, concept_ids)
+
+                result = writer.flush()
+                cleared = writer.invalidate_graph_caches(result['concept_ids'])
+                db.session.commit()
+
+                self.stats['relations_inserted'] += result['inserted']
+                self.stats['relations_updated'] += result['updated']
+                self.stats['graph_caches_cleared'] += cleared
+                print(
+                    f"  ✓ Saved {len(definitions)} concept definitions "
+                    f"({result['inserted']} new relations, {result['updated']} strengthened)"
+                )
+
+            except Exception as e:
+                db.session.rollback()
+                print(f"  ✗✗ Database error while saving concept definitions: {e}")
+                self.stats['definition_errors'] += len(definitions)
+                self.stats['concepts_defined'] -= len(definitions)
+                return
+
+            if self.relation_updater is not None:
+                changed_ids = created_ids | {
+                    concept_ids[name.lower()] for name in definitions if name.lower() in concept_ids
+                }
+                self._update_similarity(changed_ids)
+
+    def _update_similarity(self, concept_ids: Set[int]):
+        """정의된/새로 생긴 개념의 유사도 관계 증분 갱신 (실패해도 정의는 유지)"""
+        try:
+            result = self.relation_updater.update_concepts(concept_ids)
+            db.session.commit()
+            self.stats['relations_inserted'] += result['inserted']
+            self.stats['relations_updated'] += result['updated']
+            self.stats['graph_caches_cleared'] += result['graph_caches_cleared']
+        except Exception as e:
+            db.session.rollback()
+            print(f"  ✗ Failed to update similarity relations: {e}")
+
+    @staticmethod
+    def _update_descriptions(definitions: Dict[str, Dict], concept_ids: Dict[str, int]):
+        """Placeholder 설명을 정의된 설명으로 일괄 교체 (executemany)"""
+        rows = [
+            {'b_concept_id': concept_ids[name.lower()], 'b_description': definition['description_ko']}
+            for name, definition in definitions.items()
+            if name.lower() in concept_ids
+        ]
+        if not rows:
+            return
+
+        db.session.connection().execute(
+            update(Concept)
+            .where(Concept.concept_id == bindparam('b_concept_id'))
+            .where(Concept.description_ko == PLACEHOLDER_DESCRIPTION)
+            .values(description_ko=bindparam('b_description')),
+            rows
+        )
+
+    def _add_relations(
+        self,
+        writer: RelationWriter,
+        concept_id: int,
+        definition: Dict,
+        concept_ids: Dict[str, int]
+    ):
+        """
+        정의 하나의 관계 추가
+
+        - 상위 개념: (개념) -is_type_of→ (상위 개념)
+        - 하위 개념: (하위 개념) -is_type_of→ (개념)
+        - 관련 개념: (개념) -related_to→ (관련 개념)
+        """
+        for position, other_id in self._ranked_ids(definition.get('parent_concepts'), concept_ids):
+            writer.add(concept_id, other_id, 'is_type_of', self._strength(self.PARENT_STRENGTH, position))
+
+        for position, other_id in self._ranked_ids(definition.get('child_concepts'), concept_ids):
+            writer.add(other_id, concept_id, 'is_type_of', self._strength(self.CHILD_STRENGTH, position))
+
+        for position, other_id in self._ranked_ids(definition.get('related_concepts'), concept_ids):
+            writer.add(concept_id, other_id, 'related_to', self._strength(self.RELATED_STRENGTH, position))
+
+    @staticmethod
+    def _ranked_ids(names: Optional[List[str]], concept_ids: Dict[str, int]):
+        position = 0
+        for name in names or []:
+            concept_id = concept_ids.get(clean_concept_name(name).lower())
+            if concept_id is not None:
+                yield position, concept_id
+                position += 1
+
+    def _strength(self, base: int, position: int) -> int:
+        return max(self.MIN_STRENGTH, base - position)
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            'concepts_defined': 0,
+            'definition_errors': 0,
+            'relations_inserted': 0,
+            'relations_updated': 0,
+            'graph_caches_cleared': 0
+        }
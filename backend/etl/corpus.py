@@ -0,0 +1,270 @@
+"""
+ETL 기록/재생 코퍼스
+
+실제 ETL 실행의 외부 입력(GNews 응답, 언론사 원본 HTML, LLM 응답)을 로컬 디렉토리에 기록해 두고,
+네트워크 없이 같은 입력으로 추출/파싱/적재 코드를 다시 실행(python -m etl.replay)할 수 있게 합니다.
+
+코퍼스 하나는 ETL_CORPUS_DIR(기본 '.etl_corpus') 아래의 디렉토리이며 기록이 끝나면 바꾸지 않습니다.
+
+    <name>/
+        manifest.json    형식 버전, 기록 시각, 코드 버전(git), 모델/프롬프트 버전, 항목 수
+        gnews.jsonl      GNews 응답 (요청 파라미터, 응답 JSON; API 키 제외)
+        pages.jsonl      페이지 목록 (URL, HTML 파일, 바이트 수, 기록 당시 추출 본문의 sha256)
+        pages/*.html.gz  원본 HTML (URL sha256 이름)
+        llm.jsonl        LLM 응답 (종류, 모델, 프롬프트 버전, 입력 본문 sha256 목록, 응답 텍스트, 토큰 사용량)
+        replays.jsonl    재생 결과 기록 (python -m etl.replay --save)
+
+본문 sha256으로 페이지와 LLM 응답을 연결하므로, 재생 시 기사 URL ↔ 분석 결과를 다시 맞출 수 있습니다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+
+# 코퍼스 디렉토리 형식 버전 (호환되지 않게 바꾸면 올림)
+CORPUS_FORMAT_VERSION = 1
+
+
+def default_corpus_root() -> str:
+    return os.getenv('ETL_CORPUS_DIR', '.etl_corpus')
+
+
+def text_digest(text: str) -> str:
+    """본문 sha256 hex (페이지와 LLM 응답 연결용)"""
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+
+def code_version() -> Optional[str]:
+    """현재 코드의 git 커밋 (git 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    version = result.stdout.strip()
+    if not version:
+        return None
+
+    try:
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        dirty = ''
+    return f"{version}-dirty" if dirty else version
+
+
+class CorpusRecorder:
+    """ETL 외부 입력 기록기 (스레드 안전, close()에서 manifest 작성)"""
+
+    def __init__(self, name: Optional[str] = None, root: Optional[str] = None):
+        """
+        Args:
+            name (str, optional): 코퍼스 이름. None이면 기록 시작 시각(UTC, 예: 20240101-120000)
+            root (str, optional): 코퍼스 상위 디렉토리. None이면 ETL_CORPUS_DIR 또는 '.etl_corpus'
+
+        Raises:
+            FileExistsError: 같은 이름의 코퍼스가 이미 있을 때 (기록된 코퍼스는 바꾸지 않음)
+        """
+        self.created_at = datetime.utcnow()
+        self.name = name or self.created_at.strftime('%Y%m%d-%H%M%S')
+        self.path = os.path.join(root or default_corpus_root(), self.name)
+        self.page_dir = os.path.join(self.path, 'pages')
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        os.makedirs(self.path)
+        os.makedirs(self.page_dir)
+
+        self.counts = {'gnews': 0, 'pages': 0, 'llm': 0}
+        self.models = set()
+        self.prompt_versions = set()
+        self._page_urls = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def record_gnews(self, params: Dict, data: Dict):
+        """GNews API 응답 기록 (params에 API 키를 넣지 말 것)"""
+        self._append('gnews.jsonl', 'gnews', {'params': params, 'response': data})
+
+    def record_page(self, url: str, raw_html: bytes, text: str):
+        """
+        원본 HTML 기록 (같은 URL은 처음 한 번만)
+
+        Args:
+            url (str): 기사 URL
+            raw_html (bytes): 내려받은 원본 HTML
+            text (str): 기록 당시 스크래퍼가 추출한 본문
+        """
+        file_name = f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.html.gz"
+        with self._lock:
+            if url in self._page_urls:
+                return
+            self._page_urls.add(url)
+
+        with gzip.open(os.path.join(self.page_dir, file_name), 'wb') as f:
+            f.write(raw_html)
+
+        self._append('pages.jsonl', 'pages', {
+            'url': url,
+            'file': f"pages/{file_name}",
+            'bytes': len(raw_html),
+            'text_sha256': text_digest(text),
+            'text_chars': len(text or '')
+        })
+
+    def record_llm(
+        self,
+        kind: str,
+        model: str,
+        prompt_version: str,
+        article_texts: List[str],
+        content: str,
+        usage=None
+    ):
+        """
+        LLM 응답 기록
+
+        Args:
+            kind (str): 'analysis' (단건) 또는 'batch' (배치, 응답은 JSON 배열)
+            model (str): 모델 이름
+            prompt_version (str): 요청에 사용한 프롬프트 버전 (AIAnalyzer.PROMPT_VERSION 또는 BATCH_PROMPT_VERSION)
+            article_texts (list): 요청에 넣은 기사 본문 (순서대로)
+            content (str): 응답 텍스트
+            usage: 응답의 토큰 사용량 (prompt_tokens/completion_tokens 속성)
+        """
+        with self._lock:
+            self.models.add(model)
+            self.prompt_versions.add(prompt_version)
+
+        self._append('llm.jsonl', 'llm', {
+            'kind': kind,
+            'model': model,
+            'prompt_version': prompt_version,
+            'text_sha256': [text_digest(text) for text in article_texts],
+            'content': content,
+            'usage': {
+                'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+                'completion_tokens': getattr(usage, 'completion_tokens', None)
+            }
+        })
+
+    def close(self) -> str:
+        """
+        manifest.json 작성 (여러 번 호출해도 한 번만 작성)
+
+        Returns:
+            str: 코퍼스 디렉토리
+        """
+        with self._lock:
+            if self._closed:
+                return self.path
+            self._closed = True
+            manifest = {
+                'format_version': CORPUS_FORMAT_VERSION,
+                'name': self.name,
+                'created_at': self.created_at.isoformat(),
+                'closed_at': datetime.utcnow().isoformat(),
+                'code_version': code_version(),
+                'models': sorted(self.models),
+                'prompt_versions': sorted(self.prompt_versions),
+                'counts': dict(self.counts)
+            }
+
+        with open(os.path.join(self.path, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        print(
+            f"✓ Recorded corpus '{self.name}': {manifest['counts']['gnews']} GNews responses, "
+            f"{manifest['counts']['pages']} pages, {manifest['counts']['llm']} LLM responses ({self.path})"
+        )
+        return self.path
+
+    def _append(self, file_name: str, counter: str, record: Dict):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(os.path.join(self.path, file_name), 'a', encoding='utf-8') as f:
+                f.write(line)
+            self.counts[counter] += 1
+
+
+class Corpus:
+    """기록된 코퍼스 읽기"""
+
+    def __init__(self, name_or_path: str, root: Optional[str] = None):
+        """
+        Args:
+            name_or_path (str): 코퍼스 이름(ETL_CORPUS_DIR 아래) 또는 디렉토리 경로
+            root (str, optional): 코퍼스 상위 디렉토리
+
+        Raises:
+            FileNotFoundError: manifest.json이 없을 때 (기록 중이거나 비정상 종료된 코퍼스)
+            ValueError: 지원하지 않는 형식 버전
+        """
+        path = name_or_path
+        if not os.path.isdir(path):
+            path = os.path.join(root or default_corpus_root(), name_or_path)
+        self.path = path
+
+        with open(os.path.join(path, 'manifest.json'), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+        version = self.manifest.get('format_version')
+        if version != CORPUS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported corpus format version {version} (expected {CORPUS_FORMAT_VERSION})")
+
+        self.name = self.manifest.get('name', os.path.basename(path))
+
+    def gnews_responses(self) -> List[Dict]:
+        """[{'params': dict, 'response': dict}, ...] (기록 순서)"""
+        return self._read_jsonl('gnews.jsonl')
+
+    def pages(self) -> List[Dict]:
+        """[{'url', 'file', 'bytes', 'text_sha256', 'text_chars'}, ...] (기록 순서)"""
+        return self._read_jsonl('pages.jsonl')
+
+    def read_html(self, page: Dict) -> bytes:
+        """페이지 원본 HTML"""
+        with gzip.open(os.path.join(self.path, page['file']), 'rb') as f:
+            return f.read()
+
+    def llm_responses(self) -> List[Dict]:
+        """[{'kind', 'model', 'prompt_version', 'text_sha256', 'content', 'usage'}, ...]"""
+        return self._read_jsonl('llm.jsonl')
+
+    def save_replay(self, result: Dict):
+        """재생 결과를 replays.jsonl에 추가 (코드 버전 간 비교용)"""
+        with open(os.path.join(self.path, 'replays.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+    def replays(self) -> List[Dict]:
+        return self._read_jsonl('replays.jsonl')
+
+    def _read_jsonl(self, file_name: str) -> List[Dict]:
+        records = []
+        try:
+            with open(os.path.join(self.path, file_name), encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        records.append(json.loads(line))
+        except FileNotFoundError:
+            return []
+        return records
+
+    def iter_pages_with_html(self) -> Iterator[Dict]:
+        """페이지 정보에 'raw_html'을 채워서 반환"""
+        for page in self.pages():
+            yield dict(page, raw_html=self.read_html(page))
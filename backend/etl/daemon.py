@@ -0,0 +1,337 @@
+"""
+ETL 데몬 (주기적 증분 수집)
+
+프로세스와 앱 컨텍스트, HTTP 세션, LLM 클라이언트, 캐시 연결을 한 번만 만들고
+일정 간격으로 GNews를 조회해 새 기사만 파이프라인에 넣습니다.
+
+- 워터마크: 피드마다 "이 시각까지는 빠짐없이 본" publishedAt. 다음 조회는 그 시각 이후 기사만 요청하고,
+  응답에서도 워터마크보다 오래된 기사는 제외 (같은 시각의 기사는 URL 중복 제거가 처리)
+- GNews는 기간 안의 최신 max개만 돌려주므로, 응답이 꽉 차면 워터마크를 옮기지 않고
+  가장 오래된 기사 시각을 'to'로 넘겨 워터마크까지 거슬러 올라감 (주기당 max_pages번, 할당량 안에서).
+  남은 구간은 다음 주기에 이어서 조회하고, 구간을 다 채운 뒤에만 워터마크를 그동안 본 가장 최근 시각으로 이동
+- API 할당량: UTC 하루 요청 수가 daily_quota에 도달하면 다음 날까지 조회하지 않음
+  (이전 실행에서 남은 작업 항목은 계속 처리)
+- 워터마크와 할당량 사용량은 ETL_CACHE_DIR/daemon_state.json에 저장되어 재시작 후에도 유지
+- RSS/Atom 피드(rss_fetcher)는 할당량과 워터마크와 무관하게 매 주기 조회 (바뀌지 않은 피드는 304)
+
+사용법:
+    python -m etl.run --daemon --interval 900 --daily-quota 100
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from etl.components import ETLComponents
+from etl.gnews_fetcher import GNewsFetcher
+from etl.rss_fetcher import RSSFetcher
+from etl.url_deduper import UrlDeduplicator
+
+
+def feed_key(feed: Dict[str, str]) -> str:
+    """피드별 워터마크 키 (예: 'category=technology&country=us')"""
+    return '&'.join(f"{key}={feed[key]}" for key in sorted(feed) if key not in ('from', 'to'))
+
+
+# feeds를 지정하지 않았을 때 조회하는 피드 (GNewsFetcher.fetch_articles 기본값)
+DEFAULT_FEED = {'category': 'technology', 'lang': 'en', 'country': 'us'}
+
+
+class DaemonState:
+    """피드별 워터마크와 API 할당량 사용량 (JSON 파일에 저장)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path (str, optional): 상태 파일 경로. None이면 ETL_CACHE_DIR(기본 '.etl_cache')/daemon_state.json
+        """
+        if path is None:
+            cache_dir = os.getenv('ETL_CACHE_DIR', '.etl_cache')
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, 'daemon_state.json')
+        self.path = path
+
+        # {피드 키: {'watermark': 빠짐없이 본 시각, 'before': 아직 못 본 구간의 끝, 'newest': 구간을 채우는 동안 본 가장 최근 시각}}
+        self.feeds: Dict[str, Dict[str, Optional[str]]] = {}
+        self.legacy_watermark: Optional[str] = None
+        self.quota_day: Optional[str] = None
+        self.requests_today = 0
+        self._load()
+
+    def requests_remaining(self, daily_quota: int) -> int:
+        """오늘(UTC) 남은 API 요청 수"""
+        self._roll_day()
+        return max(0, daily_quota - self.requests_today)
+
+    def record_request(self, count: int = 1):
+        self._roll_day()
+        self.requests_today += count
+        self.save()
+
+    def window(self, key: str) -> Dict[str, Optional[str]]:
+        """
+        피드의 다음 조회 기간
+
+        Returns:
+            dict: {'from': 워터마크, 'to': 아직 못 본 구간의 끝 (구간이 없으면 None)}
+        """
+        cursor = self._cursor(key)
+        return {'from': cursor['watermark'], 'to': cursor['before']}
+
+    def watermark(self, key: str) -> Optional[str]:
+        return self._cursor(key)['watermark']
+
+    def advance(self, key: str, articles: List[Dict], full: bool) -> bool:
+        """
+        조회 결과로 피드 커서 이동
+
+        Args:
+            key (str): feed_key()
+            articles (list): 이번 기간의 조회 결과
+            full (bool): 응답이 요청한 max개로 꽉 찼는지 (더 오래된 미조회 기사가 남았을 수 있음)
+
+        Returns:
+            bool: 같은 피드를 더 거슬러 올라가 조회해야 하면 True
+        """
+        cursor = self._cursor(key)
+        published = [article['published_at'] for article in articles if article.get('published_at')]
+
+        if full and published and (cursor['before'] is None or min(published) < cursor['before']):
+            cursor['newest'] = max([cursor['newest'] or '', *published])
+            cursor['before'] = min(published)
+            return True
+
+        # 구간을 다 채움 (또는 더 거슬러 올라갈 수 없음): 그동안 본 가장 최근 시각으로 워터마크 이동
+        candidates = [value for value in (cursor['watermark'], cursor['newest'], *published) if value]
+        cursor['watermark'] = max(candidates) if candidates else None
+        cursor['before'] = None
+        cursor['newest'] = None
+        return False
+
+    def save(self):
+        state = {
+            'feeds': self.feeds,
+            'quota_day': self.quota_day,
+            'requests_today': self.requests_today
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.path)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.feeds = state.get('feeds') or {}
+        # 이전 형식의 전체 워터마크는 아직 커서가 없는 피드의 시작점으로 사용
+        self.legacy_watermark = state.get('watermark')
+        self.quota_day = state.get('quota_day')
+        self.requests_today = int(state.get('requests_today') or 0)
+
+    def _cursor(self, key: str) -> Dict[str, Optional[str]]:
+        return self.feeds.setdefault(key, {'watermark': self.legacy_watermark, 'before': None, 'newest': None})
+
+    def _roll_day(self):
+        today = datetime.utcnow().strftime('%Y-%m-%d')
+        if self.quota_day != today:
+            self.quota_day = today
+            self.requests_today = 0
+
+
+class ETLDaemon:
+    """주기적 ETL 실행기 (활성화된 앱 컨텍스트 안에서 실행)"""
+
+    def __init__(
+        self,
+        components: ETLComponents,
+        fetcher: GNewsFetcher,
+        interval: float = 900.0,
+        max_articles: int = 10,
+        daily_quota: int = 100,
+        max_pages: int = 5,
+        state: Optional[DaemonState] = None,
+        feeds: Optional[List[Dict[str, str]]] = None,
+        rss_fetcher: Optional[RSSFetcher] = None
+    ):
+        """
+        Args:
+            components (ETLComponents): 주기마다 재사용할 파이프라인과 자원
+            fetcher (GNewsFetcher): 기사 수집기 (HTTP 세션 재사용)
+            interval (float): 주기 시작 간격 (초)
+            max_articles (int): 한 번의 GNews 요청으로 가져올 최대 기사 수
+            daily_quota (int): UTC 하루 최대 GNews 요청 수
+            max_pages (int): 응답이 꽉 찬 피드를 한 주기에 거슬러 올라가며 조회할 최대 요청 수
+            state (DaemonState, optional): 워터마크/할당량 상태. None이면 기본 경로의 상태 파일 사용
+            feeds (list, optional): 주기마다 동시에 조회할 피드 (GNewsFetcher.fetch_many 형식).
+                                    None이면 기본 top-headlines 요청 하나. 피드 하나가 요청 하나로 할당량 차감
+            rss_fetcher (RSSFetcher, optional): 주기마다 함께 조회할 RSS/Atom 수집기
+        """
+        self.components = components
+        self.fetcher = fetcher
+        self.interval = max(1.0, interval)
+        self.max_articles = max_articles
+        self.daily_quota = daily_quota
+        self.max_pages = max(1, max_pages)
+        self.state = state or DaemonState()
+        self.feeds = list(feeds) if feeds else [DEFAULT_FEED]
+        self.rss_fetcher = rss_fetcher
+
+        self.deduper = UrlDeduplicator()
+        self._stop = threading.Event()
+
+    def stop(self):
+        """현재 주기가 끝나면 종료"""
+        self._stop.set()
+
+    def run_forever(self, max_cycles: Optional[int] = None) -> Dict[str, int]:
+        """
+        종료 신호(SIGINT/SIGTERM)나 max_cycles까지 주기 반복
+
+        Returns:
+            dict: 누적 통계
+        """
+        self._install_signal_handlers()
+        totals: Dict[str, int] = {}
+        cycles = 0
+
+        print(
+            f"✓ ETL daemon started (interval {self.interval:.0f}s, "
+            f"{self.max_articles} articles/request, quota {self.daily_quota}/day, "
+            f"{len(self.feeds)} feeds, up to {self.max_pages} pages/feed)"
+        )
+
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                summary = self.run_cycle()
+            except Exception as e:
+                print(f"✗✗ ETL cycle failed: {e}")
+                summary = {'errors': 1}
+
+            for key, value in summary.items():
+                if isinstance(value, int):
+                    totals[key] = totals.get(key, 0) + value
+
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+        print(f"✓ ETL daemon stopped after {cycles} cycles: {totals}")
+        return totals
+
+    def run_cycle(self) -> Dict[str, int]:
+        """
+        한 주기: 새 기사 조회 (할당량이 남아 있으면) → 파이프라인 실행
+
+        Returns:
+            dict: 파이프라인 통계 + 'fetched', 'duplicates'
+        """
+        cycle_started = datetime.utcnow().strftime('%H:%M:%S')
+        articles = self._fetch_new() + self._fetch_rss()
+        new_articles = self.deduper.filter_new(articles)
+
+        self.components.refresh_vocabulary()
+        summary = self.components.pipeline.run(new_articles)
+        summary['fetched'] = len(articles)
+        summary['skipped'] += self.deduper.stats['existing']
+        summary['duplicates'] = self.deduper.stats['duplicates']
+        self.deduper.stats = {'duplicates': 0, 'existing': 0}
+
+        print(
+            f"[{cycle_started}] ✓ Cycle: {summary['fetched']} fetched, {len(new_articles)} new, "
+            f"{summary['processed']} processed, {summary['errors']} errors "
+            f"(quota left {self.state.requests_remaining(self.daily_quota)})"
+        )
+        return summary
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _fetch_new(self) -> List[Dict]:
+        """
+        피드별 워터마크 이후 기사 조회 (할당량이 없거나 요청이 모두 실패하면 빈 리스트)
+
+        응답이 max_articles개로 꽉 찬 피드는 가장 오래된 기사 이전 구간을 다시 요청해
+        워터마크까지 거슬러 올라갑니다 (주기당 max_pages번, 할당량 안에서).
+        """
+        if self.state.requests_remaining(self.daily_quota) <= 0:
+            print("⊘ Daily GNews quota used up, processing pending work items only.")
+            return []
+
+        results = []
+        pending = list(self.feeds)
+        pages = 0
+        while pending and pages < self.max_pages:
+            remaining = self.state.requests_remaining(self.daily_quota)
+            if remaining <= 0:
+                break
+            batch = pending[:remaining]
+            pending = pending[remaining:]
+            pages += 1
+
+            queries = []
+            for feed in batch:
+                window = self.state.window(feed_key(feed))
+                queries.append(dict(feed, **{key: value for key, value in window.items() if value}))
+            self.state.record_request(len(queries))
+
+            for feed, (_, articles, error) in zip(
+                batch, self.fetcher.fetch_feeds(queries, max_results=self.max_articles)
+            ):
+                if error is not None:
+                    print(f"  ✗ Feed {feed_key(feed)} failed: {error}")
+                    continue
+
+                watermark = self.state.watermark(feed_key(feed))
+                if watermark:
+                    articles = [
+                        article for article in articles
+                        if not article.get('published_at') or article['published_at'] >= watermark
+                    ]
+                results.append(articles)
+                if self.state.advance(feed_key(feed), articles, full=len(articles) >= self.max_articles):
+                    pending.append(feed)
+
+        self.state.save()
+
+        if pending:
+            print(
+                f"  ⟳ {len(pending)} feeds have older unseen articles, "
+                f"continuing from there next cycle"
+            )
+
+        articles = self.fetcher.merge(results)
+        print(f"✓ Fetched {len(articles)} new articles from {len(self.feeds)} GNews feeds ({pages} rounds)")
+        return articles
+
+    def _fetch_rss(self) -> List[Dict]:
+        """RSS/Atom 피드 조회 (수집기가 없거나 실패하면 빈 리스트)"""
+        if self.rss_fetcher is None:
+            return []
+        try:
+            return self.rss_fetcher.fetch_articles()
+        except Exception as e:
+            print(f"✗ Failed to fetch RSS/Atom feeds: {e}")
+            return []
+
+    def _install_signal_handlers(self):
+        """SIGTERM/SIGINT로 현재 주기 후 종료 (메인 스레드에서만 설치 가능)"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        def handle(signum, frame):
+            print(f"\n⊘ Received signal {signum}, stopping after the current cycle...")
+            self.stop()
+
+        signal.signal(signal.SIGTERM, handle)
+        signal.signal(signal.SIGINT, handle)
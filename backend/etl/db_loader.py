@@ -4,10 +4,17 @@
 Discovery 단계에서 추출한 개념을 기사와 연결합니다.
 """
 
-from typing import Dict, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
-from app.models import Article, Concept, Article_Concept
+from app.models import Article, Concept, Article_Concept, Article_Simhash_Band
+from app.utils.url_utils import url_hash
+from etl.bulk_ops import chunked, clean_concept_name, insert_ignore, resolve_concept_ids
+from etl.fingerprint import band_rows
 
 
 PLACEHOLDER_DESCRIPTION = "(Placeholder) 기사에서 이 개념이 어떻게 사용되는지 확인하세요."
@@ -16,15 +23,31 @@ PLACEHOLDER_DESCRIPTION = "(Placeholder) 기사에서 이 개념이 어떻게 
 class DBLoader:
     """간소화된 데이터베이스 적재 클래스"""
 
-    def __init__(self, app_context):
+    def __init__(self, app_context, relation_updater=None):
+        """
+        Args:
+            app_context: 적재에 사용할 Flask 앱 컨텍스트
+            relation_updater (IncrementalRelationUpdater, optional): 새로 생성된 개념의
+                                                                    유사도 관계 증분 갱신기
+        """
         self.app_context = app_context
+        self.relation_updater = relation_updater
+        self._created_concept_ids = []
 
     def load_article_data(self, article_data: Dict, analysis: Dict) -> Optional[Article]:
-        """기사와 개념을 저장하고 연결합니다."""
+        """
+        기사와 개념을 저장하고 연결합니다.
+
+        Returns:
+            Article: 새로 저장된 기사 (이미 있던 기사는 None)
+
+        Raises:
+            Exception: DB 오류 (롤백 후 다시 발생, 이미 있는 기사와 구분)
+        """
         with self.app_context:
             try:
                 url = article_data['url']
-                existing_article = Article.query.filter_by(original_url=url).first()
+                existing_article = Article.query.filter_by(url_hash=url_hash(url)).first()
                 if existing_article:
                     print(f"  ⊘ Article already exists (ID: {existing_article.article_id})")
                     return None
@@ -33,13 +56,20 @@ class DBLoader:
                     title=article_data['title'],
                     title_ko=analysis.get('title_ko', ''),
                     original_url=url,
-                    summary_ko=analysis.get('summary_ko', '')
+                    url_hash=url_hash(url),
+                    summary_ko=analysis.get('summary_ko', ''),
+                    content_simhash=article_data.get('content_simhash')
                 )
                 db.session.add(new_article)
                 db.session.flush()
+                insert_ignore(
+                    Article_Simhash_Band,
+                    band_rows(new_article.article_id, new_article.content_simhash)
+                )
 
                 print(f"  ✓ Created Article (ID: {new_article.article_id})")
 
+                self._created_concept_ids = []
                 concept_names = analysis.get('concept_names', [])
                 if not concept_names:
                     print("  ! No concepts detected by AI.")
@@ -55,6 +85,8 @@ class DBLoader:
                 db.session.commit()
                 print(f"  ✓ Linked {linked_count} concepts to article")
                 print(f"  ✓✓ Successfully saved article to database!")
+
+                self._update_relations(self._created_concept_ids)
                 return new_article
 
             except Exception as e:
@@ -62,10 +94,146 @@ class DBLoader:
                 print(f"  ✗✗ Database error: {e}")
                 import traceback
                 traceback.print_exc()
-                return None
+                raise
+
+    def load_batch(self, items: List[Tuple[Dict, Dict]]) -> List[Optional[int]]:
+        """
+        여러 기사를 한 번에 저장 (집합 단위 쿼리, 배치당 커밋 1회)
+
+        - 기존 기사: URL 해시 IN 쿼리 1회
+        - 기사: executemany INSERT (URL 해시 유니크 키 충돌 시 무시)
+        - 개념 이름: IN 쿼리 1회 + 없는 개념 executemany INSERT
+        - 기사-개념 연결: executemany INSERT (중복 연결 무시)
+        - 본문 SimHash 밴드: executemany INSERT (article_data['content_simhash']가 있는 기사만)
+
+        여러 적재 워커가 같은 개념/기사를 동시에 만들어도 유니크 키 기준으로 한 행만 남습니다.
+
+        Args:
+            items (list): [(article_data, analysis), ...]
+
+        Returns:
+            list: 항목별 새로 저장된 article_id (이미 있던 기사는 None)
+
+        Raises:
+            Exception: DB 오류 (배치 전체 롤백 후 다시 발생)
+        """
+        with self.app_context:
+            try:
+                results, created_concept_ids = self._load_batch(items)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+            loaded = sum(1 for article_id in results if article_id is not None)
+            print(f"  ✓✓ Saved {loaded}/{len(items)} articles in one batch")
+
+            self._update_relations(created_concept_ids)
+            return results
+
+    def _load_batch(self, items: List[Tuple[Dict, Dict]]):
+        hashes = [url_hash(article_data['url']) for article_data, _ in items]
+        existing_hashes = set()
+        for chunk in chunked(sorted(set(hashes))):
+            existing_hashes.update(
+                value for (value,) in db.session.query(Article.url_hash).filter(Article.url_hash.in_(chunk))
+            )
+
+        # 배치 안에서 같은 URL(정규화 기준)이 여러 번 나오면 첫 항목만 저장
+        new_items = {}
+        for index, value in enumerate(hashes):
+            if value not in existing_hashes and value not in new_items:
+                new_items[value] = index
+
+        now = datetime.utcnow()
+        inserted_hashes = self._insert_articles([
+            {
+                'title': items[index][0]['title'],
+                'title_ko': items[index][1].get('title_ko', ''),
+                'original_url': items[index][0]['url'],
+                'url_hash': value,
+                'summary_ko': items[index][1].get('summary_ko', ''),
+                'content_simhash': items[index][0].get('content_simhash'),
+                'created_at': now
+            }
+            for value, index in new_items.items()
+        ])
+        new_items = {value: index for value, index in new_items.items() if value in inserted_hashes}
+
+        article_ids = {}
+        for chunk in chunked(list(new_items)):
+            article_ids.update(
+                (value, article_id) for article_id, value in db.session.query(
+                    Article.article_id, Article.url_hash
+                ).filter(Article.url_hash.in_(chunk))
+            )
+
+        concept_ids, created_concept_ids = resolve_concept_ids(
+            (
+                name
+                for index in new_items.values()
+                for name in items[index][1].get('concept_names', [])
+            ),
+            PLACEHOLDER_DESCRIPTION
+        )
+
+        links = {
+            (article_ids[value], concept_ids[name.strip().lower()])
+            for value, index in new_items.items()
+            if value in article_ids
+            for name in items[index][1].get('concept_names', [])
+            if isinstance(name, str) and name.strip().lower() in concept_ids
+        }
+        insert_ignore(Article_Concept, [
+            {'article_id': article_id, 'concept_id': concept_id}
+            for article_id, concept_id in sorted(links)
+        ])
+
+        insert_ignore(Article_Simhash_Band, [
+            row
+            for value, index in new_items.items()
+            if value in article_ids
+            for row in band_rows(article_ids[value], items[index][0].get('content_simhash'))
+        ])
+
+        results = [None] * len(items)
+        for value, index in new_items.items():
+            results[index] = article_ids.get(value)
+        return results, created_concept_ids
+
+    @staticmethod
+    def _insert_articles(rows: List[Dict]) -> Set[bytes]:
+        """
+        기사 일괄 INSERT
+
+        보통은 executemany 한 번으로 끝나고, 다른 워커가 같은 URL을 먼저 저장해
+        유니크 키가 충돌하면 행 단위로 다시 시도해 이 워커가 저장한 기사만 돌려줍니다.
+
+        Returns:
+            set: 이번에 실제로 저장된 기사의 url_hash
+        """
+        if not rows:
+            return set()
+
+        try:
+            with db.session.begin_nested():
+                db.session.connection().execute(insert(Article.__table__), rows)
+            return {row['url_hash'] for row in rows}
+        except IntegrityError:
+            return {
+                row['url_hash']
+                for row in rows
+                if insert_ignore(Article, [row]).rowcount
+            }
 
     def _get_or_create_concept(self, concept_name: str) -> Optional[Concept]:
-        cleaned_name = (concept_name or '').strip()
+        """
+        개념 조회/생성 (다른 워커가 같은 개념을 동시에 만들어도 유니크 키 기준으로 한 행만 생김)
+
+        이름은 load_batch()와 같이 clean_concept_name()으로 정리합니다
+        (컬럼보다 긴 이름은 MySQL INSERT IGNORE가 잘라서 저장하므로 조회되지 않음 → 건너뜀).
+        """
+        cleaned_name = clean_concept_name(concept_name)
         if not cleaned_name:
             return None
 
@@ -73,27 +241,37 @@ class DBLoader:
         if concept:
             return concept
 
-        concept = Concept(
-            name=cleaned_name,
-            description_ko=PLACEHOLDER_DESCRIPTION,
-            real_world_examples_ko=[]
-        )
-        db.session.add(concept)
-        db.session.flush()
-        print(f"  ✓ Created concept: {cleaned_name} (ID: {concept.concept_id})")
+        result = insert_ignore(Concept, [{
+            'name': cleaned_name,
+            'description_ko': PLACEHOLDER_DESCRIPTION,
+            'real_world_examples_ko': []
+        }])
+        concept = Concept.query.filter_by(name=cleaned_name).first()
+        if concept and result.rowcount:
+            self._created_concept_ids.append(concept.concept_id)
+            print(f"  ✓ Created concept: {cleaned_name} (ID: {concept.concept_id})")
         return concept
 
+    def _update_relations(self, concept_ids):
+        """새 개념의 유사도 관계 증분 갱신 (실패해도 저장된 기사는 유지)"""
+        if self.relation_updater is None or not concept_ids:
+            return
+
+        try:
+            result = self.relation_updater.update_concepts(concept_ids)
+            db.session.commit()
+            if result['inserted'] or result['updated']:
+                print(
+                    f"  ✓ Similarity relations: {result['inserted']} new, {result['updated']} updated"
+                )
+        except Exception as e:
+            db.session.rollback()
+            print(f"  ✗ Failed to update similarity relations: {e}")
+
     def _link_concept_to_article(self, article: Article, concept: Concept) -> bool:
-        existing_link = Article_Concept.query.filter_by(
-            article_id=article.article_id,
-            concept_id=concept.concept_id
-        ).first()
-
-        if existing_link:
-            return False
-
-        db.session.add(Article_Concept(
-            article_id=article.article_id,
-            concept_id=concept.concept_id
-        ))
-        return True
+        """기사-개념 연결 (이미 연결되어 있으면 False)"""
+        result = insert_ignore(Article_Concept, [{
+            'article_id': article.article_id,
+            'concept_id': concept.concept_id
+        }])
+        return bool(result.rowcount)
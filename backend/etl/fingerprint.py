@@ -0,0 +1,222 @@
+"""
+기사 본문 지문 (SimHash) 및 유사 기사 탐지
+
+통신사 기사는 같은 내용이 여러 URL로 배포되므로, URL 중복 제거만으로는
+같은 기사를 여러 번 AI 분석하게 됩니다. 스크래핑한 본문의 64비트 SimHash를
+기사마다 저장해 두고, 해밍 거리가 가까운 기사가 있으면 그 분석 결과를 재사용합니다.
+
+- SimHash: 소문자 단어 3-gram(shingle)을 64비트 해시해 비트별 가중 합의 부호로 결정
+- 밴드 색인: 64비트를 16비트씩 4개 밴드로 나눠 Article_Simhash_Band에 저장
+  (해밍 거리 3 이하이면 적어도 한 밴드가 같으므로 밴드 일치 조회로 후보를 모두 찾음)
+- DB 컬럼은 BIGINT(부호 있음)이므로 저장 시 부호 있는 정수로 변환
+"""
+
+import hashlib
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy import and_, or_
+
+from app.extensions import db
+from app.models import Article, Article_Concept, Article_Simhash_Band, Concept
+
+
+SIMHASH_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = SIMHASH_BITS // BAND_COUNT
+
+# 지문을 만들 최소 단어 수 (너무 짧은 본문은 서로 쉽게 겹침)
+MIN_WORDS = 20
+SHINGLE_SIZE = 3
+
+_MASK = (1 << SIMHASH_BITS) - 1
+_BAND_MASK = (1 << BAND_BITS) - 1
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    본문의 64비트 SimHash (부호 있는 정수)
+
+    Args:
+        text (str): 기사 본문
+
+    Returns:
+        int: Article.content_simhash에 저장할 값. 단어가 MIN_WORDS개 미만이면 None
+    """
+    words = _WORD_PATTERN.findall((text or '').lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    shingles = Counter(
+        ' '.join(words[start:start + SHINGLE_SIZE])
+        for start in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+    weights = [0] * SIMHASH_BITS
+    for shingle, count in shingles.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    fingerprint = sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+    return to_signed(fingerprint)
+
+
+def to_signed(fingerprint: int) -> int:
+    """64비트 부호 없는 값 → BIGINT 저장용 부호 있는 값"""
+    fingerprint &= _MASK
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >> (SIMHASH_BITS - 1) else fingerprint
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """두 SimHash의 해밍 거리 (부호 있는/없는 값 모두 가능)"""
+    return bin((first ^ second) & _MASK).count('1')
+
+
+def simhash_bands(fingerprint: int) -> List[Tuple[int, int]]:
+    """
+    SimHash를 밴드로 분할
+
+    Returns:
+        list: [(band_no, band_value), ...] (BAND_COUNT개)
+    """
+    fingerprint &= _MASK
+    return [
+        (band_no, fingerprint >> (band_no * BAND_BITS) & _BAND_MASK)
+        for band_no in range(BAND_COUNT)
+    ]
+
+
+def band_rows(article_id: int, fingerprint: Optional[int]) -> List[Dict]:
+    """Article_Simhash_Band에 삽입할 행 (지문이 없으면 빈 리스트)"""
+    if fingerprint is None:
+        return []
+    return [
+        {'article_id': article_id, 'band_no': band_no, 'band_value': band_value}
+        for band_no, band_value in simhash_bands(fingerprint)
+    ]
+
+
+class NearDuplicateDetector:
+    """
+    SimHash 기반 유사 기사 탐지기 (스레드 간 공유)
+
+    DB에 저장된 기사와, 이번 실행에서 이미 분석했지만 아직 저장되지 않은 기사를 모두 확인합니다.
+    """
+
+    def __init__(self, app: Flask, max_distance: int = 3):
+        """
+        Args:
+            app (Flask): DB 조회에 사용할 앱 (호출마다 새 앱 컨텍스트 생성)
+            max_distance (int): 유사 기사로 볼 최대 해밍 거리.
+                                BAND_COUNT - 1(=3)보다 크면 밴드가 모두 다른 유사 기사는 찾지 못합니다.
+        """
+        self.app = app
+        self.max_distance = max(0, max_distance)
+
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[int, Dict] = {}
+        self._bands: Dict[Tuple[int, int], List[int]] = {}
+
+    def reset(self):
+        """새 실행 시작 (이번 실행에서 기억한 분석 결과 삭제)"""
+        with self._lock:
+            self._fingerprints = {}
+            self._bands = {}
+
+    def find(self, fingerprint: Optional[int]) -> Optional[Dict]:
+        """
+        유사 기사의 분석 결과 조회
+
+        Args:
+            fingerprint (int): simhash() 결과
+
+        Returns:
+            dict: {'article_id': int 또는 None(이번 실행에서 분석한 기사), 'distance': int,
+                   'analysis': {'title_ko', 'summary_ko', 'concept_names'}}. 없으면 None
+        """
+        if fingerprint is None:
+            return None
+
+        match = self._find_in_run(fingerprint)
+        if match is not None:
+            return match
+
+        with self.app.app_context():
+            return self._find_in_db(fingerprint)
+
+    def remember(self, fingerprint: Optional[int], analysis: Dict):
+        """이번 실행에서 분석한 기사의 지문과 분석 결과 기억"""
+        if fingerprint is None or not analysis:
+            return
+
+        with self._lock:
+            if fingerprint in self._fingerprints:
+                return
+            self._fingerprints[fingerprint] = analysis
+            for band in simhash_bands(fingerprint):
+                self._bands.setdefault(band, []).append(fingerprint)
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _find_in_run(self, fingerprint: int) -> Optional[Dict]:
+        with self._lock:
+            candidates = {
+                other
+                for band in simhash_bands(fingerprint)
+                for other in self._bands.get(band, [])
+            }
+            best = self._closest(fingerprint, ((other, other) for other in candidates))
+            if best is None:
+                return None
+            other, distance = best
+            return {'article_id': None, 'distance': distance, 'analysis': self._fingerprints[other]}
+
+    def _find_in_db(self, fingerprint: int) -> Optional[Dict]:
+        conditions = [
+            and_(Article_Simhash_Band.band_no == band_no, Article_Simhash_Band.band_value == band_value)
+            for band_no, band_value in simhash_bands(fingerprint)
+        ]
+        rows = db.session.query(Article.article_id, Article.content_simhash).join(
+            Article_Simhash_Band, Article_Simhash_Band.article_id == Article.article_id
+        ).filter(or_(*conditions)).distinct().all()
+
+        best = self._closest(
+            fingerprint,
+            ((article_id, other) for article_id, other in rows if other is not None)
+        )
+        if best is None:
+            return None
+
+        article_id, distance = best
+        return {'article_id': article_id, 'distance': distance, 'analysis': self._load_analysis(article_id)}
+
+    def _closest(self, fingerprint: int, candidates) -> Optional[Tuple[int, int]]:
+        """(키, 지문) 후보 중 max_distance 이내에서 가장 가까운 (키, 거리)"""
+        best = None
+        for key, other in candidates:
+            distance = hamming_distance(fingerprint, other)
+            if distance <= self.max_distance and (best is None or (distance, key) < (best[1], best[0])):
+                best = (key, distance)
+        return best
+
+    @staticmethod
+    def _load_analysis(article_id: int) -> Dict:
+        """저장된 기사에서 분석 결과 형태로 복원 (AIAnalyzer.analyze_article 결과와 같은 키)"""
+        title_ko, summary_ko = db.session.query(Article.title_ko, Article.summary_ko).filter(
+            Article.article_id == article_id
+        ).one()
+        concept_names = [
+            name for (name,) in db.session.query(Concept.name).join(
+                Article_Concept, Article_Concept.concept_id == Concept.concept_id
+            ).filter(
+                Article_Concept.article_id == article_id
+            ).order_by(Article_Concept.ac_id)
+        ]
+        return {'title_ko': title_ko or '', 'summary_ko': summary_ko or '', 'concept_names': concept_names}
@@ -2,47 +2,181 @@
 GNews API 크롤러
 
 GNews API를 통해 기술 뉴스를 수집합니다.
+
+fetch_many()는 여러 피드(카테고리/국가 조합의 top-headlines, 검색어)를 연결 풀을 공유하는
+스레드로 동시에 조회하고, 정규화 URL 기준으로 중복을 제거한 뒤 최신순으로 정렬합니다.
+모든 요청은 API 키별 토큰 버킷을 거치므로 요금제의 초당 요청 한도를 넘지 않습니다.
 """
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+
+from app.utils.url_utils import canonicalize_url
+
+
+GNEWS_API_URL = "https://gnews.io/api/v4"
+
+# 기본 피드 (fetch_many에 피드를 지정하지 않았을 때)
+DEFAULT_FEEDS = (
+    {'category': 'technology', 'country': 'us'},
+    {'category': 'technology', 'country': 'gb'},
+    {'category': 'science', 'country': 'us'},
+)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate (float): 초당 보충되는 요청 수
+            capacity (float): 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = max(0.001, rate)
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float = 30.0) -> bool:
+        """
+        토큰 하나 사용 (없으면 채워질 때까지 대기)
+
+        Returns:
+            bool: timeout 안에 토큰을 얻었는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key: str) -> TokenBucket:
+    """
+    API 키별 공유 토큰 버킷 (같은 프로세스의 GNewsFetcher가 함께 사용)
+
+    초당 요청 수와 버스트 크기는 GNEWS_RATE_PER_SECOND(기본 1), GNEWS_BURST(기본 4)로 설정합니다.
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(api_key)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=float(os.getenv('GNEWS_RATE_PER_SECOND', 1)),
+                capacity=float(os.getenv('GNEWS_BURST', 4))
+            )
+            _buckets[api_key] = bucket
+        return bucket
+
+
+def parse_feed_spec(spec: str) -> Dict[str, str]:
+    """
+    명령행 피드 표기를 피드 dict로 변환
+
+    - 'technology', 'technology/gb', 'science/us/en' → top-headlines (카테고리/국가/언어)
+    - 'q:quantum computing' → 검색
+
+    Returns:
+        dict: fetch_many()의 피드 형식
+    """
+    if spec.startswith('q:'):
+        return {'q': spec[2:].strip()}
+    parts = [part.strip() for part in spec.split('/')]
+    feed = {'category': parts[0] or 'technology'}
+    if len(parts) > 1 and parts[1]:
+        feed['country'] = parts[1]
+    if len(parts) > 2 and parts[2]:
+        feed['lang'] = parts[2]
+    return feed
 
 
 class GNewsFetcher:
     """GNews API 기사 수집 클래스"""
-    
-    def __init__(self, api_key: Optional[str] = None):
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        recorder=None,
+        max_workers: int = 4
+    ):
         """
         Args:
             api_key (str, optional): GNews API 키. None이면 환경 변수에서 로드
+            base_url (str, optional): GNews API 주소. None이면 GNEWS_BASE_URL 환경 변수 또는
+                                      https://gnews.io/api/v4 (로컬 스텁 서버로 바꿔서 벤치마크할 때 사용)
+            recorder (CorpusRecorder, optional): 지정하면 API 응답을 재생용 코퍼스에 기록
+            max_workers (int): fetch_many()의 동시 요청 수 (연결 풀 크기)
         """
         self.api_key = api_key or os.getenv('GNEWS_API_KEY')
-        
+
         if not self.api_key:
             raise ValueError("GNEWS_API_KEY not found. Please set it in .env file.")
-        
-        self.base_url = "https://gnews.io/api/v4/top-headlines"
-    
+
+        self.api_url = (base_url or os.getenv('GNEWS_BASE_URL') or GNEWS_API_URL).rstrip('/')
+        self.base_url = f"{self.api_url}/top-headlines"
+        self.search_url = f"{self.api_url}/search"
+
+        self.recorder = recorder
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = get_rate_limiter(self.api_key)
+        self.stats = {'requests': 0, 'failed': 0, 'throttled': 0, 'duplicates': 0}
+        self._stats_lock = threading.Lock()
+
+        # 데몬 모드에서 주기마다 연결을 새로 맺지 않도록 세션 재사용 (fetch_many 스레드들이 연결 풀 공유)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
+
     def fetch_articles(
         self,
         category: str = 'technology',
         lang: str = 'en',
         country: str = 'us',
-        max_results: int = 3
+        max_results: int = 3,
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """
         GNews API에서 기사 목록 가져오기
-        
+
         Args:
             category (str): 카테고리 (기본값: 'technology')
             lang (str): 언어 (기본값: 'en')
             country (str): 국가 (기본값: 'us')
             max_results (int): 최대 결과 수 (기본값: 3)
-            
+            published_after (str, optional): 이 시각(ISO 8601, 예: '2024-01-01T00:00:00Z') 이후에
+                                             발행된 기사만 요청
+            published_before (str, optional): 이 시각 이전에 발행된 기사만 요청 (최신순 결과를 뒤로 넘길 때)
+
         Returns:
             List[Dict]: [{'title': str, 'url': str}, ...]
-            
+
         Raises:
             requests.exceptions.RequestException: API 요청 실패 시
         """
@@ -50,49 +184,198 @@ class GNewsFetcher:
             'category': category,
             'lang': lang,
             'country': country,
-            'max': max_results,
-            'apikey': self.api_key
+            'max': max_results
         }
-        
+        if published_after:
+            params['from'] = published_after
+        if published_before:
+            params['to'] = published_before
+
+        articles = self._request(self.base_url, params)
+        print(f"✓ Successfully fetched {len(articles)} articles from GNews API")
+        return articles
+
+    def fetch_many(
+        self,
+        feeds: Optional[List[Dict[str, str]]] = None,
+        max_results: int = 10,
+        published_after: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        여러 피드를 동시에 조회하고 합치기
+
+        - 피드마다 요청 하나 (토큰 버킷이 허용하는 만큼 동시에 전송)
+        - 정규화 URL이 같은 기사는 하나만 남김 (먼저 본 기사 유지)
+        - publishedAt 최신순 정렬
+        - 일부 피드가 실패해도 나머지 결과 반환
+
+        Args:
+            feeds (list, optional): 피드 목록. None이면 DEFAULT_FEEDS
+                - top-headlines: {'category': str, 'country': str, 'lang': str} (country/lang 생략 시 us/en)
+                - 검색: {'q': str, 'country': str, 'lang': str}
+            max_results (int): 피드당 최대 결과 수
+            published_after (str, optional): 이 시각(ISO 8601) 이후에 발행된 기사만 요청
+
+        Returns:
+            List[Dict]: fetch_articles()와 같은 형식 (정규화 URL 기준 중복 제거, url은 원본 그대로)
+
+        Raises:
+            requests.exceptions.RequestException: 모든 피드 요청이 실패했을 때 (마지막 오류)
+        """
+        feeds = list(feeds or DEFAULT_FEEDS)
+        if not feeds:
+            return []
+
+        results = []
+        errors = []
+        for feed, articles, error in self.fetch_feeds(feeds, max_results, published_after):
+            if error is not None:
+                print(f"  ✗ Feed {feed} failed: {error}")
+                errors.append(error)
+            else:
+                results.append(articles)
+
+        if errors and len(errors) == len(feeds):
+            raise errors[-1]
+
+        merged = self.merge(results)
+        print(
+            f"✓ Fetched {len(merged)} unique articles from {len(feeds) - len(errors)}/{len(feeds)} GNews feeds"
+        )
+        return merged
+
+    def fetch_feeds(
+        self,
+        feeds: List[Dict[str, str]],
+        max_results: int = 10,
+        published_after: Optional[str] = None
+    ) -> List[Tuple[Dict[str, str], Optional[List[Dict[str, str]]], Optional[Exception]]]:
+        """
+        여러 피드를 동시에 조회하고 피드별 결과를 그대로 반환 (합치지 않음)
+
+        피드 dict에 'from'/'to'(ISO 8601)가 있으면 그 피드는 published_after 대신 그 기간만 요청합니다.
+        피드마다 워터마크를 따로 관리하는 데몬이 사용합니다.
+
+        Returns:
+            list: [(피드, 기사 목록 또는 None, 오류 또는 None), ...] (feeds 순서)
+        """
+        def fetch(feed: Dict[str, str]) -> List[Dict[str, str]]:
+            params = {
+                'lang': feed.get('lang', 'en'),
+                'country': feed.get('country', 'us'),
+                'max': max_results
+            }
+            if feed.get('from') or published_after:
+                params['from'] = feed.get('from') or published_after
+            if feed.get('to'):
+                params['to'] = feed['to']
+            if feed.get('q'):
+                params['q'] = feed['q']
+                return self._request(self.search_url, params)
+            params['category'] = feed.get('category', 'technology')
+            return self._request(self.base_url, params)
+
+        if not feeds:
+            return []
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(feeds)), thread_name_prefix='gnews') as executor:
+            futures = [(feed, executor.submit(fetch, feed)) for feed in feeds]
+            for feed, future in futures:
+                try:
+                    results.append((feed, future.result(), None))
+                except Exception as e:
+                    results.append((feed, None, e))
+        return results
+
+    def merge(self, results: List[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """피드 결과를 정규화 URL로 중복 제거 후 publishedAt 최신순 정렬 (url은 원본 그대로)"""
+        merged = {}
+        duplicates = 0
+        for articles in results:
+            for article in articles:
+                if not article.get('url'):
+                    continue
+                key = canonicalize_url(article['url'])
+                if key in merged:
+                    duplicates += 1
+                    continue
+                merged[key] = article
+
+        self._count('duplicates', duplicates)
+        # ISO 8601(UTC) 문자열은 사전순 = 시간순. 발행 시각이 없는 기사는 맨 뒤
+        return sorted(merged.values(), key=lambda article: article.get('published_at') or '', reverse=True)
+
+    def _request(self, url: str, params: Dict) -> List[Dict[str, str]]:
+        """
+        토큰 버킷을 거쳐 GNews API 요청 후 기사 목록으로 변환
+
+        Raises:
+            requests.exceptions.RequestException: API 요청 실패 또는 토큰 대기 시간 초과
+        """
+        if not self.rate_limiter.acquire():
+            self._count('throttled')
+            raise requests.exceptions.RequestException("GNews rate limit budget exhausted (token bucket)")
+
+        self._count('requests')
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(url, params=dict(params, apikey=self.api_key), timeout=10)
             response.raise_for_status()
             data = response.json()
-            
-            articles = []
-            for article in data.get('articles', []):
-                articles.append({
-                    'title': article.get('title', 'No title'),
-                    'url': article.get('url', ''),
-                    'description': article.get('description', ''),
-                    'published_at': article.get('publishedAt', ''),
-                    'source': article.get('source', {}).get('name', 'Unknown')
-                })
-            
-            print(f"✓ Successfully fetched {len(articles)} articles from GNews API")
-            return articles
-        
+            if self.recorder is not None:
+                self.recorder.record_gnews(params, data)
+            return self.parse_articles(data)
+
         except requests.exceptions.Timeout:
-            print(f"✗ Timeout error: GNews API took too long to respond")
+            self._count('failed')
+            print("✗ Timeout error: GNews API took too long to respond")
             raise
-        
+
         except requests.exceptions.HTTPError as e:
+            self._count('failed')
             if e.response.status_code == 401:
-                print(f"✗ Authentication error: Invalid API key")
+                print("✗ Authentication error: Invalid API key")
             elif e.response.status_code == 429:
-                print(f"✗ Rate limit exceeded: Too many requests")
+                print("✗ Rate limit exceeded: Too many requests")
             else:
                 print(f"✗ HTTP error: {e}")
             raise
-        
+
         except requests.exceptions.RequestException as e:
+            self._count('failed')
             print(f"✗ Error fetching from GNews API: {e}")
             raise
-    
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    @staticmethod
+    def parse_articles(data: Dict) -> List[Dict[str, str]]:
+        """
+        top-headlines/search 응답 JSON을 파이프라인 기사 형식으로 변환
+
+        Args:
+            data (dict): GNews API 응답
+
+        Returns:
+            List[Dict]: [{'title', 'url', 'description', 'published_at', 'source'}, ...]
+        """
+        articles = []
+        for article in data.get('articles', []):
+            articles.append({
+                'title': article.get('title', 'No title'),
+                'url': article.get('url', ''),
+                'description': article.get('description', ''),
+                'published_at': article.get('publishedAt', ''),
+                'source': article.get('source', {}).get('name', 'Unknown')
+            })
+        return articles
+
     def validate_api_key(self) -> bool:
         """
         API 키 유효성 검증
-        
+
         Returns:
             bool: 유효하면 True
         """
@@ -104,10 +387,9 @@ class GNewsFetcher:
                 'max': 1,
                 'apikey': self.api_key
             }
-            
-            response = requests.get(self.base_url, params=params, timeout=5)
+
+            response = self.session.get(self.base_url, params=params, timeout=5)
             return response.status_code == 200
-        
+
         except Exception:
             return False
-
@@ -0,0 +1,242 @@
+"""
+HTML 본문 추출기
+
+- StreamingTextExtractor: 전체 DOM 트리를 만들지 않고, HTML을 조각 단위로 읽으면서
+  <article>/<p> 텍스트만 바로 수집합니다.
+- ExtractionPool: 원본 HTML 바이트를 프로세스 풀에서 파싱합니다.
+  BeautifulSoup 파싱은 GIL을 점유하는 CPU 작업이므로, 대량 백필 시
+  스레드 대신 프로세스로 나눠야 코어 수만큼 처리량이 늘어납니다.
+
+두 방식 모두 extract_text_from_soup()과 같은 전략을 사용합니다.
+"""
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from html.parser import HTMLParser
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401  (설치되어 있으면 더 빠른 파서 사용)
+    PARSER_BACKEND = 'lxml'
+except ImportError:
+    PARSER_BACKEND = 'html.parser'
+
+
+# 본문 추출 시 무시하는 태그
+SKIP_TAGS = {'script', 'style', 'nav', 'header', 'footer', 'aside'}
+
+# <article> 전략을 채택하기 위한 최소 길이
+MIN_ARTICLE_LENGTH = 200
+
+
+def extract_text_from_soup(soup: BeautifulSoup) -> str:
+    """
+    BeautifulSoup 객체에서 텍스트 추출
+    
+    전략:
+    1. <article> 태그 찾기
+    2. <p> 태그들 수집
+    3. 스크립트, 스타일 제거
+    
+    Args:
+        soup (BeautifulSoup): 파싱된 HTML
+        
+    Returns:
+        str: 추출된 텍스트
+    """
+    # 불필요한 태그 제거
+    for script in soup(list(SKIP_TAGS)):
+        script.decompose()
+    
+    # 전략 1: <article> 태그 찾기
+    article_tag = soup.find('article')
+    if article_tag:
+        paragraphs = article_tag.find_all('p')
+        if paragraphs:
+            text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+            if len(text) > MIN_ARTICLE_LENGTH:  # 최소 길이 확인
+                return text
+    
+    # 전략 2: 모든 <p> 태그 수집
+    paragraphs = soup.find_all('p')
+    text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+    
+    return text
+
+
+def extract_text_from_html(raw_html: bytes, encoding: Optional[str] = None) -> str:
+    """
+    원본 HTML 바이트에서 텍스트 추출 (프로세스 풀 워커 함수)
+    
+    lxml이 설치되어 있으면 lxml 파서를, 없으면 기존과 같은 html.parser를 사용합니다.
+    lxml 파싱이 실패하면 html.parser로 다시 시도합니다.
+    
+    Args:
+        raw_html (bytes): 원본 HTML
+        encoding (str, optional): 응답 헤더의 문자 인코딩
+        
+    Returns:
+        str: 추출된 텍스트
+    """
+    if PARSER_BACKEND != 'html.parser':
+        try:
+            soup = BeautifulSoup(raw_html, PARSER_BACKEND, from_encoding=encoding)
+            return extract_text_from_soup(soup)
+        except Exception:
+            pass
+    
+    soup = BeautifulSoup(raw_html, 'html.parser', from_encoding=encoding)
+    return extract_text_from_soup(soup)
+
+
+class ExtractionPool:
+    """HTML 파싱 전용 프로세스 풀"""
+    
+    def __init__(self, processes: Optional[int] = None):
+        """
+        Args:
+            processes (int, optional): 워커 프로세스 수. None이면 CPU 코어 수
+        """
+        self.processes = processes or multiprocessing.cpu_count()
+        
+        # ETL은 여러 스레드에서 동작하므로 fork 대신 spawn으로 워커 생성
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    
+    def submit(self, raw_html: bytes, encoding: Optional[str] = None) -> Future:
+        """
+        파싱 작업 제출
+        
+        Returns:
+            Future: 결과로 추출된 텍스트(str)를 반환
+        """
+        return self._executor.submit(extract_text_from_html, raw_html, encoding)
+    
+    def extract(self, raw_html: bytes, encoding: Optional[str] = None) -> str:
+        """
+        파싱 작업을 제출하고 결과를 기다림
+        
+        Args:
+            raw_html (bytes): 원본 HTML
+            encoding (str, optional): 응답 헤더의 문자 인코딩
+            
+        Returns:
+            str: 추출된 텍스트
+        """
+        return self.submit(raw_html, encoding).result()
+    
+    def close(self):
+        """워커 프로세스 종료"""
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class StreamingTextExtractor(HTMLParser):
+    """
+    점진적 HTML 본문 추출기
+
+    feed()로 받은 HTML 조각을 바로 처리하고 문단 텍스트만 보관하므로,
+    메모리 사용량이 페이지 크기가 아니라 본문 길이에 비례합니다.
+
+    추출 전략:
+    1. 첫 번째 <article> 안의 <p> 텍스트 (200자 초과 시 채택)
+    2. 문서 전체의 <p> 텍스트
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.article_paragraphs: List[str] = []
+        self.all_paragraphs: List[str] = []
+
+        self._skip_depth = 0
+        self._paragraph_depth = 0
+        self._paragraph_buffer: List[str] = []
+        self._article_depth = 0
+        self._article_seen = False
+        self._article_closed = False
+
+    @property
+    def article_ready(self) -> bool:
+        """<article> 전략으로 본문이 확정되었는지 여부 (더 읽을 필요 없음)"""
+        return self._article_closed and len(self._join(self.article_paragraphs)) > MIN_ARTICLE_LENGTH
+
+    def get_text(self) -> str:
+        """
+        추출된 본문 반환
+
+        Returns:
+            str: 추출된 텍스트
+        """
+        article_text = self._join(self.article_paragraphs)
+        if len(article_text) > MIN_ARTICLE_LENGTH:
+            return article_text
+
+        return self._join(self.all_paragraphs)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+            return
+
+        if self._skip_depth:
+            return
+
+        if tag == 'article':
+            if self._article_depth:
+                self._article_depth += 1
+            elif not self._article_seen:
+                self._article_seen = True
+                self._article_depth = 1
+        elif tag == 'p':
+            self._paragraph_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+            return
+
+        if self._skip_depth:
+            return
+
+        if tag == 'article' and self._article_depth:
+            self._article_depth -= 1
+            if not self._article_depth:
+                self._article_closed = True
+        elif tag == 'p' and self._paragraph_depth:
+            self._paragraph_depth -= 1
+            if not self._paragraph_depth:
+                self._finish_paragraph()
+
+    def handle_data(self, data):
+        if self._paragraph_depth and not self._skip_depth:
+            self._paragraph_buffer.append(data)
+
+    def close(self):
+        super().close()
+        if self._paragraph_depth:
+            self._paragraph_depth = 0
+            self._finish_paragraph()
+
+    def _finish_paragraph(self):
+        text = ''.join(self._paragraph_buffer).strip()
+        self._paragraph_buffer = []
+        if not text:
+            return
+
+        self.all_paragraphs.append(text)
+        if self._article_depth:
+            self.article_paragraphs.append(text)
+
+    @staticmethod
+    def _join(paragraphs: List[str]) -> str:
+        return ' '.join(paragraphs)
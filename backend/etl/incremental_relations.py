@@ -0,0 +1,298 @@
+"""
+증분 개념 관계 갱신
+
+새 개념이 생기거나 개념 설명이 바뀌면, 그 개념만 기존 개념들과 비교해
+'similar_to' 관계를 추가/갱신합니다.
+
+비교 후보는 Concept_Keyword 역색인에서 SQL로 조회하므로
+개념 테이블이 커져도 기사 하나를 적재하는 비용은 거의 일정합니다.
+- 키워드/이름 단어를 공유하는 개념 (공유 토큰 수 상위 candidate_limit개)
+- 이름이 서로 포함 관계인 개념 (이름 trigram, 전체 이름 토큰)
+
+모든 함수는 활성화된 앱 컨텍스트 안에서 호출하고, 커밋은 호출자가 수행합니다.
+"""
+
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, delete, desc, func, or_
+
+from app.extensions import db
+from app.models import Concept, Concept_Keyword
+from etl.bulk_ops import chunked, insert_ignore
+from etl.db_loader import PLACEHOLDER_DESCRIPTION
+from etl.relation_writer import RelationWriter
+from etl.similarity_calculator import ConceptFeatures, SimilarityCalculator
+
+
+# Concept_Keyword.token 컬럼 길이
+TOKEN_MAX_LENGTH = 100
+
+# 새 이름에 포함된 다른 개념 이름을 찾을 때 비교할 최대 단어 수 (개념 이름은 대부분 1~4단어)
+NAME_NGRAM_MAX_WORDS = 4
+
+_NAME_TOKEN_RE = re.compile(r'\w+')
+
+
+class IncrementalRelationUpdater:
+    """개념 단위 유사도 관계 증분 갱신기"""
+
+    def __init__(
+        self,
+        threshold: float = 0.3,
+        top_k: int = 10,
+        candidate_limit: int = 500,
+        max_token_df: int = 5000
+    ):
+        """
+        Args:
+            threshold (float): 관계로 저장할 최소 유사도
+            top_k (int): 개념별 최대 유사 개념 수
+            candidate_limit (int): 개념 하나당 점수를 계산할 최대 후보 수
+            max_token_df (int): 이보다 많은 개념이 가진 토큰은 후보 조회에서 제외
+        """
+        self.threshold = threshold
+        self.top_k = max(1, top_k)
+        self.candidate_limit = max(1, candidate_limit)
+        self.max_token_df = max_token_df
+
+    def update_concepts(self, concept_ids: Iterable[int]) -> Dict[str, int]:
+        """
+        개념들의 키워드 색인을 갱신하고 유사도 관계 추가/갱신
+
+        Args:
+            concept_ids (iterable): 새로 생겼거나 설명이 바뀐 개념 ID들
+
+        Returns:
+            dict: {'concepts': int, 'inserted': int, 'updated': int, 'graph_caches_cleared': int}
+        """
+        concepts = self._load(concept_ids)
+        stats = {'concepts': len(concepts), 'inserted': 0, 'updated': 0, 'graph_caches_cleared': 0}
+        if not concepts:
+            return stats
+
+        features = {
+            concept_id: self._features(name, description_ko)
+            for concept_id, (name, description_ko) in concepts.items()
+        }
+        self.index_concepts(features)
+
+        writer = RelationWriter()
+        for concept_id, feature in features.items():
+            for other_id, score in self._neighbors(concept_id, feature):
+                writer.add(min(concept_id, other_id), max(concept_id, other_id), 'similar_to', round(score * 10))
+
+        result = writer.flush()
+        stats['inserted'] = result['inserted']
+        stats['updated'] = result['updated']
+        stats['graph_caches_cleared'] = RelationWriter.invalidate_graph_caches(result['concept_ids'])
+        return stats
+
+    def index_concepts(self, features: Dict[int, ConceptFeatures]):
+        """
+        개념들의 Concept_Keyword 행 재작성
+
+        Args:
+            features (dict): {concept_id: ConceptFeatures}
+        """
+        for chunk in chunked(list(features)):
+            db.session.execute(
+                delete(Concept_Keyword).where(Concept_Keyword.concept_id.in_(chunk))
+            )
+
+        rows = [
+            {'concept_id': concept_id, 'token_type': token_type, 'token': token}
+            for concept_id, feature in features.items()
+            for token_type, token in self._tokens(feature)
+        ]
+        for chunk in chunked(rows, 1000):
+            insert_ignore(Concept_Keyword, list(chunk))
+
+    def rebuild_index(self, batch_size: int = 1000) -> int:
+        """
+        전체 개념의 키워드 색인 재작성 (색인 도입 이전 개념 백필용)
+
+        Args:
+            batch_size (int): 한 번에 처리할 개념 수 (배치마다 커밋)
+
+        Returns:
+            int: 색인된 개념 수
+        """
+        indexed = 0
+        last_id = 0
+
+        while True:
+            rows = db.session.query(
+                Concept.concept_id, Concept.name, Concept.description_ko
+            ).filter(
+                Concept.concept_id > last_id
+            ).order_by(Concept.concept_id).limit(batch_size).all()
+
+            if not rows:
+                return indexed
+
+            self.index_concepts({
+                concept_id: self._features(name, description_ko)
+                for concept_id, name, description_ko in rows
+            })
+            db.session.commit()
+
+            indexed += len(rows)
+            last_id = rows[-1][0]
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _neighbors(self, concept_id: int, feature: ConceptFeatures) -> List[Tuple[int, float]]:
+        """후보 개념과 점수를 계산해 상위 top_k개 반환"""
+        candidate_ids = self._token_candidates(concept_id, feature)
+        candidate_ids |= self._name_candidates(concept_id, feature.name)
+        candidate_ids.discard(concept_id)
+
+        best: List[Tuple[float, int]] = []
+        for other_id, (name, description_ko) in self._load(candidate_ids).items():
+            score = SimilarityCalculator.score_features(feature, self._features(name, description_ko))
+            if score < self.threshold:
+                continue
+            entry = (score, -other_id)
+            if len(best) < self.top_k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+        return [(-negated, score) for score, negated in sorted(best, reverse=True)]
+
+    def _token_candidates(self, concept_id: int, feature: ConceptFeatures) -> Set[int]:
+        """키워드/이름 단어를 많이 공유하는 개념"""
+        tokens = {
+            'kw': self._usable(feature.keywords),
+            'nw': self._usable(feature.name_words),
+        }
+        tokens = {
+            token_type: values - self._frequent_tokens(token_type, values)
+            for token_type, values in tokens.items()
+        }
+
+        conditions = [
+            and_(Concept_Keyword.token_type == token_type, Concept_Keyword.token.in_(sorted(values)))
+            for token_type, values in tokens.items()
+            if values
+        ]
+        if not conditions:
+            return set()
+
+        shared = func.count(Concept_Keyword.keyword_id).label('shared')
+        rows = db.session.query(Concept_Keyword.concept_id, shared).filter(
+            or_(*conditions),
+            Concept_Keyword.concept_id != concept_id
+        ).group_by(
+            Concept_Keyword.concept_id
+        ).order_by(desc(shared)).limit(self.candidate_limit).all()
+
+        return {other_id for other_id, _ in rows}
+
+    def _name_candidates(self, concept_id: int, name: str) -> Set[int]:
+        """이름이 서로 포함 관계인 개념"""
+        if not name or len(name) > TOKEN_MAX_LENGTH:
+            return set()
+
+        # 다른 이름이 새 이름에 포함되는 경우: 새 이름의 단어 n-gram(원래 구분자 유지)을 전체 이름 토큰과 비교
+        candidates: Set[int] = set(
+            other_id for (other_id,) in db.session.query(Concept_Keyword.concept_id).filter(
+                Concept_Keyword.token_type == 'name',
+                Concept_Keyword.token.in_(self._name_ngrams(name)),
+                Concept_Keyword.concept_id != concept_id
+            ).limit(self.candidate_limit)
+        )
+
+        # 새 이름이 다른 이름에 포함되는 경우: 가장 드문 trigram을 가진 개념만 조회
+        if len(name) >= 3:
+            grams = sorted({name[k:k + 3] for k in range(len(name) - 2)})
+            counts = dict(
+                db.session.query(Concept_Keyword.token, func.count(Concept_Keyword.keyword_id)).filter(
+                    Concept_Keyword.token_type == 'tri',
+                    Concept_Keyword.token.in_(grams)
+                ).group_by(Concept_Keyword.token).all()
+            )
+            if len(counts) < len(grams):
+                # 어떤 trigram도 갖지 않은 개념은 새 이름을 포함할 수 없음
+                return candidates
+
+            rarest = min(grams, key=lambda gram: counts[gram])
+            rows = db.session.query(Concept_Keyword.concept_id).filter(
+                Concept_Keyword.token_type == 'tri',
+                Concept_Keyword.token == rarest,
+                Concept_Keyword.concept_id != concept_id
+            ).limit(self.candidate_limit * 4)
+        else:
+            rows = db.session.query(Concept.concept_id).filter(
+                func.lower(Concept.name).contains(name, autoescape=True),
+                Concept.concept_id != concept_id
+            ).limit(self.candidate_limit)
+
+        candidates.update(other_id for (other_id,) in rows)
+        return candidates
+
+    def _frequent_tokens(self, token_type: str, values: Set[str]) -> Set[str]:
+        """너무 많은 개념이 가진 토큰 (후보 조회 비용이 크고 변별력이 낮음)"""
+        if not values:
+            return set()
+
+        rows = db.session.query(Concept_Keyword.token).filter(
+            Concept_Keyword.token_type == token_type,
+            Concept_Keyword.token.in_(sorted(values))
+        ).group_by(
+            Concept_Keyword.token
+        ).having(func.count(Concept_Keyword.keyword_id) > self.max_token_df).all()
+
+        return {token for (token,) in rows}
+
+    @staticmethod
+    def _load(concept_ids: Iterable[int]) -> Dict[int, Tuple[str, Optional[str]]]:
+        """개념 ID → (이름, 설명) (IN 쿼리)"""
+        loaded = {}
+        for chunk in chunked(sorted(set(concept_ids))):
+            rows = db.session.query(
+                Concept.concept_id, Concept.name, Concept.description_ko
+            ).filter(Concept.concept_id.in_(chunk)).all()
+            loaded.update({concept_id: (name, description_ko) for concept_id, name, description_ko in rows})
+        return loaded
+
+    @staticmethod
+    def _features(name: str, description_ko: Optional[str]) -> ConceptFeatures:
+        """Placeholder 설명은 비교에서 제외하고 이름만 사용"""
+        if description_ko == PLACEHOLDER_DESCRIPTION:
+            description_ko = ''
+        return SimilarityCalculator.extract_features(name, description_ko or '')
+
+    @classmethod
+    def _tokens(cls, feature: ConceptFeatures) -> Iterable[Tuple[str, str]]:
+        for keyword in cls._usable(feature.keywords):
+            yield 'kw', keyword
+        for word in cls._usable(feature.name_words):
+            yield 'nw', word
+        if feature.name and len(feature.name) <= TOKEN_MAX_LENGTH:
+            yield 'name', feature.name
+            for gram in {feature.name[k:k + 3] for k in range(len(feature.name) - 2)}:
+                yield 'tri', gram
+
+    @staticmethod
+    def _name_ngrams(name: str) -> List[str]:
+        """
+        이름에서 단어 경계로 시작하고 끝나는 부분 문자열 (최대 NAME_NGRAM_MAX_WORDS단어) + 전체 이름
+
+        예: 'deep neural network' → ['deep', 'deep neural', 'deep neural network', 'neural', ...]
+        모든 부분 문자열(O(길이²)) 대신 O(단어 수)개만 조회합니다.
+        """
+        spans = [(match.start(), match.end()) for match in _NAME_TOKEN_RE.finditer(name)]
+        ngrams = {name}
+        for first in range(len(spans)):
+            for last in range(first, min(first + NAME_NGRAM_MAX_WORDS, len(spans))):
+                ngrams.add(name[spans[first][0]:spans[last][1]])
+        return sorted(ngrams)
+
+    @staticmethod
+    def _usable(tokens: Iterable[str]) -> Set[str]:
+        return {token for token in tokens if len(token) <= TOKEN_MAX_LENGTH}
@@ -0,0 +1,204 @@
+"""
+ETL 계측 (단계별 span과 실행 기록)
+
+파이프라인 단계 핸들러 호출 하나가 span 하나입니다 (배치 단계는 배치 하나가 span 하나).
+span에는 처리 시간과 함께 그 스레드에서 일어난 일의 양이 기록됩니다.
+
+- bytes: 스크래퍼가 내려받은 응답 바이트 수
+- prompt_tokens / completion_tokens: LLM 응답의 토큰 사용량 (LLMClient 관찰자)
+- retries: LLM 요청 재시도 횟수
+- cache_hits: 스크래핑 캐시(304)/분석 캐시 적중 수
+- errors: 실패 처리된 항목 수
+
+구성 요소는 record()만 호출하면 되고, 현재 스레드에 열린 span이 없으면 아무 일도 하지 않습니다.
+실행이 끝나면 실행 요약과 span 목록을 JSON 한 줄로 ETL_CACHE_DIR/etl_runs.jsonl에 추가합니다.
+집계는 python -m etl.report로 확인합니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+
+# span에 누적하는 카운터
+COUNTERS = ('bytes', 'prompt_tokens', 'completion_tokens', 'retries', 'cache_hits', 'errors')
+
+_current = threading.local()
+
+
+def default_runs_path() -> str:
+    """실행 기록 파일 경로 (ETL_RUNS_PATH 또는 ETL_CACHE_DIR/etl_runs.jsonl)"""
+    path = os.getenv('ETL_RUNS_PATH')
+    if path:
+        return path
+    return os.path.join(os.getenv('ETL_CACHE_DIR', '.etl_cache'), 'etl_runs.jsonl')
+
+
+def record(**amounts: int):
+    """
+    현재 스레드의 span에 카운터 누적 (열린 span이 없으면 무시)
+
+    Args:
+        **amounts: COUNTERS 중 이름과 더할 값 (예: record(bytes=1024, cache_hits=1))
+    """
+    span = getattr(_current, 'span', None)
+    if span is None:
+        return
+    for key, amount in amounts.items():
+        if amount:
+            span[key] = span.get(key, 0) + amount
+
+
+def record_llm_usage(response, retries: int):
+    """LLMClient 관찰자: 응답의 토큰 사용량과 재시도 횟수를 현재 span에 기록"""
+    usage = getattr(response, 'usage', None)
+    record(
+        prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+        completion_tokens=getattr(usage, 'completion_tokens', 0) or 0,
+        retries=retries
+    )
+
+
+class RunMetrics:
+    """파이프라인 실행 하나의 span 수집 및 실행 기록 저장 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None, kind: str = 'run', worker_id: Optional[str] = None):
+        """
+        Args:
+            path (str, optional): 실행 기록 JSONL 파일 경로. None이면 default_runs_path()
+            kind (str): 실행 종류 ('run', 'daemon', 'worker', 'benchmark')
+            worker_id (str, optional): 작업 큐 워커 ID (여러 워커의 기록 구분용)
+        """
+        self.path = path or default_runs_path()
+        self.kind = kind
+        self.worker_id = worker_id
+
+        self.run_id: Optional[str] = None
+        self.spans: List[Dict] = []
+        self._started_at: Optional[datetime] = None
+        self._started: float = 0.0
+        self._lock = threading.Lock()
+
+    def start(self):
+        """새 실행 시작 (이전 span 초기화)"""
+        with self._lock:
+            self.run_id = uuid.uuid4().hex[:12]
+            self.spans = []
+            self._started_at = datetime.utcnow()
+            self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage: str, items: int = 1) -> Iterator[Dict]:
+        """
+        단계 핸들러 호출 하나를 span으로 기록
+
+        Args:
+            stage (str): 단계 이름
+            items (int): span이 처리한 항목 수 (배치 크기)
+
+        Yields:
+            dict: span 레코드 (record()가 같은 스레드에서 카운터를 누적)
+        """
+        span = {'stage': stage, 'items': items, 'status': 'ok'}
+        previous = getattr(_current, 'span', None)
+        _current.span = span
+        started = time.perf_counter()
+        try:
+            yield span
+        except Exception:
+            span['status'] = 'error'
+            span['errors'] = span.get('errors', 0) + items
+            raise
+        finally:
+            span['seconds'] = round(time.perf_counter() - started, 4)
+            _current.span = previous
+            with self._lock:
+                self.spans.append(span)
+
+    def finish(self, summary: Dict[str, int]) -> Optional[Dict]:
+        """
+        실행 종료: 실행 기록을 JSONL 파일에 한 줄로 추가
+
+        처리한 항목이 없는 실행(빈 큐 폴링 등)은 기록하지 않습니다.
+
+        Args:
+            summary (dict): 파이프라인 통계
+
+        Returns:
+            dict: 저장한 실행 기록. 기록하지 않았으면 None
+        """
+        with self._lock:
+            spans = list(self.spans)
+        if not summary.get('items') and not spans:
+            return None
+
+        run = {
+            'run_id': self.run_id,
+            'kind': self.kind,
+            'worker_id': self.worker_id,
+            'started_at': self._started_at.isoformat() if self._started_at else None,
+            'seconds': round(time.perf_counter() - self._started, 3),
+            'summary': {key: value for key, value in summary.items() if isinstance(value, (int, float))},
+            'spans': spans
+        }
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(run, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"✗ Failed to save run metrics to {self.path}: {e}")
+            return None
+        return run
+
+    def stage_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        현재 실행의 단계별 합계 (로그 출력용)
+
+        Returns:
+            dict: {stage: {'spans', 'items', 'seconds', 'bytes', 'prompt_tokens', ...}}
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in spans:
+            stage = totals.setdefault(span['stage'], dict.fromkeys(('spans', 'items', 'seconds') + COUNTERS, 0))
+            stage['spans'] += 1
+            stage['items'] += span['items']
+            stage['seconds'] += span['seconds']
+            for key in COUNTERS:
+                stage[key] += span.get(key, 0)
+        return totals
+
+
+def load_runs(path: Optional[str] = None, last: Optional[int] = None) -> List[Dict]:
+    """
+    실행 기록 읽기 (손상된 줄은 건너뜀)
+
+    Args:
+        path (str, optional): 실행 기록 파일. None이면 default_runs_path()
+        last (int, optional): 최근 실행 몇 개만 반환
+
+    Returns:
+        list: 실행 기록 (오래된 순)
+    """
+    path = path or default_runs_path()
+    runs = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    return runs[-last:] if last else runs
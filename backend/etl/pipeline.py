@@ -0,0 +1,518 @@
+"""
+ETL 파이프라인 러너
+
+스크래핑 → AI 분석 → DB 적재 (→ 개념 정의) 단계를 크기가 제한된 큐로 연결하고,
+단계마다 지정된 수의 워커 스레드가 동시에 기사를 처리합니다.
+각 단계는 네트워크 I/O 대기가 대부분이므로 스레드로 충분히 겹쳐서 실행됩니다.
+
+스크래핑한 본문의 SimHash는 article_data['content_simhash']로 적재 단계에 전달되고,
+유사 기사 탐지기가 있으면 이미 분석된 유사 기사의 분석 결과를 재사용해 AI 분석을 건너뜁니다.
+관련도 필터가 있으면 기술 용어 밀도가 낮은 기사는 스크래핑 직후 제외합니다.
+
+작업 큐가 있으면 단계가 끝날 때마다 중간 결과를 체크포인트로 저장하고,
+이전 실행에서 중단된 항목은 마지막으로 완료된 단계 다음부터 이어서 처리합니다.
+
+계측기(RunMetrics)가 있으면 단계 핸들러 호출마다 처리 시간, 다운로드 바이트, LLM 토큰 등을
+span으로 기록하고 실행이 끝나면 실행 기록 파일에 저장합니다.
+"""
+
+import queue
+import threading
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Union
+
+from etl.web_scraper import WebScraper
+from etl.ai_analyzer import AIAnalyzer
+from etl.db_loader import DBLoader
+from etl.concept_definer import ConceptDefiner
+from etl.fingerprint import NearDuplicateDetector, simhash
+from etl.metrics import RunMetrics, record
+from etl.relevance_filter import RelevanceFilter
+from etl.work_queue import WorkQueue
+
+
+# 워커 종료 신호
+_STOP = object()
+
+
+class PipelineStage:
+    """파이프라인 단계 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable,
+        concurrency: int = 1,
+        batch_size: int = 1,
+        batch_wait: float = 0.5
+    ):
+        """
+        Args:
+            name (str): 단계 이름 (로그 출력용)
+            handler (callable): 작업 항목을 받아 다음 단계로 넘길 항목을 반환.
+                                None을 반환하면 해당 항목은 여기서 종료.
+                                batch_size > 1이면 항목 리스트를 받아 넘길 항목 리스트를 반환
+            concurrency (int): 단계 워커 스레드 수
+            batch_size (int): 한 번에 묶어서 처리할 최대 항목 수
+            batch_wait (float): 배치를 채우기 위해 다음 항목을 기다리는 최대 시간 (초)
+        """
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, int(concurrency))
+        self.batch_size = max(1, int(batch_size))
+        self.batch_wait = batch_wait
+
+
+class ETLPipeline:
+    """단계별 동시 실행 ETL 파이프라인"""
+
+    def __init__(
+        self,
+        scraper: WebScraper,
+        analyzer: AIAnalyzer,
+        loader_factory: Callable[[], DBLoader],
+        scrape_concurrency: int = 4,
+        analyze_concurrency: int = 2,
+        load_concurrency: int = 1,
+        queue_size: int = 16,
+        analyze_batch_size: int = 1,
+        load_batch_size: int = 1,
+        definer: Optional[ConceptDefiner] = None,
+        define_concurrency: int = 2,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        relevance_filter: Optional[RelevanceFilter] = None,
+        work_queue: Optional[WorkQueue] = None,
+        metrics: Optional[RunMetrics] = None
+    ):
+        """
+        Args:
+            scraper (WebScraper): 스크래퍼 (스레드 간 공유)
+            analyzer (AIAnalyzer): AI 분석기 (스레드 간 공유)
+            loader_factory (callable): 적재 워커 스레드마다 DBLoader를 생성하는 함수.
+                                       앱 컨텍스트는 스레드 간에 공유할 수 없으므로
+                                       워커마다 별도의 로더를 사용합니다.
+            scrape_concurrency (int): 스크래핑 워커 수
+            analyze_concurrency (int): AI 분석 워커 수
+            load_concurrency (int): DB 적재 워커 수
+            queue_size (int): 단계 사이 큐의 최대 크기
+            analyze_batch_size (int): AI 분석 요청 하나에 묶을 기사 수 (1이면 기사별 요청)
+            load_batch_size (int): 한 번의 트랜잭션으로 저장할 기사 수 (1이면 기사별 저장)
+            definer (ConceptDefiner, optional): 적재된 기사의 새 개념을 정의하는 단계.
+                                                None이면 개념 정의 단계를 건너뜀
+            define_concurrency (int): 개념 정의 워커 수
+            near_duplicates (NearDuplicateDetector, optional): 유사 기사 탐지기.
+                                                               None이면 모든 기사를 AI 분석
+            relevance_filter (RelevanceFilter, optional): 기술 용어 밀도 필터.
+                                                          None이면 스크래핑한 모든 기사를 분석 단계로 전달
+            work_queue (WorkQueue, optional): 체크포인트 저장 및 재시작용 작업 큐.
+                                              None이면 전달받은 기사만 메모리에서 처리
+            metrics (RunMetrics, optional): 단계별 span 계측기. None이면 계측하지 않음
+        """
+        self.scraper = scraper
+        self.analyzer = analyzer
+        self.loader_factory = loader_factory
+        self.scrape_concurrency = scrape_concurrency
+        self.analyze_concurrency = analyze_concurrency
+        self.load_concurrency = load_concurrency
+        self.queue_size = max(1, queue_size)
+        self.analyze_batch_size = max(1, analyze_batch_size)
+        self.load_batch_size = max(1, load_batch_size)
+        self.definer = definer
+        self.define_concurrency = define_concurrency
+        self.near_duplicates = near_duplicates
+        self.relevance_filter = relevance_filter
+        self.work_queue = work_queue
+        self.metrics = metrics
+
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    def run(self, articles: List[Dict]) -> Dict[str, int]:
+        """
+        기사 목록을 파이프라인으로 처리
+
+        작업 큐가 있으면 기사들을 큐에 등록한 뒤, 이전 실행에서 남은 항목을 포함해
+        지금 처리할 수 있는 항목을 claim_limit개씩 lease로 가져와 처리하기를 더 가져올 항목이
+        없을 때까지 반복하고, 끝나면 남은 lease를 반환합니다. 한 번에 lease 시간 안에 처리할 수 있는
+        만큼만 가져오므로 큐에서 기다리는 동안 lease가 만료되어 다른 워커가 가져가는 일이 없습니다.
+
+        Args:
+            articles (list): GNewsFetcher.fetch_articles() 결과
+
+        Returns:
+            dict: {
+                'items': int (처리한 작업 항목 수),
+                'processed': int,
+                'skipped': int,
+                'errors': int,
+                'near_duplicates': int,
+                'filtered': int,
+                'resumed': int,
+                ... (definer가 있으면 ConceptDefiner 통계 포함)
+            }
+        """
+        self.stats = self._empty_stats()
+        if self.metrics is not None:
+            self.metrics.start()
+        if self.definer is not None:
+            self.definer.reset()
+        if self.near_duplicates is not None:
+            self.near_duplicates.reset()
+
+        try:
+            if self.work_queue is None:
+                self._run_round([{'article': article_data} for article_data in articles])
+            else:
+                self.work_queue.enqueue(articles)
+                seen = set()
+                while True:
+                    payloads = self.work_queue.claim()
+                    urls = {payload['article']['url'] for payload in payloads}
+                    # 이번 실행에서 이미 처리한 항목만 돌아오면 중단 (무한 반복 방지)
+                    if not urls - seen:
+                        break
+                    seen |= urls
+                    self._run_round(payloads)
+        finally:
+            if self.work_queue is not None:
+                self.work_queue.release()
+
+        stats = dict(self.stats)
+        if self.definer is not None:
+            stats.update(self.definer.flush())
+        if self.metrics is not None:
+            self.metrics.finish(stats)
+        return stats
+
+    def _run_round(self, payloads: List[Dict]):
+        """가져온 항목들을 단계별 워커로 처리"""
+        total = len(payloads)
+        items = [
+            dict(payload, index=idx, total=total)
+            for idx, payload in enumerate(payloads, 1)
+        ]
+        self._count('items', total)
+        self._count('resumed', sum(1 for item in items if item.get('state', 'fetched') != 'fetched'))
+        self._run_stages(self._build_stages(), items)
+
+    def _build_stages(self) -> List[PipelineStage]:
+        """파이프라인 단계 구성"""
+        stages = [
+            PipelineStage('scrape', self._scrape, self.scrape_concurrency),
+            self._analyze_stage(),
+            self._load_stage(),
+        ]
+        if self.definer is not None:
+            stages.append(PipelineStage('define', self._define, self.define_concurrency))
+        return stages
+
+    def _analyze_stage(self) -> PipelineStage:
+        """AI 분석 단계 (배치 크기에 따라 단건/배치 핸들러 선택)"""
+        if self.analyze_batch_size > 1:
+            return PipelineStage(
+                'analyze',
+                self._analyze_batch,
+                self.analyze_concurrency,
+                batch_size=self.analyze_batch_size
+            )
+        return PipelineStage('analyze', self._analyze, self.analyze_concurrency)
+
+    def _load_stage(self) -> PipelineStage:
+        """DB 적재 단계 (배치 크기에 따라 단건/배치 핸들러 선택)"""
+        if self.load_batch_size > 1:
+            return PipelineStage(
+                'load',
+                self._load_batch,
+                self.load_concurrency,
+                batch_size=self.load_batch_size
+            )
+        return PipelineStage('load', self._load, self.load_concurrency)
+
+    def _run_stages(self, stages: List[PipelineStage], items: List[Dict]):
+        """
+        단계별 워커 스레드를 띄우고 모든 항목이 처리될 때까지 대기
+
+        각 단계의 마지막 워커가 종료되면 다음 단계 워커 수만큼 종료 신호를 보내므로,
+        앞 단계가 끝나기 전에 뒷 단계가 멈추는 일이 없습니다.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in stages]
+        remaining = [stage.concurrency for stage in stages]
+        remaining_lock = threading.Lock()
+
+        def worker(stage_index: int):
+            stage = stages[stage_index]
+            inbox = queues[stage_index]
+            outbox = queues[stage_index + 1] if stage_index + 1 < len(stages) else None
+
+            stopped = False
+            while not stopped:
+                item = inbox.get()
+                if item is _STOP:
+                    break
+
+                if stage.batch_size > 1:
+                    batch, stopped = self._collect_batch(inbox, item, stage)
+                    results = self._handle(stage, batch) or []
+                else:
+                    result = self._handle(stage, item)
+                    results = [result] if result is not None else []
+
+                if outbox is not None:
+                    for result in results:
+                        if result is not None:
+                            outbox.put(result)
+
+            with remaining_lock:
+                remaining[stage_index] -= 1
+                is_last = remaining[stage_index] == 0
+
+            if is_last and outbox is not None:
+                for _ in range(stages[stage_index + 1].concurrency):
+                    outbox.put(_STOP)
+
+        threads = []
+        for stage_index, stage in enumerate(stages):
+            for worker_no in range(stage.concurrency):
+                thread = threading.Thread(
+                    target=worker,
+                    args=(stage_index,),
+                    name=f"etl-{stage.name}-{worker_no}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        for item in items:
+            queues[0].put(item)
+        for _ in range(stages[0].concurrency):
+            queues[0].put(_STOP)
+
+        for thread in threads:
+            thread.join()
+
+    def _handle(self, stage: PipelineStage, payload: Union[Dict, List[Dict]]):
+        """단계 핸들러 실행 (예외 발생 시 해당 항목 모두 오류 처리)"""
+        items = payload if isinstance(payload, list) else [payload]
+        span = self.metrics.span(stage.name, len(items)) if self.metrics is not None else nullcontext()
+        try:
+            with span:
+                return stage.handler(payload)
+        except Exception as e:
+            urls = ', '.join(str(item['article'].get('url')) for item in items)
+            print(f"  ✗✗ Error in {stage.name} stage ({urls}): {e}")
+            for item in items:
+                self._fail(item, f"{stage.name}: {e}")
+            return None
+
+    @staticmethod
+    def _collect_batch(inbox: queue.Queue, first_item: Dict, stage: PipelineStage):
+        """
+        배치 크기만큼 항목 수집 (batch_wait 동안 더 들어오지 않으면 있는 만큼 처리)
+
+        Returns:
+            tuple: (항목 리스트, 종료 신호 수신 여부)
+        """
+        batch = [first_item]
+        while len(batch) < stage.batch_size:
+            try:
+                item = inbox.get(timeout=stage.batch_wait)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    # ------------------------------------------------------------------
+    # 단계 핸들러
+    # ------------------------------------------------------------------
+
+    def _scrape(self, item: Dict) -> Optional[Dict]:
+        article_data = item['article']
+        print(f"\n[Article {item['index']}/{item['total']}] {article_data['title']}")
+
+        content = item.get('content')
+        if content and item.get('state') != 'fetched':
+            print(f"  ⟳ Resuming from saved '{item['state']}' checkpoint")
+            return item
+
+        if content:
+            # 관련도 필터로 건너뛰었다가 용어 사전이 커져서 되돌아온 항목: 저장된 본문으로 재평가
+            print("  ⟳ Re-evaluating relevance of saved content")
+        else:
+            content = self.scraper.scrape_article(article_data['url'])
+            if not content:
+                print(f"  ✗ Failed to scrape content. Skipping: {article_data['url']}")
+                self._fail(item, 'scrape failed')
+                return None
+
+        if self.relevance_filter is not None:
+            density, distinct = self.relevance_filter.score(content)
+            if not self.relevance_filter.passes(density, distinct):
+                print(
+                    f"  ⊘ Low tech relevance ({density:.2f}/100 words, {distinct} terms). "
+                    f"Skipping: {article_data['url']}"
+                )
+                self._count('filtered')
+                if self.work_queue is not None:
+                    self.work_queue.skip(dict(item, content=content), self.relevance_filter.vocabulary_size)
+                return None
+
+        item['content'] = content
+        item['article'] = dict(article_data, content_simhash=simhash(content))
+        self._checkpoint(item, 'scraped')
+        return item
+
+    def _analyze(self, item: Dict) -> Optional[Dict]:
+        if item.get('analysis') or self._reuse_analysis(item):
+            return item
+
+        analysis = self.analyzer.analyze_article(item['content'])
+        if not analysis:
+            print(f"  ✗ Failed to analyze content. Skipping: {item['article']['url']}")
+            self._fail(item, 'analysis failed')
+            return None
+
+        item['analysis'] = analysis
+        self._remember_analysis(item)
+        self._checkpoint(item, 'analyzed')
+        return item
+
+    def _analyze_batch(self, items: List[Dict]) -> List[Dict]:
+        pending = [item for item in items if not (item.get('analysis') or self._reuse_analysis(item))]
+        analyses = self.analyzer.analyze_articles(
+            [item['content'] for item in pending],
+            batch_size=len(pending)
+        ) if pending else []
+
+        for item, analysis in zip(pending, analyses):
+            if not analysis:
+                print(f"  ✗ Failed to analyze content. Skipping: {item['article']['url']}")
+                self._fail(item, 'analysis failed')
+                continue
+            item['analysis'] = analysis
+            self._remember_analysis(item)
+            self._checkpoint(item, 'analyzed')
+
+        return [item for item in items if 'analysis' in item]
+
+    def _load(self, item: Dict) -> Optional[Dict]:
+        print(f"  ⟳ Saving to database: {item['article']['url']}")
+
+        result = self._loader().load_article_data(
+            article_data=item['article'],
+            analysis=item['analysis']
+        )
+
+        # DB 오류는 예외로 _handle()까지 올라가 errors로 집계되고 작업 큐 백오프 후 재시도됨
+        if result is None:
+            self._count('skipped')
+            self._mark_loaded(item)
+            return None
+
+        self._count('processed')
+        self._mark_loaded(item)
+        return item
+
+    def _load_batch(self, items: List[Dict]) -> List[Dict]:
+        print(f"  ⟳ Saving {len(items)} articles to database")
+
+        results = self._loader().load_batch(
+            [(item['article'], item['analysis']) for item in items]
+        )
+
+        loaded = []
+        for item, article_id in zip(items, results):
+            if article_id is None:
+                print(f"  ⊘ Article already exists: {item['article']['url']}")
+                self._count('skipped')
+                self._mark_loaded(item)
+                continue
+            self._count('processed')
+            self._mark_loaded(item)
+            loaded.append(item)
+
+        return loaded
+
+    def _define(self, item: Dict) -> Optional[Dict]:
+        analysis = item['analysis']
+        self.definer.define_for_article(
+            analysis.get('concept_names', []),
+            analysis.get('summary_ko', '')
+        )
+        return item
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _reuse_analysis(self, item: Dict) -> bool:
+        """유사 기사가 있으면 그 분석 결과를 사용 (AI 분석 생략)"""
+        if self.near_duplicates is None:
+            return False
+
+        match = self.near_duplicates.find(item['article'].get('content_simhash'))
+        if match is None:
+            return False
+
+        source = f"article {match['article_id']}" if match['article_id'] else "an article in this run"
+        print(
+            f"  ⊘ Near-duplicate of {source} (distance {match['distance']}), "
+            f"reusing analysis: {item['article']['url']}"
+        )
+        item['analysis'] = dict(match['analysis'])
+        self._count('near_duplicates')
+        self._checkpoint(item, 'analyzed')
+        return True
+
+    def _remember_analysis(self, item: Dict):
+        """같은 실행의 뒤따르는 유사 기사가 재사용할 수 있도록 분석 결과 기억"""
+        if self.near_duplicates is not None:
+            self.near_duplicates.remember(item['article'].get('content_simhash'), item['analysis'])
+
+    def _checkpoint(self, item: Dict, state: str):
+        """작업 큐에 단계 완료 기록"""
+        if self.work_queue is not None:
+            self.work_queue.checkpoint(item, state)
+
+    def _mark_loaded(self, item: Dict):
+        """작업 큐에 적재 완료 기록"""
+        if self.work_queue is not None:
+            self.work_queue.mark_loaded(item)
+
+    def _fail(self, item: Dict, reason: str):
+        """오류 집계 및 작업 큐에 실패 기록 (백오프 후 재시도)"""
+        self._count('errors')
+        record(errors=1)
+        if self.work_queue is None:
+            return
+        try:
+            self.work_queue.fail(item, reason)
+        except Exception as e:
+            # 실패 기록이 안 되면 다음 실행에서 대기 없이 다시 시도될 뿐이므로 워커는 계속 진행
+            print(f"  ✗ Failed to record failure for {item['article'].get('url')}: {e}")
+
+    def _loader(self) -> DBLoader:
+        """현재 워커 스레드 전용 DBLoader 반환"""
+        loader = getattr(self._local, 'loader', None)
+        if loader is None:
+            loader = self.loader_factory()
+            self._local.loader = loader
+        return loader
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            'items': 0,
+            'processed': 0,
+            'skipped': 0,
+            'errors': 0,
+            'near_duplicates': 0,
+            'filtered': 0,
+            'resumed': 0
+        }
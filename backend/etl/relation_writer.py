@@ -0,0 +1,132 @@
+"""
+개념 관계 기록기
+
+Concept_Relation 행을 배치 단위로 upsert합니다.
+같은 (시작 개념, 도착 개념, 관계 타입)이 이미 있으면 새 행을 만들지 않고
+strength만 더 큰 값으로 갱신합니다. 쓰기는 유니크 키 기준 upsert 한 번이므로
+여러 워커(개념 정의기, 증분 관계 갱신기)가 같은 관계를 동시에 써도 중복 행이 생기지 않습니다.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import tuple_, update
+
+from app.extensions import db
+from app.models import Article, Article_Concept, Concept_Relation
+from etl.bulk_ops import chunked, upsert_max
+
+
+# (from_concept_id, to_concept_id, relation_type)
+RelationKey = Tuple[int, int, str]
+
+
+class RelationWriter:
+    """Concept_Relation 배치 upsert (활성화된 앱 컨텍스트 안에서 사용)"""
+
+    def __init__(self):
+        self._pending: Dict[RelationKey, int] = {}
+
+    def add(self, from_concept_id: int, to_concept_id: int, relation_type: str, strength: int):
+        """
+        관계 추가 (flush() 전까지 메모리에 모음)
+
+        같은 관계가 여러 번 추가되면 가장 큰 strength만 남깁니다.
+        자기 자신을 향하는 관계는 무시합니다.
+        """
+        if from_concept_id == to_concept_id:
+            return
+
+        key = (from_concept_id, to_concept_id, relation_type)
+        strength = max(1, min(10, int(strength)))
+        if strength > self._pending.get(key, 0):
+            self._pending[key] = strength
+
+    def flush(self) -> Dict[str, int]:
+        """
+        모은 관계를 DB에 반영 (커밋은 호출자가 수행)
+
+        기존 관계 조회는 통계와 바뀐 개념 계산에만 사용하고, 쓰기는 upsert_max()로 합니다
+        (조회와 쓰기 사이에 다른 워커가 같은 관계를 넣어도 strength가 큰 값으로 합쳐짐).
+
+        Returns:
+            dict: {'inserted': int, 'updated': int, 'concept_ids': 관계가 바뀐 개념 ID set}
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return {'inserted': 0, 'updated': 0, 'concept_ids': set()}
+
+        existing = self._fetch_existing(list(pending))
+
+        inserted_keys = [key for key in pending if key not in existing]
+        updated_keys = [key for key in pending if key in existing and pending[key] > existing[key]]
+
+        upsert_max(
+            Concept_Relation,
+            [
+                {
+                    'from_concept_id': from_id,
+                    'to_concept_id': to_id,
+                    'relation_type': relation_type,
+                    'strength': pending[(from_id, to_id, relation_type)]
+                }
+                for from_id, to_id, relation_type in sorted(inserted_keys + updated_keys)
+            ],
+            keys=['from_concept_id', 'to_concept_id', 'relation_type'],
+            column='strength'
+        )
+
+        concept_ids = set()
+        for key in inserted_keys + updated_keys:
+            concept_ids.update(key[:2])
+        return {'inserted': len(inserted_keys), 'updated': len(updated_keys), 'concept_ids': concept_ids}
+
+    @staticmethod
+    def invalidate_graph_caches(concept_ids: Iterable[int]) -> int:
+        """
+        관계가 바뀐 개념을 포함하는 기사의 graph_cache 삭제 (다음 조회 시 재생성)
+
+        Args:
+            concept_ids (iterable): 관계가 바뀐 개념 ID들
+
+        Returns:
+            int: 캐시가 삭제된 기사 수
+        """
+        concept_ids = sorted(set(concept_ids))
+        cleared = 0
+
+        for chunk in chunked(concept_ids):
+            article_ids = db.session.query(Article_Concept.article_id).filter(
+                Article_Concept.concept_id.in_(chunk)
+            )
+            result = db.session.execute(
+                update(Article)
+                .where(Article.article_id.in_(article_ids.scalar_subquery()))
+                .where(Article.graph_cache.isnot(None))
+                .values(graph_cache=None)
+                .execution_options(synchronize_session=False)
+            )
+            cleared += result.rowcount or 0
+
+        return cleared
+
+    @staticmethod
+    def _fetch_existing(keys: List[RelationKey]) -> Dict[RelationKey, int]:
+        """이미 저장된 관계 조회 → {key: strength}"""
+        existing: Dict[RelationKey, int] = {}
+
+        for chunk in chunked(keys):
+            pairs: Set[Tuple[int, int]] = {(from_id, to_id) for from_id, to_id, _ in chunk}
+            rows = db.session.query(
+                Concept_Relation.from_concept_id,
+                Concept_Relation.to_concept_id,
+                Concept_Relation.relation_type,
+                Concept_Relation.strength
+            ).filter(
+                tuple_(Concept_Relation.from_concept_id, Concept_Relation.to_concept_id).in_(pairs)
+            ).all()
+
+            for from_id, to_id, relation_type, strength in rows:
+                key = (from_id, to_id, relation_type)
+                existing[key] = max(strength, existing.get(key, 0))
+
+        return existing
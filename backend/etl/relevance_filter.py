@@ -0,0 +1,128 @@
+"""
+기사 관련도 사전 필터
+
+GNews 'technology' 카테고리에는 할인 정보, 제품 루머처럼 개념을 거의 만들지 않는
+기사도 섞여 있습니다. 유료 AI 분석 전에 본문의 기술 용어 밀도를 로컬에서 계산해
+기준 미만인 기사는 분석하지 않고 건너뜁니다.
+
+- 용어 사전: SimilarityCalculator.TECH_KEYWORDS + DB에 저장된 개념 이름
+- 점수: 본문 100단어당 용어 등장 횟수 (여러 단어 용어는 최장 일치로 한 번만 셈)
+- 건너뛴 기사는 저장하지 않으므로 다음 실행에서 다시 후보가 됩니다
+  (그 사이 개념 사전이 늘어나면 통과할 수 있음)
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.extensions import db
+from app.models import Concept
+from etl.similarity_calculator import SimilarityCalculator
+
+
+# 용어 사전에 넣을 최대 단어 수 (이보다 긴 개념 이름은 본문에 그대로 나올 가능성이 낮음)
+MAX_TERM_WORDS = 4
+
+_NON_WORD_PATTERN = re.compile(r'[^a-zA-Z0-9가-힣\s]')
+
+
+def normalize_words(text: str) -> List[str]:
+    """소문자 + 특수문자 제거 후 단어 분리 (SimilarityCalculator.tokenize와 같은 정규화)"""
+    return _NON_WORD_PATTERN.sub(' ', (text or '').lower()).split()
+
+
+class RelevanceFilter:
+    """기술 용어 밀도 기반 기사 관련도 점수기 (읽기 전용, 스레드 간 공유 가능)"""
+
+    def __init__(self, terms: Iterable[str], threshold: float = 1.0, min_terms: int = 2):
+        """
+        Args:
+            terms (iterable): 기술 용어 (개념 이름 등)
+            threshold (float): 통과에 필요한 최소 점수 (100단어당 용어 등장 횟수)
+            min_terms (int): 통과에 필요한 서로 다른 용어 수
+        """
+        self.threshold = threshold
+        self.min_terms = max(0, min_terms)
+
+        self._terms: Set[Tuple[str, ...]] = set()
+        for term in terms:
+            words = tuple(normalize_words(term))
+            if not words or len(words) > MAX_TERM_WORDS:
+                continue
+            # 한 글자 단어 하나짜리 개념 이름('c', 'r' 등)은 일반 단어와 구분할 수 없음
+            if len(words) == 1 and len(words[0]) < 2:
+                continue
+            self._terms.add(words)
+
+        self._max_words = max((len(words) for words in self._terms), default=1)
+
+    @classmethod
+    def from_database(cls, threshold: float = 1.0, min_terms: int = 2) -> 'RelevanceFilter':
+        """
+        TECH_KEYWORDS와 DB의 모든 개념 이름으로 필터 생성 (앱 컨텍스트 안에서 호출)
+        """
+        names = [name for (name,) in db.session.query(Concept.name)]
+        return cls(
+            list(SimilarityCalculator.TECH_KEYWORDS) + names,
+            threshold=threshold,
+            min_terms=min_terms
+        )
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._terms)
+
+    def score(self, text: str) -> Tuple[float, int]:
+        """
+        본문 관련도 점수
+
+        Args:
+            text (str): 기사 본문
+
+        Returns:
+            tuple: (100단어당 용어 등장 횟수, 서로 다른 용어 수)
+        """
+        words = normalize_words(text)
+        if not words:
+            return 0.0, 0
+
+        hits = 0
+        matched = set()
+        position = 0
+        while position < len(words):
+            term = self._longest_term(words, position)
+            if term is None:
+                position += 1
+                continue
+            hits += 1
+            matched.add(term)
+            position += len(term)
+
+        return hits * 100.0 / len(words), len(matched)
+
+    def is_relevant(self, text: str) -> bool:
+        """분석할 가치가 있는 기사인지 여부"""
+        return self.passes(*self.score(text))
+
+    def passes(self, density: float, distinct: int) -> bool:
+        """score() 결과가 기준을 넘는지 여부"""
+        return density >= self.threshold and distinct >= self.min_terms
+
+    def rank(self, texts: Dict[str, str]) -> List[Tuple[str, float]]:
+        """
+        본문들을 점수 순으로 정렬
+
+        Args:
+            texts (dict): {키(URL 등): 본문}
+
+        Returns:
+            list: [(키, 점수), ...] 점수 내림차순
+        """
+        scored = [(key, self.score(text)[0]) for key, text in texts.items()]
+        return sorted(scored, key=lambda entry: entry[1], reverse=True)
+
+    def _longest_term(self, words: List[str], position: int) -> Optional[Tuple[str, ...]]:
+        for length in range(min(self._max_words, len(words) - position), 0, -1):
+            candidate = tuple(words[position:position + length])
+            if candidate in self._terms:
+                return candidate
+        return None
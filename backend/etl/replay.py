@@ -0,0 +1,333 @@
+"""
+ETL 코퍼스 재생 벤치마크
+
+기록된 코퍼스(etl/corpus.py)를 네트워크 없이 현재 코드로 다시 처리해
+추출 속도, LLM 응답 파싱 성공률, 적재 처리량을 측정합니다.
+같은 코퍼스를 코드 버전마다 재생하고 --save로 결과를 남기면 버전 간 비교가 가능합니다.
+
+- extract: 원본 HTML → BeautifulSoup → WebScraper._extract_text (기록 당시 본문과 일치 여부 포함)
+- stream:  원본 HTML → StreamingTextExtractor (스트리밍 스크래핑 경로)
+- parse:   LLM 응답 → AIAnalyzer._parse_response / _parse_batch_response
+- load:    GNews 기사 + 재생한 분석 결과 → DBLoader.load_batch (반복마다 새 임시 SQLite DB)
+
+단계 안의 print 출력은 측정에서 제외하기 위해 숨깁니다.
+시간은 --repeat 회 중 가장 빠른 값입니다.
+
+사용법:
+    python -m etl.run --record-corpus my-corpus        # 실제 실행을 코퍼스로 기록
+    python -m etl.replay my-corpus --repeat 3 --save   # 재생 및 결과 저장
+    python -m etl.replay my-corpus --history           # 저장된 재생 결과 비교
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from app import create_app
+from app import models  # noqa: F401  (create_all 대상 모델 등록)
+from app.extensions import db
+from etl.ai_analyzer import AIAnalyzer
+from etl.bulk_ops import chunked
+from etl.corpus import Corpus, code_version, text_digest
+from etl.db_loader import DBLoader
+from etl.fingerprint import simhash
+from etl.gnews_fetcher import GNewsFetcher
+from etl.html_extractor import StreamingTextExtractor
+from etl.web_scraper import WebScraper
+
+
+STAGES = ('extract', 'stream', 'parse', 'load')
+
+
+def _timed(func, repeat: int):
+    """func()를 repeat회 실행 (출력 숨김) → (가장 빠른 시간, 마지막 결과)"""
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _output_digest(values: List[str]) -> str:
+    """출력 전체의 짧은 해시 (코드 버전 간 결과가 바뀌었는지 확인용)"""
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update((value or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+def replay_extract(pages: List[Dict], repeat: int) -> Tuple[Dict, List[str]]:
+    """
+    BeautifulSoup 추출 재생
+
+    Returns:
+        tuple: (결과 통계, 페이지 순서대로 추출한 본문)
+    """
+    scraper = WebScraper()
+    try:
+        seconds, texts = _timed(
+            lambda: [scraper._extract_text(BeautifulSoup(page['raw_html'], 'html.parser')) for page in pages],
+            repeat
+        )
+    finally:
+        scraper.close()
+
+    total_bytes = sum(len(page['raw_html']) for page in pages)
+    return {
+        'pages': len(pages),
+        'seconds': round(seconds, 4),
+        'pages_per_second': round(len(pages) / seconds, 2) if seconds else 0.0,
+        'mb_per_second': round(total_bytes / 1e6 / seconds, 2) if seconds else 0.0,
+        'empty': sum(1 for text in texts if not text),
+        'matches_recorded': sum(
+            1 for page, text in zip(pages, texts) if text_digest(text) == page['text_sha256']
+        ),
+        'output': _output_digest(texts)
+    }, texts
+
+
+def replay_stream(pages: List[Dict], repeat: int) -> Dict:
+    """StreamingTextExtractor 추출 재생 (문서 전체를 한 번에 입력)"""
+    def run():
+        texts = []
+        for page in pages:
+            raw_html = page['raw_html']
+            extractor = StreamingTextExtractor()
+            extractor.feed(raw_html.decode(WebScraper._detect_encoding(None, raw_html), errors='replace'))
+            extractor.close()
+            texts.append(extractor.get_text())
+        return texts
+
+    seconds, texts = _timed(run, repeat)
+    return {
+        'pages': len(pages),
+        'seconds': round(seconds, 4),
+        'pages_per_second': round(len(pages) / seconds, 2) if seconds else 0.0,
+        'empty': sum(1 for text in texts if not text),
+        'matches_recorded': sum(
+            1 for page, text in zip(pages, texts) if text_digest(text) == page['text_sha256']
+        ),
+        'output': _output_digest(texts)
+    }
+
+
+def replay_parse(responses: List[Dict], repeat: int) -> Tuple[Dict, Dict[str, Dict]]:
+    """
+    LLM 응답 파싱 재생
+
+    Returns:
+        tuple: (결과 통계, {본문 sha256: 검증된 분석 결과})
+    """
+    analyzer = AIAnalyzer(api_key='replay')
+    analyzer.save_debug_responses = False
+
+    def run():
+        parsed = []
+        for response in responses:
+            if response['kind'] == 'batch':
+                results = analyzer._parse_batch_response(response['content'], len(response['text_sha256']))
+            else:
+                results = [analyzer._parse_response(response['content'])]
+            parsed.append(results)
+        return parsed
+
+    seconds, parsed = _timed(run, repeat)
+
+    analyses: Dict[str, Dict] = {}
+    expected = valid = 0
+    outputs = []
+    for response, results in zip(responses, parsed):
+        for digest, analysis in zip(response['text_sha256'], results):
+            expected += 1
+            outputs.append(repr(sorted(analysis.items())) if analysis else '')
+            if analysis:
+                valid += 1
+                analyses.setdefault(digest, analysis)
+
+    return {
+        'responses': len(responses),
+        'articles': expected,
+        'valid': valid,
+        'success_rate': round(valid / expected, 4) if expected else 0.0,
+        'seconds': round(seconds, 4),
+        'responses_per_second': round(len(responses) / seconds, 2) if seconds else 0.0,
+        'output': _output_digest(outputs)
+    }, analyses
+
+
+def replay_load(
+    items: List[Tuple[Dict, Dict]],
+    repeat: int,
+    batch_size: int,
+    database_url: Optional[str]
+) -> Dict:
+    """
+    DBLoader 적재 재생
+
+    database_url이 없으면 반복마다 새 임시 SQLite DB를 만들고,
+    있으면 그 DB에 한 번만 적재합니다 (이미 있는 기사는 건너뜀).
+    """
+    workdir = tempfile.mkdtemp(prefix='etl-replay-')
+    runs = 1 if database_url else max(1, repeat)
+    best = None
+    loaded = 0
+
+    try:
+        for run_no in range(runs):
+            url = database_url or f"sqlite:///{os.path.join(workdir, f'replay-{run_no}.db')}"
+            app = create_app('development', SQLALCHEMY_DATABASE_URI=url)
+            with app.app_context():
+                if url.startswith('sqlite'):
+                    db.create_all()
+
+            loader = DBLoader(app.app_context())
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                results = []
+                for chunk in chunked(items, batch_size):
+                    results.extend(loader.load_batch(chunk))
+                elapsed = time.perf_counter() - started
+
+            with app.app_context():
+                db.engine.dispose()
+
+            loaded = sum(1 for article_id in results if article_id is not None)
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'articles': len(items),
+        'loaded': loaded,
+        'batch_size': batch_size,
+        'seconds': round(best or 0.0, 4),
+        'articles_per_second': round(len(items) / best, 2) if best else 0.0
+    }
+
+
+def load_items(corpus: Corpus, pages: List[Dict], texts: List[str], analyses: Dict[str, Dict]) -> List[Tuple[Dict, Dict]]:
+    """기록된 GNews 기사 정보와 재생한 분석 결과를 URL/본문 해시로 연결해 적재 항목 생성"""
+    articles = {}
+    for record in corpus.gnews_responses():
+        for article in GNewsFetcher.parse_articles(record['response']):
+            articles.setdefault(article['url'], article)
+
+    items = []
+    for page, text in zip(pages, texts):
+        analysis = analyses.get(page['text_sha256'])
+        if analysis is None:
+            continue
+        article = articles.get(page['url']) or {'url': page['url'], 'title': page['url'][:255]}
+        items.append((dict(article, content_simhash=simhash(text)), dict(analysis)))
+    return items
+
+
+def replay(corpus: Corpus, stages, repeat: int = 1, load_batch_size: int = 10, database_url: Optional[str] = None) -> Dict:
+    """
+    코퍼스 재생
+
+    Returns:
+        dict: {'corpus', 'code_version', 'replayed_at', 'repeat', 'stages': {stage: 결과}}
+    """
+    pages = list(corpus.iter_pages_with_html())
+    responses = corpus.llm_responses()
+    results: Dict[str, Dict] = {}
+
+    texts = None
+    if 'extract' in stages or 'load' in stages:
+        extract_result, texts = replay_extract(pages, repeat if 'extract' in stages else 1)
+        if 'extract' in stages:
+            results['extract'] = extract_result
+
+    if 'stream' in stages:
+        results['stream'] = replay_stream(pages, repeat)
+
+    analyses = {}
+    if 'parse' in stages or 'load' in stages:
+        parse_result, analyses = replay_parse(responses, repeat if 'parse' in stages else 1)
+        if 'parse' in stages:
+            results['parse'] = parse_result
+
+    if 'load' in stages:
+        items = load_items(corpus, pages, texts, analyses)
+        results['load'] = replay_load(items, repeat, load_batch_size, database_url)
+
+    return {
+        'corpus': corpus.name,
+        'code_version': code_version(),
+        'replayed_at': datetime.utcnow().isoformat(timespec='seconds'),
+        'repeat': repeat,
+        'stages': results
+    }
+
+
+def print_result(result: Dict):
+    print(f"[{result['replayed_at']}] code {result['code_version'] or 'unknown'}, repeat {result['repeat']}")
+    for stage, stats in result['stages'].items():
+        details = ', '.join(f"{key}={value}" for key, value in stats.items())
+        print(f"  {stage:<8} {details}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ETL 코퍼스 재생 벤치마크')
+    parser.add_argument('corpus', help='코퍼스 이름(ETL_CORPUS_DIR 아래) 또는 디렉토리 경로')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수 (가장 빠른 시간 사용)')
+    parser.add_argument('--load-batch-size', type=int, default=10)
+    parser.add_argument('--database-url', help='적재 재생에 사용할 DB (기본값: 반복마다 새 임시 SQLite)')
+    parser.add_argument('--save', action='store_true', help='결과를 코퍼스의 replays.jsonl에 추가')
+    parser.add_argument('--history', action='store_true', help='저장된 재생 결과만 출력')
+    args = parser.parse_args()
+
+    corpus = Corpus(args.corpus)
+    manifest = corpus.manifest
+    print("=" * 70)
+    print(
+        f"Corpus '{corpus.name}' (recorded {manifest.get('created_at')}, code {manifest.get('code_version')}): "
+        f"{manifest['counts']['pages']} pages, {manifest['counts']['llm']} LLM responses"
+    )
+    print("=" * 70)
+
+    if args.history:
+        for result in corpus.replays():
+            print_result(result)
+        return
+
+    recorded_versions = manifest.get('prompt_versions') or []
+    current_versions = [AIAnalyzer.PROMPT_VERSION, AIAnalyzer.BATCH_PROMPT_VERSION]
+    if not set(recorded_versions) <= set(current_versions):
+        print(
+            f"⊘ Responses were recorded with prompt version(s) {recorded_versions}, "
+            f"current is {current_versions}"
+        )
+
+    result = replay(
+        corpus,
+        args.stages,
+        repeat=args.repeat,
+        load_batch_size=args.load_batch_size,
+        database_url=args.database_url
+    )
+    print_result(result)
+
+    if args.save:
+        corpus.save_replay(result)
+        print(f"✓ Saved to {os.path.join(corpus.path, 'replays.jsonl')}")
+
+
+if __name__ == "__main__":
+    main()
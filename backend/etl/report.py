@@ -0,0 +1,150 @@
+"""
+ETL 실행 기록 리포트
+
+etl_runs.jsonl(etl/metrics.py)에 쌓인 실행 기록을 단계별로 집계합니다.
+지연 시간은 span 하나의 처리 시간을 그 span의 항목 수로 나눈 기사당 시간이며,
+배치 단계는 배치 하나가 하나의 표본입니다.
+
+사용법:
+    python -m etl.report                         # 전체 실행 기록
+    python -m etl.report --last 20               # 최근 20회
+    python -m etl.report --prompt-price 0.25 --completion-price 1.25   # 토큰 100만 개당 USD
+"""
+
+import argparse
+import math
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from etl.metrics import COUNTERS, load_runs
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    nearest-rank 백분위수
+
+    Args:
+        values (list): 표본
+        pct (float): 0~100
+
+    Returns:
+        float: 백분위수 (표본이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(
+    runs: List[Dict],
+    prompt_price: float = 0.0,
+    completion_price: float = 0.0
+) -> Dict:
+    """
+    실행 기록 집계
+
+    Args:
+        runs (list): load_runs() 결과
+        prompt_price (float): 입력 토큰 100만 개당 가격 (USD)
+        completion_price (float): 출력 토큰 100만 개당 가격 (USD)
+
+    Returns:
+        dict: {
+            'runs': int,
+            'seconds': float (실행 시간 합계),
+            'processed': int,
+            'articles_per_minute': float,
+            'stages': {stage: {'spans', 'items', 'p50', 'p95', 'seconds', 'share', 'cost', COUNTERS...}}
+        }
+    """
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    stages: Dict[str, Dict[str, float]] = {}
+
+    for run in runs:
+        for span in run.get('spans', []):
+            stage = stages.setdefault(span['stage'], dict.fromkeys(('spans', 'items', 'seconds') + COUNTERS, 0))
+            items = max(1, span.get('items', 1))
+            stage['spans'] += 1
+            stage['items'] += items
+            stage['seconds'] += span.get('seconds', 0.0)
+            for key in COUNTERS:
+                stage[key] += span.get(key, 0)
+            latencies[span['stage']].append(span.get('seconds', 0.0) / items)
+
+    stage_seconds = sum(stage['seconds'] for stage in stages.values()) or 1.0
+    for name, stage in stages.items():
+        stage['p50'] = percentile(latencies[name], 50)
+        stage['p95'] = percentile(latencies[name], 95)
+        stage['share'] = stage['seconds'] / stage_seconds
+        stage['cost'] = (
+            stage['prompt_tokens'] * prompt_price + stage['completion_tokens'] * completion_price
+        ) / 1_000_000
+
+    seconds = sum(run.get('seconds', 0.0) for run in runs)
+    processed = sum(run.get('summary', {}).get('processed', 0) for run in runs)
+    return {
+        'runs': len(runs),
+        'seconds': seconds,
+        'processed': processed,
+        'articles_per_minute': processed / seconds * 60 if seconds else 0.0,
+        'stages': stages
+    }
+
+
+def print_report(report: Dict, show_cost: bool = False):
+    """summarize() 결과를 표로 출력"""
+    print("=" * 100)
+    print(
+        f"ETL runs: {report['runs']}, {report['processed']} articles processed in "
+        f"{report['seconds']:.1f}s ({report['articles_per_minute']:.2f} articles/min)"
+    )
+    print("=" * 100)
+
+    header = (
+        f"{'stage':<10}{'items':>7}{'p50 s':>9}{'p95 s':>9}{'total s':>10}{'share':>7}"
+        f"{'KiB':>9}{'prompt':>10}{'compl.':>9}{'retry':>7}{'cache':>7}{'err':>6}"
+    )
+    if show_cost:
+        header += f"{'USD':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for name, stage in report['stages'].items():
+        line = (
+            f"{name:<10}{stage['items']:>7}{stage['p50']:>9.2f}{stage['p95']:>9.2f}"
+            f"{stage['seconds']:>10.1f}{stage['share']:>7.0%}{stage['bytes'] / 1024:>9.0f}"
+            f"{stage['prompt_tokens']:>10}{stage['completion_tokens']:>9}"
+            f"{stage['retries']:>7}{stage['cache_hits']:>7}{stage['errors']:>6}"
+        )
+        if show_cost:
+            line += f"{stage['cost']:>10.4f}"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='ETL 실행 기록 단계별 리포트')
+    parser.add_argument('--path', help='실행 기록 파일 (기본값: ETL_CACHE_DIR/etl_runs.jsonl)')
+    parser.add_argument('--last', type=int, help='최근 실행 몇 개만 집계')
+    parser.add_argument('--kind', choices=('run', 'daemon', 'worker', 'benchmark'), help='이 종류의 실행만 집계')
+    parser.add_argument('--prompt-price', type=float, default=0.0, help='입력 토큰 100만 개당 USD')
+    parser.add_argument('--completion-price', type=float, default=0.0, help='출력 토큰 100만 개당 USD')
+    args = parser.parse_args(argv)
+
+    runs = load_runs(args.path)
+    if args.kind:
+        runs = [run for run in runs if run.get('kind') == args.kind]
+    if args.last:
+        runs = runs[-args.last:]
+
+    if not runs:
+        print("⊘ No ETL runs recorded.")
+        return
+
+    report = summarize(runs, args.prompt_price, args.completion_price)
+    print_report(report, show_cost=bool(args.prompt_price or args.completion_price))
+
+
+if __name__ == "__main__":
+    main()
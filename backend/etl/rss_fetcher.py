@@ -0,0 +1,319 @@
+"""
+RSS/Atom 피드 수집기
+
+GNewsFetcher와 같은 형식({'title', 'url', 'description', 'published_at', 'source'})의 기사 목록을
+언론사 RSS 2.0 / Atom 피드에서 가져옵니다. GNews API 할당량을 쓰지 않으므로 수집량을 늘리는 데 사용합니다.
+
+- 응답을 스트리밍으로 받으면서 XMLPullParser에 넘겨 item/entry 단위로 처리 (문서 전체 트리를 만들지 않음)
+- 피드별 ETag/Last-Modified를 ETL_CACHE_DIR/rss_state.json에 저장하고 다음 조회에서
+  If-None-Match/If-Modified-Since로 보내므로, 바뀌지 않은 피드는 304 응답 하나로 끝남
+- 여러 피드를 연결 풀을 공유하는 스레드로 동시에 조회하고, 정규화 URL 기준으로 중복 제거 후 최신순 정렬
+
+피드 목록은 생성자 인자 또는 ETL_RSS_FEEDS 환경 변수(쉼표 구분 URL)로 지정합니다.
+"""
+
+import html
+import json
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.utils.url_utils import canonicalize_url
+
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _local_name(tag: str) -> str:
+    """'{namespace}name' → 'name'"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def normalize_published_at(value: Optional[str]) -> str:
+    """
+    RFC 822(RSS pubDate) 또는 ISO 8601(Atom) 시각을 GNews 형식 UTC 문자열로 변환
+
+    Returns:
+        str: 예: '2024-01-01T12:00:00Z' (해석할 수 없으면 빈 문자열)
+    """
+    value = (value or '').strip()
+    if not value:
+        return ''
+
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            published = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return ''
+
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _plain_text(value: Optional[str], limit: int = 500) -> str:
+    """description/summary의 HTML 태그와 엔티티 제거"""
+    text = _SPACE_RE.sub(' ', html.unescape(_TAG_RE.sub(' ', value or ''))).strip()
+    return text[:limit]
+
+
+class RSSFetcher:
+    """RSS/Atom 피드 기사 수집 클래스"""
+
+    def __init__(
+        self,
+        feed_urls: Optional[List[str]] = None,
+        state_path: Optional[str] = None,
+        max_workers: int = 4,
+        timeout: float = 10.0
+    ):
+        """
+        Args:
+            feed_urls (list, optional): 피드 URL 목록. None이면 ETL_RSS_FEEDS 환경 변수 (쉼표 구분)
+            state_path (str, optional): 조건부 요청 상태 파일. None이면 ETL_CACHE_DIR(기본 '.etl_cache')/rss_state.json
+            max_workers (int): 동시 요청 수 (연결 풀 크기)
+            timeout (float): 요청 타임아웃 (초)
+        """
+        if feed_urls is None:
+            feed_urls = [url.strip() for url in os.getenv('ETL_RSS_FEEDS', '').split(',') if url.strip()]
+        self.feed_urls = list(dict.fromkeys(feed_urls))
+
+        if state_path is None:
+            cache_dir = os.getenv('ETL_CACHE_DIR', '.etl_cache')
+            os.makedirs(cache_dir, exist_ok=True)
+            state_path = os.path.join(cache_dir, 'rss_state.json')
+        self.state_path = state_path
+
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.stats = {'requests': 0, 'not_modified': 0, 'failed': 0, 'duplicates': 0}
+
+        self._state = self._load_state()
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; TechExplainedBot/1.0)',
+            'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8'
+        })
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
+
+    def fetch_articles(
+        self,
+        max_results: Optional[int] = None,
+        published_after: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        모든 피드에서 새 기사 가져오기 (바뀌지 않은 피드는 304로 건너뜀)
+
+        Args:
+            max_results (int, optional): 피드당 최대 기사 수 (None이면 피드에 있는 만큼).
+                                         잘린 피드는 검증자를 저장하지 않으므로 다음 조회에서 다시 전체를 받음
+            published_after (str, optional): 이 시각(GNews 형식 UTC, 예: '2024-01-01T00:00:00Z') 이후에
+                                             발행된 기사만 (발행 시각이 없는 기사는 포함)
+
+        Returns:
+            List[Dict]: GNewsFetcher.fetch_articles()와 같은 형식 (url은 원본 그대로, 최신순)
+        """
+        if not self.feed_urls:
+            return []
+
+        results = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.feed_urls)),
+            thread_name_prefix='rss'
+        ) as executor:
+            futures = [(url, executor.submit(self.fetch_feed, url, max_results)) for url in self.feed_urls]
+            for url, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    with self._lock:
+                        self.stats['failed'] += 1
+                    print(f"  ✗ RSS feed {url} failed: {e}")
+
+        self._save_state()
+
+        merged = {}
+        for articles in results:
+            for article in articles:
+                if published_after and article['published_at'] and article['published_at'] <= published_after:
+                    continue
+                key = canonicalize_url(article['url'])
+                if key in merged:
+                    self.stats['duplicates'] += 1
+                    continue
+                merged[key] = article
+
+        articles = sorted(merged.values(), key=lambda article: article['published_at'], reverse=True)
+        print(f"✓ Fetched {len(articles)} articles from {len(self.feed_urls)} RSS/Atom feeds")
+        return articles
+
+    def fetch_feed(self, feed_url: str, max_results: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        피드 하나 조회 (조건부 요청)
+
+        Returns:
+            List[Dict]: 피드의 기사 목록 (304면 빈 리스트)
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패
+            xml.etree.ElementTree.ParseError: 피드 XML 오류
+        """
+        with self._lock:
+            validators = dict(self._state.get(feed_url, {}))
+            self.stats['requests'] += 1
+
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        with self.session.get(feed_url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304:
+                with self._lock:
+                    self.stats['not_modified'] += 1
+                print(f"  ⊘ RSS feed not modified: {feed_url}")
+                return []
+            response.raise_for_status()
+
+            articles = self.parse_feed(response.iter_content(chunk_size=16 * 1024), max_results)
+
+            # 끝까지 파싱한 뒤에만 검증자 저장 (실패한 피드는 다음에 다시 전체 조회).
+            # max_results에서 잘렸으면 읽지 않은 기사가 304에 가려지지 않도록 검증자를 지움
+            truncated = max_results is not None and len(articles) >= max_results
+            validators = {
+                'etag': None if truncated else response.headers.get('ETag'),
+                'last_modified': None if truncated else response.headers.get('Last-Modified')
+            }
+
+        with self._lock:
+            if validators['etag'] or validators['last_modified']:
+                self._state[feed_url] = validators
+            else:
+                self._state.pop(feed_url, None)
+        return articles
+
+    @staticmethod
+    def parse_feed(chunks, max_results: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        RSS 2.0 / Atom 문서를 스트리밍으로 파싱
+
+        item/entry가 끝날 때마다 기사 하나를 만들고 그 요소를 비워서 메모리를 일정하게 유지합니다.
+        max_results개를 채우면 나머지 문서는 읽지 않습니다.
+
+        Args:
+            chunks (iterable): bytes 조각 (예: response.iter_content())
+            max_results (int, optional): 최대 기사 수
+
+        Returns:
+            List[Dict]: [{'title', 'url', 'description', 'published_at', 'source'}, ...] (문서 순서)
+        """
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        path: List[str] = []
+        feed_title = ''
+        articles = []
+        done = False
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                name = _local_name(element.tag)
+                if event == 'start':
+                    path.append(name)
+                    continue
+                path.pop()
+
+                parent = path[-1] if path else ''
+                if name == 'title' and parent in ('channel', 'feed') and not feed_title:
+                    feed_title = (element.text or '').strip()
+                elif name in ('item', 'entry'):
+                    article = RSSFetcher._parse_entry(element)
+                    element.clear()
+                    if article is not None:
+                        articles.append(article)
+                        done = max_results is not None and len(articles) >= max_results
+                        if done:
+                            break
+            if done:
+                break
+
+        if not done:
+            parser.close()
+
+        for article in articles:
+            article['source'] = feed_title or 'Unknown'
+        return articles
+
+    @staticmethod
+    def _parse_entry(element) -> Optional[Dict[str, str]]:
+        """RSS item 또는 Atom entry 요소 → 기사 dict (링크가 없으면 None)"""
+        fields: Dict[str, str] = {}
+        url = ''
+
+        for child in element:
+            name = _local_name(child.tag)
+            text = (child.text or '').strip()
+
+            if name == 'link':
+                # RSS: <link>URL</link>, Atom: <link rel="alternate" href="URL"/>
+                href = child.get('href')
+                if href is None:
+                    url = url or text
+                elif child.get('rel', 'alternate') == 'alternate':
+                    url = url or href.strip()
+            elif name == 'guid' and not url and child.get('isPermaLink', 'true') == 'true' and text.startswith('http'):
+                url = text
+            elif name == 'encoded' or (name == 'content' and child.tag.startswith(ATOM_NS)):
+                fields.setdefault('content', text)
+            elif name in ('title', 'description', 'summary', 'pubDate', 'published', 'updated', 'date'):
+                fields.setdefault(name, text)
+
+        if not url:
+            return None
+
+        published = (
+            fields.get('pubDate') or fields.get('published') or fields.get('date') or fields.get('updated')
+        )
+        return {
+            'title': _plain_text(fields.get('title'), 255) or 'No title',
+            'url': url,
+            'description': _plain_text(fields.get('description') or fields.get('summary') or fields.get('content')),
+            'published_at': normalize_published_at(published),
+            'source': ''
+        }
+
+    def _load_state(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        with self._lock:
+            state = dict(self._state)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
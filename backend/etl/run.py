@@ -4,27 +4,41 @@ ETL 파이프라인 실행 스크립트
 뉴스 수집, 분석, 데이터베이스 적재를 수행합니다.
 
 사용법:
-    python -m etl.run
+    python -m etl.run                                  # 한 번 실행
+    python -m etl.run --daemon --interval 900          # 주기적으로 새 기사 수집 (etl/daemon.py)
+    python -m etl.run --feed technology/us --feed science/gb --feed "q:quantum computing"
+                                                       # 여러 피드를 동시에 조회 (중복 제거 후 최신순)
+    python -m etl.run --rss-feed https://example.com/feed.xml   # RSS/Atom 피드도 함께 수집 (etl/rss_fetcher.py)
+    python -m etl.run --record-corpus my-corpus        # 외부 입력을 코퍼스로 기록 (etl/replay.py로 재생)
     
 또는:
     from etl.run import run_etl_pipeline
     run_etl_pipeline()
 """
 
+import argparse
 import os
+from typing import Dict, List, Optional
+
 from dotenv import load_dotenv
 from flask import current_app
 
 from app import create_app
-from etl.gnews_fetcher import GNewsFetcher
-from etl.web_scraper import WebScraper
-from etl.ai_analyzer import AIAnalyzer
-from etl.db_loader import DBLoader
+from etl.gnews_fetcher import GNewsFetcher, parse_feed_spec
+from etl.rss_fetcher import RSSFetcher
+from etl.url_deduper import UrlDeduplicator
+from etl.components import ETLComponents
+from etl.corpus import CorpusRecorder
+from etl.daemon import ETLDaemon
 
 
-def check_environment():
-    """환경 변수 검증"""
-    required_vars = ['GNEWS_API_KEY', 'OPENROUTER_API_KEY']
+def check_environment(required_vars=('GNEWS_API_KEY', 'OPENROUTER_API_KEY')):
+    """
+    환경 변수 검증
+    
+    Args:
+        required_vars (tuple): 반드시 설정되어 있어야 하는 환경 변수들
+    """
     missing_vars = []
     
     for var in required_vars:
@@ -49,18 +63,75 @@ def check_environment():
     return True
 
 
-def run_etl_pipeline(max_articles: int = 3):
+def run_etl_pipeline(
+    max_articles: int = 3,
+    scrape_concurrency: int = 4,
+    analyze_concurrency: int = 2,
+    load_concurrency: int = 1,
+    analyze_batch_size: int = 1,
+    load_batch_size: int = 1,
+    parse_processes: int = 0,
+    use_scrape_cache: bool = True,
+    use_analysis_cache: bool = True,
+    define_concepts: bool = True,
+    define_concurrency: int = 2,
+    incremental_relations: bool = True,
+    near_duplicate_distance: int = 3,
+    relevance_threshold: float = 1.0,
+    resume: bool = True,
+    record_metrics: bool = True,
+    recorder: Optional[CorpusRecorder] = None,
+    feeds: Optional[List[Dict[str, str]]] = None,
+    rss_feeds: Optional[List[str]] = None
+):
     """
     ETL 파이프라인 실행
     
+    스크래핑, AI 분석, DB 적재 단계가 큐로 연결되어 동시에 진행됩니다.
+    
     Args:
         max_articles (int): 수집할 최대 기사 수
+        scrape_concurrency (int): 스크래핑 워커 수
+        analyze_concurrency (int): AI 분석 워커 수
+        load_concurrency (int): DB 적재 워커 수
+        analyze_batch_size (int): AI 분석 요청 하나에 묶을 기사 수
+        load_batch_size (int): 한 번의 트랜잭션으로 저장할 기사 수
+        parse_processes (int): HTML 파싱 프로세스 수 (0이면 스크래핑 스레드에서 파싱)
+        use_scrape_cache (bool): 스크래핑 디스크 캐시 사용 여부 (ETL_CACHE_DIR)
+        use_analysis_cache (bool): AI 분석 결과 캐시 사용 여부 (ETL_CACHE_DIR)
+        define_concepts (bool): 새 개념 정의 및 개념 관계 생성 여부
+        define_concurrency (int): 개념 정의 워커 수
+        incremental_relations (bool): 새 개념/정의된 개념의 유사도 관계 증분 갱신 여부
+        near_duplicate_distance (int): 본문 SimHash 해밍 거리가 이 값 이하인 기사가 있으면
+                                       AI 분석 대신 그 기사의 분석 결과를 재사용 (음수면 사용 안 함)
+        relevance_threshold (float): 본문 100단어당 기술 용어 수가 이보다 적은 기사는
+                                     AI 분석하지 않고 건너뜀 (0 이하면 사용 안 함)
+        resume (bool): ETL_WorkItem 작업 큐에 단계별 체크포인트를 저장하고,
+                       이전 실행에서 중단/실패한 기사를 마지막 완료 단계부터 이어서 처리
+        record_metrics (bool): 단계별 처리 시간/다운로드 바이트/LLM 토큰/재시도/캐시 적중을
+                               ETL_CACHE_DIR/etl_runs.jsonl에 기록 (python -m etl.report로 집계)
+        recorder (CorpusRecorder, optional): 지정하면 GNews 응답, 원본 HTML, LLM 응답을
+                                             재생용 코퍼스에 기록 (python -m etl.replay로 재생).
+                                             기록 중에는 use_scrape_cache/use_analysis_cache와 관계없이 캐시를 쓰지 않음
+        feeds (list, optional): 동시에 조회할 피드 목록 (GNewsFetcher.fetch_many 형식).
+                                None이면 기본 top-headlines 요청 하나 (max_articles는 피드당 최대 기사 수)
+        rss_feeds (list, optional): 함께 수집할 RSS/Atom 피드 URL. None이면 ETL_RSS_FEEDS 환경 변수
+                                    (API 할당량을 쓰지 않음. 피드에 있는 기사를 모두 가져옴)
         
     Returns:
         dict: {
             'processed': int,
             'skipped': int,
-            'errors': int
+            'errors': int,
+            'duplicates': int,
+            'near_duplicates': int,
+            'filtered': int,
+            'resumed': int,
+            'analysis_cache_hits': int,
+            'analysis_cache_misses': int,
+            'concepts_defined': int,
+            'relations_inserted': int,
+            ...
         }
     """
     print("=" * 70)
@@ -75,102 +146,262 @@ def run_etl_pipeline(max_articles: int = 3):
     print()
     
     # ETL 컴포넌트 초기화
-    fetcher = GNewsFetcher()
-    scraper = WebScraper()
-    analyzer = AIAnalyzer()
-    loader = DBLoader(current_app.app_context())
+    app = current_app._get_current_object()
+    fetcher = GNewsFetcher(recorder=recorder)
+    rss_fetcher = RSSFetcher(rss_feeds)
+    components = ETLComponents(
+        app,
+        scrape_concurrency=scrape_concurrency,
+        analyze_concurrency=analyze_concurrency,
+        load_concurrency=load_concurrency,
+        analyze_batch_size=analyze_batch_size,
+        load_batch_size=load_batch_size,
+        parse_processes=parse_processes,
+        use_scrape_cache=use_scrape_cache,
+        use_analysis_cache=use_analysis_cache,
+        define_concepts=define_concepts,
+        define_concurrency=define_concurrency,
+        incremental_relations=incremental_relations,
+        near_duplicate_distance=near_duplicate_distance,
+        relevance_threshold=relevance_threshold,
+        resume=resume,
+        record_metrics=record_metrics,
+        recorder=recorder
+    )
+    work_queue = components.work_queue
+    analysis_cache = components.analysis_cache
+    if components.relevance_filter is not None:
+        print(
+            f"✓ Relevance filter: {components.relevance_filter.vocabulary_size} terms, "
+            f"threshold {relevance_threshold}"
+        )
     
     # Step 1: 기사 URL 수집
-    print("STEP 1: Fetching articles from GNews API...")
+    print("STEP 1: Fetching articles from GNews API" + (" and RSS/Atom feeds..." if rss_fetcher.feed_urls else "..."))
     print("-" * 70)
     
     try:
-        articles = fetcher.fetch_articles(max_results=max_articles)
+        if feeds:
+            articles = fetcher.fetch_many(feeds, max_results=max_articles)
+        else:
+            articles = fetcher.fetch_articles(max_results=max_articles)
     except Exception as e:
         print(f"\n✗ Failed to fetch articles: {e}")
-        return {'processed': 0, 'skipped': 0, 'errors': 1}
+        if not rss_fetcher.feed_urls:
+            components.close()
+            fetcher.close()
+            rss_fetcher.close()
+            return {'processed': 0, 'skipped': 0, 'errors': 1}
+        articles = []
+    
+    if rss_fetcher.feed_urls:
+        try:
+            articles.extend(rss_fetcher.fetch_articles())
+        finally:
+            rss_fetcher.close()
     
     if not articles:
-        print("\n✗ No articles fetched. Exiting.")
-        return {'processed': 0, 'skipped': 0, 'errors': 0}
+        if work_queue is None:
+            print("\n✗ No articles fetched. Exiting.")
+            components.close()
+            fetcher.close()
+            return {'processed': 0, 'skipped': 0, 'errors': 0}
+        print("\n⊘ No articles fetched. Processing pending work items only.")
+    
+    # 이미 저장된 기사와 중복 기사는 스크래핑 전에 제외
+    deduper = UrlDeduplicator()
+    new_articles = deduper.filter_new(articles)
+    print(
+        f"✓ {len(new_articles)} new articles "
+        f"({deduper.stats['existing']} already in database, "
+        f"{deduper.stats['duplicates']} duplicate URLs)"
+    )
     
     print()
     
-    # Step 2: 각 기사 처리
+    # Step 2: 기사 처리 (스크래핑 → 분석 → 적재 파이프라인)
     print("STEP 2: Processing articles...")
+    print(f"({components.describe()})")
     print("-" * 70)
     
-    processed_count = 0
-    skipped_count = 0
-    error_count = 0
+    try:
+        summary = components.pipeline.run(new_articles)
+    finally:
+        components.close()
+        fetcher.close()
     
-    for idx, article_data in enumerate(articles, 1):
-        print(f"\n[Article {idx}/{len(articles)}]")
-        print(f"Title: {article_data['title']}")
-        print(f"URL: {article_data['url']}")
-        
-        try:
-            # Step 2-1: 웹 스크래핑
-            content = scraper.scrape_article(article_data['url'])
-            
-            if not content:
-                print("  ✗ Failed to scrape content. Skipping.")
-                error_count += 1
-                continue
-            
-            # Step 2-2: AI 분석
-            analysis = analyzer.analyze_article(content)
-            
-            if not analysis:
-                print("  ✗ Failed to analyze content. Skipping.")
-                error_count += 1
-                continue
-            
-            # Step 2-3: 데이터베이스 적재
-            print("  ⟳ Saving to database...")
-            
-            result = loader.load_article_data(
-                article_data=article_data,
-                analysis=analysis
-            )
-            
-            if result:
-                processed_count += 1
-            else:
-                skipped_count += 1
-        
-        except Exception as e:
-            print(f"  ✗✗ Error processing article: {e}")
-            error_count += 1
-            continue
+    summary['skipped'] += deduper.stats['existing']
+    summary['duplicates'] = deduper.stats['duplicates']
+    
+    if analysis_cache is not None:
+        summary.update({
+            f'analysis_cache_{key}': value
+            for key, value in analysis_cache.stats().items()
+        })
     
     # 최종 요약
     print()
     print("=" * 70)
     print("ETL Process Complete")
     print("=" * 70)
-    print(f"✓ Successfully processed: {processed_count} articles")
-    print(f"⊘ Skipped (already exists): {skipped_count} articles")
-    print(f"✗ Errors: {error_count} articles")
+    print(f"✓ Successfully processed: {summary['processed']} articles")
+    print(f"⊘ Skipped (already exists): {summary['skipped']} articles")
+    print(f"✗ Errors: {summary['errors']} articles")
+    print(f"⊘ Duplicate URLs in batch: {summary['duplicates']} articles")
+    print(f"⊘ Near-duplicates (analysis reused): {summary['near_duplicates']} articles")
+    print(f"⊘ Filtered (low tech relevance): {summary['filtered']} articles")
+    if work_queue is not None:
+        print(f"⟳ Resumed from checkpoint: {summary['resumed']} articles")
+        print(f"⟳ Work queue: {work_queue.stats()}")
+    if analysis_cache is not None:
+        print(
+            f"⟳ Analysis cache: {summary['analysis_cache_hits']} hits, "
+            f"{summary['analysis_cache_misses']} misses"
+        )
+    if components.definer is not None:
+        print(
+            f"✓ Concepts defined: {summary['concepts_defined']} "
+            f"({summary['definition_errors']} failed), "
+            f"relations: {summary['relations_inserted']} new, {summary['relations_updated']} updated"
+        )
+    if components.metrics is not None:
+        print_stage_totals(components.metrics.stage_totals())
     print(f"Total fetched: {len(articles)} articles")
     print("=" * 70)
     
-    return {
-        'processed': processed_count,
-        'skipped': skipped_count,
-        'errors': error_count
-    }
+    return summary
 
 
-if __name__ == "__main__":
+def print_stage_totals(totals: Dict[str, Dict[str, float]]):
+    """단계별 소요 시간과 비용 요약 출력 (RunMetrics.stage_totals() 결과)"""
+    for stage, total in totals.items():
+        print(
+            f"⟳ {stage}: {total['seconds']:.1f}s over {total['items']} items, "
+            f"{total['bytes'] / 1024:.0f} KiB, "
+            f"{total['prompt_tokens']}+{total['completion_tokens']} tokens, "
+            f"{total['retries']} retries, {total['cache_hits']} cache hits"
+        )
+
+
+def run_daemon(
+    interval: float = 900.0,
+    max_articles: int = 10,
+    daily_quota: int = 100,
+    max_cycles: Optional[int] = None,
+    recorder: Optional[CorpusRecorder] = None,
+    feeds: Optional[List[Dict[str, str]]] = None,
+    rss_feeds: Optional[List[str]] = None,
+    **options
+) -> Dict[str, int]:
+    """
+    데몬 모드 실행 (활성화된 앱 컨텍스트 안에서 호출)
+    
+    앱 컨텍스트, GNews HTTP 세션, 스크래퍼/LLM 클라이언트, 캐시를 한 번만 만들고
+    interval마다 워터마크 이후의 새 기사만 수집해 처리합니다.
+    
+    Args:
+        interval (float): 주기 시작 간격 (초)
+        max_articles (int): 한 번의 GNews 요청으로 가져올 최대 기사 수
+        daily_quota (int): UTC 하루 최대 GNews 요청 수
+        max_cycles (int, optional): 이 횟수만큼 실행 후 종료 (None이면 종료 신호까지)
+        recorder (CorpusRecorder, optional): 지정하면 외부 입력을 재생용 코퍼스에 기록
+        feeds (list, optional): 주기마다 동시에 조회할 피드 목록 (피드 하나당 할당량 1 차감)
+        rss_feeds (list, optional): 주기마다 함께 조회할 RSS/Atom 피드 URL. None이면 ETL_RSS_FEEDS 환경 변수
+        **options: ETLComponents 설정 (run_etl_pipeline()의 같은 이름 인자)
+        
+    Returns:
+        dict: 누적 통계
+    """
+    if not check_environment():
+        return {}
+    
+    app = current_app._get_current_object()
+    fetcher = GNewsFetcher(recorder=recorder)
+    rss_fetcher = RSSFetcher(rss_feeds)
+    components = ETLComponents(app, run_kind='daemon', recorder=recorder, **options)
+    daemon = ETLDaemon(
+        components,
+        fetcher,
+        interval=interval,
+        max_articles=max_articles,
+        daily_quota=daily_quota,
+        feeds=feeds,
+        rss_fetcher=rss_fetcher if rss_fetcher.feed_urls else None
+    )
+    
+    try:
+        return daemon.run_forever(max_cycles=max_cycles)
+    finally:
+        components.close()
+        fetcher.close()
+        rss_fetcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TechExplained ETL 파이프라인')
+    parser.add_argument('--daemon', action='store_true', help='주기적으로 새 기사를 수집하는 데몬 모드')
+    parser.add_argument('--max-articles', type=int, help='GNews 요청당 최대 기사 수 (기본값: 1회 실행 3, 데몬 10)')
+    parser.add_argument('--interval', type=float, default=900.0, help='데몬 주기 (초)')
+    parser.add_argument('--daily-quota', type=int, default=100, help='UTC 하루 최대 GNews 요청 수 (데몬)')
+    parser.add_argument('--max-cycles', type=int, help='데몬을 이 횟수만큼 실행 후 종료')
+    parser.add_argument(
+        '--feed', action='append', metavar='SPEC',
+        help="동시에 조회할 피드 (반복 가능): 'category[/country[/lang]]' 또는 'q:검색어'"
+    )
+    parser.add_argument(
+        '--rss-feed', action='append', metavar='URL',
+        help='함께 수집할 RSS/Atom 피드 (반복 가능, 기본값: ETL_RSS_FEEDS 환경 변수)'
+    )
+    parser.add_argument('--scrape-concurrency', type=int, default=4)
+    parser.add_argument('--analyze-concurrency', type=int, default=2)
+    parser.add_argument('--analyze-batch-size', type=int, default=1)
+    parser.add_argument('--load-batch-size', type=int, default=1)
+    parser.add_argument('--parse-processes', type=int, default=0)
+    parser.add_argument('--no-metrics', action='store_true', help='실행 기록(etl_runs.jsonl) 저장 안 함')
+    parser.add_argument(
+        '--record-corpus', nargs='?', const='', metavar='NAME',
+        help='GNews 응답/원본 HTML/LLM 응답을 ETL_CORPUS_DIR/NAME 코퍼스로 기록 (NAME 생략 시 시각, 기록 중에는 캐시 미사용)'
+    )
+    args = parser.parse_args()
+    
+    options = {
+        'scrape_concurrency': args.scrape_concurrency,
+        'analyze_concurrency': args.analyze_concurrency,
+        'analyze_batch_size': args.analyze_batch_size,
+        'load_batch_size': args.load_batch_size,
+        'parse_processes': args.parse_processes,
+        'record_metrics': not args.no_metrics,
+        'feeds': [parse_feed_spec(spec) for spec in args.feed] if args.feed else None,
+        'rss_feeds': args.rss_feed,
+    }
+    
     load_dotenv()
     
     print("[App Context] Flask 앱 컨텍스트를 생성합니다...")
     config_name = os.getenv('FLASK_ENV', 'development')
     app = create_app(config_name)
     
+    recorder = CorpusRecorder(args.record_corpus or None) if args.record_corpus is not None else None
+    
     with app.app_context():
         print("[App Context] Flask 앱 컨텍스트 생성 완료. ETL을 시작합니다.")
-        run_etl_pipeline(max_articles=3)
+        try:
+            if args.daemon:
+                run_daemon(
+                    interval=args.interval,
+                    max_articles=args.max_articles or 10,
+                    daily_quota=args.daily_quota,
+                    max_cycles=args.max_cycles,
+                    recorder=recorder,
+                    **options
+                )
+            else:
+                run_etl_pipeline(max_articles=args.max_articles or 3, recorder=recorder, **options)
+        finally:
+            if recorder is not None:
+                recorder.close()
         print("[App Context] ETL 작업 완료. DB 커밋이 보장됩니다.")
 
+
+if __name__ == "__main__":
+    main()
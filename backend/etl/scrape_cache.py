@@ -0,0 +1,245 @@
+"""
+스크래핑 캐시
+
+WebScraper 앞단의 디스크 캐시입니다.
+정규화된 URL별로 ETag/Last-Modified와 추출된 본문을 저장하고,
+원본 HTML은 내용 해시(sha256) 이름의 압축 파일로 보관합니다.
+같은 HTML을 가진 여러 URL은 하나의 파일을 공유합니다.
+
+재실행 시에는 If-None-Match/If-Modified-Since로 재검증만 하므로
+304 응답이면 본문을 다시 내려받지 않습니다.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+from app.utils.url_utils import canonicalize_url
+
+
+class ScrapeCache:
+    """URL 기준 스크래핑 결과 캐시 (LRU 용량 제한)"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir (str, optional): 캐시 디렉토리. None이면 ETL_CACHE_DIR 환경 변수 또는 '.etl_cache'
+            max_bytes (int, optional): 압축된 HTML 파일의 총 용량 상한.
+                                       None이면 ETL_SCRAPE_CACHE_MAX_BYTES 환경 변수 또는 512MB
+        """
+        self.cache_dir = os.path.join(
+            cache_dir or os.getenv('ETL_CACHE_DIR', '.etl_cache'),
+            'scrape'
+        )
+        self.blob_dir = os.path.join(self.cache_dir, 'blobs')
+        self.max_bytes = max_bytes or int(os.getenv('ETL_SCRAPE_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, 'index.sqlite3'),
+            check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS pages (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                text TEXT NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            '''
+        )
+        self._conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS blobs (
+                content_hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL
+            )
+            '''
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages (accessed_at)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_pages_content ON pages (content_hash)')
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        캐시 항목 조회
+
+        Args:
+            url (str): 기사 URL
+
+        Returns:
+            dict: {
+                'url': str,
+                'content_hash': str,
+                'etag': str or None,
+                'last_modified': str or None,
+                'text': str
+            } or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, content_hash, etag, last_modified, text FROM pages WHERE url_key = ?',
+                (self._url_key(url),)
+            ).fetchone()
+
+        return dict(row) if row else None
+
+    def load_html(self, entry: Dict) -> Optional[bytes]:
+        """
+        캐시된 원본 HTML 반환
+
+        Args:
+            entry (dict): get()의 결과
+
+        Returns:
+            bytes: 원본 HTML. 파일이 없으면 None
+        """
+        try:
+            with open(self._blob_path(entry['content_hash']), 'rb') as f:
+                return zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+
+    def put(
+        self,
+        url: str,
+        raw_html: bytes,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        스크래핑 결과 저장
+
+        Args:
+            url (str): 기사 URL
+            raw_html (bytes): 원본 HTML
+            text (str): 추출된 본문
+            etag (str, optional): 응답의 ETag 헤더
+            last_modified (str, optional): 응답의 Last-Modified 헤더
+        """
+        content_hash = hashlib.sha256(raw_html).hexdigest()
+        blob_path = self._blob_path(content_hash)
+        compressed = zlib.compress(raw_html, 6)
+
+        url_key = self._url_key(url)
+
+        with self._lock:
+            previous = self._conn.execute(
+                'SELECT content_hash FROM pages WHERE url_key = ?', (url_key,)
+            ).fetchone()
+            known = self._conn.execute(
+                'SELECT 1 FROM blobs WHERE content_hash = ?', (content_hash,)
+            ).fetchone()
+
+            if not known or not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                tmp_path = f'{blob_path}.{threading.get_ident()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, blob_path)
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO blobs (content_hash, size) VALUES (?, ?)',
+                    (content_hash, len(compressed))
+                )
+
+            self._conn.execute(
+                '''
+                INSERT OR REPLACE INTO pages
+                    (url_key, url, content_hash, etag, last_modified, text, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''',
+                (url_key, url, content_hash, etag, last_modified, text, time.time())
+            )
+            if previous and previous['content_hash'] != content_hash:
+                self._release_blob(previous['content_hash'])
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        재검증(304) 성공 시 접근 시각과 검증 헤더 갱신
+
+        Args:
+            url (str): 기사 URL
+            etag (str, optional): 304 응답의 ETag (있으면 갱신)
+            last_modified (str, optional): 304 응답의 Last-Modified (있으면 갱신)
+        """
+        with self._lock:
+            self._conn.execute(
+                '''
+                UPDATE pages
+                SET accessed_at = ?,
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified)
+                WHERE url_key = ?
+                ''',
+                (time.time(), etag, last_modified, self._url_key(url))
+            )
+            self._conn.commit()
+
+    def close(self):
+        """캐시 인덱스 닫기"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self):
+        """용량 상한을 넘으면 오래 사용하지 않은 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            'SELECT url_key, content_hash FROM pages ORDER BY accessed_at ASC'
+        ).fetchall()
+
+        for row in rows:
+            if total <= self.max_bytes:
+                break
+
+            self._conn.execute('DELETE FROM pages WHERE url_key = ?', (row['url_key'],))
+            total -= self._release_blob(row['content_hash'])
+
+    def _release_blob(self, content_hash: str) -> int:
+        """
+        더 이상 참조하는 항목이 없는 HTML 파일 삭제 (lock 보유 상태에서 호출)
+
+        Returns:
+            int: 확보된 용량 (바이트)
+        """
+        still_used = self._conn.execute(
+            'SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1', (content_hash,)
+        ).fetchone()
+        if still_used:
+            return 0
+
+        blob = self._conn.execute(
+            'SELECT size FROM blobs WHERE content_hash = ?', (content_hash,)
+        ).fetchone()
+        self._conn.execute('DELETE FROM blobs WHERE content_hash = ?', (content_hash,))
+
+        try:
+            os.remove(self._blob_path(content_hash))
+        except OSError:
+            pass
+
+        return blob['size'] if blob else 0
+
+    def _blob_path(self, content_hash: str) -> str:
+        return os.path.join(self.blob_dir, content_hash[:2], f'{content_hash}.html.z')
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()
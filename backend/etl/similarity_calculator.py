@@ -5,7 +5,14 @@
 """
 
 import re
-from typing import Set
+from typing import FrozenSet, List, NamedTuple, Set
+
+
+class ConceptFeatures(NamedTuple):
+    """유사도 계산용 개념 특징"""
+    name: str
+    name_words: FrozenSet[str]
+    keywords: FrozenSet[str]
 
 
 class SimilarityCalculator:
@@ -39,12 +46,48 @@ class SimilarityCalculator:
             concept1: Concept 모델 객체 (name, description_ko 필요)
             concept2: Concept 모델 객체
             
+        Returns:
+            float: 유사도 점수 (0.0 ~ 1.0)
+        """
+        return SimilarityCalculator.score_features(
+            SimilarityCalculator.extract_features(concept1.name, concept1.description_ko),
+            SimilarityCalculator.extract_features(concept2.name, concept2.description_ko)
+        )
+    
+    @staticmethod
+    def extract_features(name: str, description_ko: str) -> ConceptFeatures:
+        """
+        유사도 계산에 필요한 특징 추출 (개념마다 한 번만 계산해서 재사용)
+        
+        Args:
+            name (str): 개념 이름
+            description_ko (str): 개념 설명
+            
+        Returns:
+            ConceptFeatures: 정규화된 이름, 이름 단어, 키워드
+        """
+        lowered = name.lower().strip()
+        return ConceptFeatures(
+            name=lowered,
+            name_words=frozenset(re.findall(r'[a-zA-Z가-힣]{2,}', lowered)),
+            keywords=frozenset(SimilarityCalculator._extract_keywords(f"{name} {description_ko}"))
+        )
+    
+    @staticmethod
+    def score_features(features1: ConceptFeatures, features2: ConceptFeatures) -> float:
+        """
+        미리 추출한 특징으로 유사도 계산 (calculate_similarity와 같은 결과)
+        
+        Args:
+            features1 (ConceptFeatures): 첫 번째 개념 특징
+            features2 (ConceptFeatures): 두 번째 개념 특징
+            
         Returns:
             float: 유사도 점수 (0.0 ~ 1.0)
         """
         # 1. 개념 이름 기반 유사도
-        name1 = concept1.name.lower().strip()
-        name2 = concept2.name.lower().strip()
+        name1 = features1.name
+        name2 = features2.name
         
         # 1-1. 완전 일치
         if name1 == name2:
@@ -55,21 +98,17 @@ class SimilarityCalculator:
             return 0.8
         
         # 1-3. 단어 단위 비교
-        name1_words = set(re.findall(r'[a-zA-Z가-힣]{2,}', name1))
-        name2_words = set(re.findall(r'[a-zA-Z가-힣]{2,}', name2))
+        name1_words = features1.name_words
+        name2_words = features2.name_words
         
         if name1_words and name2_words:
             name_overlap = len(name1_words & name2_words) / max(len(name1_words), len(name2_words))
             if name_overlap >= 0.5:
                 return 0.6 + (name_overlap * 0.2)
         
-        # 2. 키워드 추출
-        keywords1 = SimilarityCalculator._extract_keywords(
-            f"{concept1.name} {concept1.description_ko}"
-        )
-        keywords2 = SimilarityCalculator._extract_keywords(
-            f"{concept2.name} {concept2.description_ko}"
-        )
+        # 2. 키워드
+        keywords1 = features1.keywords
+        keywords2 = features2.keywords
         
         if not keywords1 or not keywords2:
             return 0.0
@@ -101,25 +140,35 @@ class SimilarityCalculator:
         return min(final_score, 1.0)
     
     @staticmethod
-    def _extract_keywords(text: str) -> Set[str]:
+    def tokenize(text: str) -> List[str]:
         """
-        텍스트에서 키워드 추출
+        텍스트를 키워드 토큰 리스트로 변환 (중복 유지, 등장 순서대로)
         
         Args:
-            text (str): 추출할 텍스트
+            text (str): 토큰화할 텍스트
             
         Returns:
-            Set[str]: 키워드 집합
+            List[str]: 2글자 이상, 불용어를 제외한 토큰들
         """
         # 특수문자 제거 후 소문자로 변환
         text = re.sub(r'[^a-zA-Z0-9가-힣\s]', ' ', text.lower())
         words = text.split()
         
         # 2글자 이상, 불용어 제외
-        keywords = {
+        return [
             w for w in words
             if len(w) >= 2 and w not in SimilarityCalculator.STOPWORDS
-        }
+        ]
+    
+    @staticmethod
+    def _extract_keywords(text: str) -> Set[str]:
+        """
+        텍스트에서 키워드 추출
         
-        return keywords
-
+        Args:
+            text (str): 추출할 텍스트
+            
+        Returns:
+            Set[str]: 키워드 집합
+        """
+        return set(SimilarityCalculator.tokenize(text))
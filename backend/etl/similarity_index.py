@@ -0,0 +1,274 @@
+"""
+개념 유사도 일괄 계산
+
+모든 개념 쌍에 SimilarityCalculator를 호출하면 O(N²)이므로,
+개념마다 특징을 한 번만 추출하고 역색인으로 점수가 0이 아닐 수 있는 쌍만 계산합니다.
+
+calculate_similarity의 점수가 0보다 크려면 두 개념이 아래 중 하나를 만족해야 합니다.
+- 한 이름이 다른 이름에 포함됨 (완전 일치 포함) → 이름 trigram 색인 + 짧은 이름 직접 비교
+- 이름 단어를 공유함 → 이름 단어 색인
+- 키워드를 공유함 → 키워드 색인
+
+따라서 threshold > 0이면 결과는 모든 쌍을 계산한 것과 같습니다.
+(max_keyword_df를 지정하면 너무 흔한 키워드는 후보 생성에서 제외하는 근사 모드)
+"""
+
+import heapq
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.extensions import db
+from app.models import Concept
+from etl.db_loader import PLACEHOLDER_DESCRIPTION
+from etl.relation_writer import RelationWriter
+from etl.similarity_calculator import ConceptFeatures, SimilarityCalculator
+
+
+class SimilarityIndex:
+    """개념별 상위 k개 유사 개념 계산기"""
+
+    def __init__(
+        self,
+        threshold: float = 0.3,
+        top_k: int = 10,
+        max_keyword_df: Optional[int] = None,
+        ignored_descriptions: Iterable[str] = ()
+    ):
+        """
+        Args:
+            threshold (float): 결과에 포함할 최소 유사도 (0보다 커야 함)
+            top_k (int): 개념별로 남길 최대 이웃 수
+            max_keyword_df (int, optional): 이보다 많은 개념에 등장하는 키워드는 후보 생성에서 제외.
+                                            None이면 제외하지 않음 (정확한 결과)
+            ignored_descriptions (iterable): 이 설명을 가진 개념은 이름만으로 비교
+                                             (예: DBLoader의 Placeholder 설명)
+
+        Raises:
+            ValueError: threshold가 0 이하일 때
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be greater than 0")
+
+        self.threshold = threshold
+        self.top_k = max(1, top_k)
+        self.max_keyword_df = max_keyword_df
+        self.ignored_descriptions = set(ignored_descriptions)
+
+        self.concept_ids: List[int] = []
+        self.features: List[ConceptFeatures] = []
+
+    def add(self, concept_id: int, name: str, description_ko: Optional[str]):
+        """개념 추가 (특징은 여기서 한 번만 추출)"""
+        if description_ko in self.ignored_descriptions:
+            description_ko = ''
+        self.concept_ids.append(concept_id)
+        self.features.append(SimilarityCalculator.extract_features(name, description_ko or ''))
+
+    def neighbors(self) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        개념별 유사 개념 계산
+
+        Returns:
+            dict: {concept_id: [(다른 concept_id, 점수), ...]} (점수 내림차순, 최대 top_k개)
+        """
+        heaps: List[List[Tuple[float, int]]] = [[] for _ in self.features]
+
+        for i, j, score in self._scored_pairs():
+            self._push(heaps[i], score, j)
+            self._push(heaps[j], score, i)
+
+        return {
+            self.concept_ids[i]: [
+                (self.concept_ids[-negated], score)
+                for score, negated in sorted(heap, reverse=True)
+            ]
+            for i, heap in enumerate(heaps)
+            if heap
+        }
+
+    def pairs(self) -> Iterator[Tuple[int, int, float]]:
+        """
+        어느 한쪽의 상위 k개에 포함된 개념 쌍 (중복 없음)
+
+        Yields:
+            tuple: (작은 concept_id, 큰 concept_id, 점수)
+        """
+        return unique_pairs(self.neighbors())
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _scored_pairs(self) -> Iterator[Tuple[int, int, float]]:
+        """후보 쌍 (i < j)의 점수 계산 (threshold 이상만)"""
+        keyword_postings = self._postings(lambda f: f.keywords)
+        word_postings = self._postings(lambda f: f.name_words)
+        containment = self._containment_pairs()
+
+        if self.max_keyword_df is not None:
+            keyword_postings = {
+                keyword: posting
+                for keyword, posting in keyword_postings.items()
+                if len(posting) <= self.max_keyword_df
+            }
+
+        score = SimilarityCalculator.score_features
+        features = self.features
+
+        for i, feature in enumerate(features):
+            candidates = set(containment.get(i, ()))
+            for postings, tokens in (
+                (keyword_postings, feature.keywords),
+                (word_postings, feature.name_words)
+            ):
+                for token in tokens:
+                    posting = postings.get(token)
+                    if posting:
+                        candidates.update(posting[bisect_right(posting, i):])
+
+            for j in candidates:
+                value = score(feature, features[j])
+                if value >= self.threshold:
+                    yield i, j, value
+
+    def _postings(self, tokens_of) -> Dict[str, List[int]]:
+        """토큰 → 개념 번호 리스트 (오름차순)"""
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for index, feature in enumerate(self.features):
+            for token in tokens_of(feature):
+                postings[token].append(index)
+        return postings
+
+    def _containment_pairs(self) -> Dict[int, Set[int]]:
+        """
+        한 이름이 다른 이름에 포함되는 쌍 → {작은 번호: {큰 번호, ...}}
+
+        3글자 이상 이름은 가장 드문 trigram을 가진 이름만 확인하고,
+        더 짧은 이름은 모든 이름과 직접 비교합니다.
+        """
+        names = [feature.name for feature in self.features]
+
+        trigrams: Dict[str, List[int]] = defaultdict(list)
+        for index, name in enumerate(names):
+            for gram in {name[k:k + 3] for k in range(len(name) - 2)}:
+                trigrams[gram].append(index)
+
+        pairs: Dict[int, Set[int]] = defaultdict(set)
+        for i, name in enumerate(names):
+            if len(name) >= 3:
+                grams = {name[k:k + 3] for k in range(len(name) - 2)}
+                candidates = min((trigrams[gram] for gram in grams), key=len)
+            else:
+                candidates = range(len(names))
+
+            for j in candidates:
+                if j != i and name in names[j]:
+                    pairs[min(i, j)].add(max(i, j))
+
+        return pairs
+
+    def _push(self, heap: List[Tuple[float, int]], score: float, other: int):
+        entry = (score, -other)
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+
+def unique_pairs(neighbors: Dict[int, List[Tuple[int, float]]]) -> Iterator[Tuple[int, int, float]]:
+    """
+    개념별 이웃 목록을 중복 없는 개념 쌍으로 변환
+
+    Yields:
+        tuple: (작은 concept_id, 큰 concept_id, 점수)
+    """
+    seen: Set[Tuple[int, int]] = set()
+    for concept_id, others in neighbors.items():
+        for other_id, score in others:
+            pair = (min(concept_id, other_id), max(concept_id, other_id))
+            if pair not in seen:
+                seen.add(pair)
+                yield pair[0], pair[1], score
+
+
+def build_similarity_relations(
+    threshold: float = 0.3,
+    top_k: int = 10,
+    max_keyword_df: Optional[int] = None,
+    batch_size: int = 1000,
+    mode: str = 'rules'
+) -> Dict[str, int]:
+    """
+    전체 개념의 유사도 관계('similar_to') 재계산 (앱 컨텍스트 안에서 호출)
+
+    개념 쌍마다 작은 ID → 큰 ID 방향으로 하나의 관계를 저장하며,
+    strength는 round(점수 × 10)입니다.
+
+    Args:
+        threshold (float): 관계로 저장할 최소 유사도
+        top_k (int): 개념별 최대 유사 개념 수
+        max_keyword_df (int, optional): SimilarityIndex 참고. tfidf 모드에서는 이 개수보다 많은 개념에
+                                        등장하는 토큰을 벡터에서 제외 (TfidfSimilarity max_df)
+        batch_size (int): 몇 개의 관계마다 DB에 반영할지
+        mode (str): 'rules' (SimilarityCalculator 점수, 정확) 또는
+                    'tfidf' (TF-IDF 코사인 유사도, numpy/scipy 필요)
+
+    Raises:
+        ValueError: 알 수 없는 mode
+
+    Returns:
+        dict: {'concepts': int, 'pairs': int, 'inserted': int, 'updated': int, 'graph_caches_cleared': int}
+    """
+    if mode == 'rules':
+        index = SimilarityIndex(
+            threshold=threshold,
+            top_k=top_k,
+            max_keyword_df=max_keyword_df,
+            ignored_descriptions={PLACEHOLDER_DESCRIPTION}
+        )
+    elif mode == 'tfidf':
+        from etl.tfidf_similarity import TfidfSimilarity
+
+        index = TfidfSimilarity(
+            threshold=threshold,
+            top_k=top_k,
+            max_df=max_keyword_df,
+            ignored_descriptions={PLACEHOLDER_DESCRIPTION}
+        )
+    else:
+        raise ValueError(f"Unknown similarity mode: {mode}")
+
+    rows = db.session.query(
+        Concept.concept_id, Concept.name, Concept.description_ko
+    ).execution_options(yield_per=batch_size)
+    for concept_id, name, description_ko in rows:
+        index.add(concept_id, name, description_ko)
+
+    stats = {'concepts': len(index.concept_ids), 'pairs': 0, 'inserted': 0, 'updated': 0, 'graph_caches_cleared': 0}
+    changed_ids: Set[int] = set()
+    writer = RelationWriter()
+
+    def flush():
+        result = writer.flush()
+        stats['inserted'] += result['inserted']
+        stats['updated'] += result['updated']
+        changed_ids.update(result['concept_ids'])
+        db.session.commit()
+
+    try:
+        for from_id, to_id, score in index.pairs():
+            writer.add(from_id, to_id, 'similar_to', round(score * 10))
+            stats['pairs'] += 1
+            if stats['pairs'] % batch_size == 0:
+                flush()
+        flush()
+
+        stats['graph_caches_cleared'] = RelationWriter.invalidate_graph_caches(changed_ids)
+        db.session.commit()
+
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return stats
@@ -0,0 +1,491 @@
+"""
+ETL 로컬 스텁 서버
+
+실제 API 없이 ETL을 실행/벤치마크할 수 있도록 외부 서비스를 흉내 내는 HTTP 서버입니다.
+
+- GNewsStub: GNews top-headlines/search 응답 형식. 요청마다 새 기사를 max개 만들어 최신순으로 반환
+- ChatCompletionsStub: OpenAI 호환 /chat/completions. AIAnalyzer(단건/배치)와 KnowledgeService
+  프롬프트를 구분해 형식에 맞는 JSON과 토큰 사용량(usage)을 반환
+- PublisherStub: 경로마다 결정적으로 생성되는 기술 기사 HTML (ETag/304 지원)
+
+서버마다 응답 지연(latency ± jitter)과 오류 비율(error_rate, 5xx)을 설정할 수 있고,
+ChatCompletionsStub은 rate_limit_rate 비율로 429(Retry-After)를 반환합니다.
+
+단독 실행하면 서버를 띄우고 ETL이 스텁을 사용하도록 하는 환경 변수를 출력합니다:
+    python -m etl.stub_servers --llm-latency 0.8 --error-rate 0.02
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from etl.similarity_calculator import SimilarityCalculator
+
+
+# 기사 본문에 섞을 영어 기술 용어 (관련도 필터/개념 추출 대상)
+TECH_TERMS = sorted(
+    keyword for keyword in SimilarityCalculator.TECH_KEYWORDS
+    if keyword.isascii() and len(keyword) > 2
+)
+
+# 스텁 기사 URL에 쓰는 가상 언론사 도메인 (.example은 예약 도메인)
+PUBLISHER_HOSTS = (
+    'www.techdaily.example',
+    'news.cloudwire.example',
+    'www.devreport.example',
+    'www.chipinsider.example',
+    'www.airesearch.example',
+)
+
+_COMPANIES = ('Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Labs', 'Wayne Systems', 'Cyberdyne')
+_VERBS = ('announced', 'released', 'expanded', 'open-sourced', 'acquired', 'benchmarked', 'redesigned')
+_AUDIENCES = ('developers', 'enterprises', 'data teams', 'startups', 'hospitals', 'banks', 'researchers')
+_FILLER = (
+    'The company said the rollout would start next quarter',
+    'Analysts expect the move to put pressure on competitors',
+    'Early customers reported lower costs and faster deployments',
+    'Critics questioned whether the pricing would remain sustainable',
+    'The team plans to publish more details at its developer conference',
+    'Regulators have not yet commented on the announcement',
+)
+
+_ARTICLE_MARKER_RE = re.compile(r'\[Article (\d+)\]\n')
+_CONCEPT_NAME_RE = re.compile(r"'(.+?)'라는 개념")
+
+
+def synthetic_article(key: str, paragraphs: int = 8) -> Dict[str, str]:
+    """
+    키(URL 경로 등)로 결정되는 가상 기술 기사 생성
+
+    Returns:
+        dict: {'title': str, 'text': str (문단을 빈 줄로 구분)}
+    """
+    rng = random.Random(hashlib.sha256(key.encode('utf-8')).digest())
+    company = rng.choice(_COMPANIES)
+    topic = rng.choice(TECH_TERMS)
+    title = f"{company} {rng.choice(_VERBS)} {topic} platform for {rng.choice(_AUDIENCES)}"
+
+    blocks = []
+    for _ in range(paragraphs):
+        sentences = []
+        for _ in range(rng.randint(3, 5)):
+            first, second = rng.sample(TECH_TERMS, 2)
+            sentences.append(
+                f"{rng.choice(_COMPANIES)} {rng.choice(_VERBS)} a {first} service that combines "
+                f"{second} with {topic} for {rng.choice(_AUDIENCES)}."
+            )
+            sentences.append(f"{rng.choice(_FILLER)} (ref {rng.getrandbits(32):08x}).")
+        blocks.append(' '.join(sentences))
+
+    return {'title': title, 'text': '\n\n'.join(blocks)}
+
+
+class StubServer:
+    """스텁 HTTP 서버 공통 부분 (백그라운드 스레드에서 실행)"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            latency (float): 응답 지연 평균 (초)
+            jitter (float): 지연 변동 비율 (0.5면 latency의 ±50% 범위에서 균등 분포)
+            error_rate (float): 500 응답 비율 (0~1)
+            host (str): 바인드 주소
+            port (int): 포트 (0이면 임의의 빈 포트)
+            seed (int, optional): 지연/오류 난수 시드
+        """
+        self.latency = max(0.0, latency)
+        self.jitter = max(0.0, jitter)
+        self.error_rate = error_rate
+        self.host = host
+        self.port = port
+
+        self.stats = {'requests': 0, 'errors': 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> 'StubServer':
+        """서버 시작 (port=0이면 할당된 포트로 self.port 갱신)"""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name=f"{type(self).__name__}-{self.port}",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(self, method: str, path: str, query: Dict[str, List[str]], headers, body: bytes) -> Tuple:
+        """
+        요청 처리 (하위 클래스에서 구현)
+
+        Returns:
+            tuple: (상태 코드, 응답 헤더 dict, 응답 본문 bytes)
+        """
+        raise NotImplementedError
+
+    def _respond(self, method: str, raw_path: str, headers, body: bytes) -> Tuple:
+        """지연/오류 주입 후 handle() 호출"""
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = self.latency * self._rng.uniform(1 - self.jitter, 1 + self.jitter) if self.latency else 0.0
+            failed = self._rng.random() < self.error_rate
+
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            self._count('errors')
+            return 500, {'Content-Type': 'application/json'}, b'{"error": "stub server error"}'
+
+        parts = urlsplit(raw_path)
+        return self.handle(method, parts.path, parse_qs(parts.query), headers, body)
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._dispatch('GET')
+
+            def do_POST(self):
+                self._dispatch('POST')
+
+            def _dispatch(self, method: str):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                try:
+                    status, headers, payload = stub._respond(method, self.path, self.headers, body)
+                except Exception as e:
+                    status, headers, payload = 500, {'Content-Type': 'text/plain'}, str(e).encode('utf-8')
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if payload and method != 'HEAD':
+                    self.wfile.write(payload)
+
+        return Handler
+
+    @staticmethod
+    def _json(status: int, data, extra_headers: Optional[Dict[str, str]] = None) -> Tuple:
+        headers = {'Content-Type': 'application/json'}
+        headers.update(extra_headers or {})
+        return status, headers, json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+class GNewsStub(StubServer):
+    """
+    GNews top-headlines/search 스텁 (요청마다 새 기사 생성)
+
+    'to'가 있으면 그 시각 직전부터 1초 간격으로 거슬러 올라가며 발행 시각을 매기고,
+    'from'보다 오래된 기사는 빼므로 데몬의 구간 조회(꽉 찬 응답 → 이전 구간 요청)를 재현할 수 있습니다.
+    """
+
+    def __init__(self, max_per_request: int = 100, **kwargs):
+        """
+        Args:
+            max_per_request (int): 요청 하나가 반환할 최대 기사 수 (GNews 유료 요금제 한도 100)
+            **kwargs: StubServer 설정
+        """
+        super().__init__(**kwargs)
+        self.max_per_request = max_per_request
+        self.run_tag = f"{random.Random().getrandbits(32):08x}"
+        self._next_id = 0
+
+    def handle(self, method, path, query, headers, body):
+        if not path.rstrip('/').endswith(('/top-headlines', '/search')):
+            return self._json(404, {'errors': ['Not found']})
+        if not query.get('apikey'):
+            return self._json(401, {'errors': ['You did not provide an API key.']})
+
+        count = min(self.max_per_request, max(1, int(query.get('max', ['10'])[0])))
+        with self._lock:
+            first_id = self._next_id
+            self._next_id += count
+
+        now = datetime.utcnow()
+        newest = now
+        if query.get('to'):
+            newest = datetime.strptime(query['to'][0], '%Y-%m-%dT%H:%M:%SZ') - timedelta(seconds=1)
+        oldest = None
+        if query.get('from'):
+            oldest = query['from'][0]
+
+        articles = []
+        for article_id in range(first_id + count - 1, first_id - 1, -1):
+            host = PUBLISHER_HOSTS[article_id % len(PUBLISHER_HOSTS)]
+            url = f"https://{host}/{now:%Y/%m}/story-{self.run_tag}-{article_id}"
+            article = synthetic_article(urlsplit(url).path)
+            published = newest - timedelta(seconds=first_id + count - 1 - article_id)
+            if oldest and published.strftime('%Y-%m-%dT%H:%M:%SZ') < oldest:
+                break
+            articles.append({
+                'title': article['title'],
+                'description': article['text'][:200],
+                'content': article['text'][:260],
+                'url': url,
+                'image': None,
+                'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'source': {'name': host.split('.')[-2], 'url': f"https://{host}"}
+            })
+
+        return self._json(200, {'totalArticles': len(articles), 'articles': articles})
+
+
+class PublisherStub(StubServer):
+    """언론사 기사 페이지 스텁 (경로마다 같은 HTML, ETag 조건부 요청 지원)"""
+
+    def handle(self, method, path, query, headers, body):
+        etag = f'"{hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]}"'
+        if headers.get('If-None-Match') == etag:
+            self._count('not_modified')
+            return 304, {'ETag': etag}, b''
+
+        article = synthetic_article(path)
+        paragraphs = ''.join(f"<p>{block}</p>\n" for block in article['text'].split('\n\n'))
+        html = (
+            "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<title>{article['title']}</title></head><body>"
+            "<nav><a href=\"/\">Home</a> <a href=\"/tech\">Tech</a> <a href=\"/subscribe\">Subscribe</a></nav>"
+            f"<article><h1>{article['title']}</h1>\n{paragraphs}</article>"
+            "<footer>© Stub Publisher. All rights reserved.</footer></body></html>"
+        )
+        return 200, {'Content-Type': 'text/html; charset=utf-8', 'ETag': etag}, html.encode('utf-8')
+
+
+class ChatCompletionsStub(StubServer):
+    """OpenAI 호환 chat completions 스텁"""
+
+    def __init__(self, rate_limit_rate: float = 0.0, retry_after: float = 1.0, **kwargs):
+        """
+        Args:
+            rate_limit_rate (float): 429 응답 비율 (0~1)
+            retry_after (float): 429 응답의 Retry-After (초)
+            **kwargs: StubServer 설정
+        """
+        super().__init__(**kwargs)
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+
+    def handle(self, method, path, query, headers, body):
+        if method != 'POST' or not path.rstrip('/').endswith('/chat/completions'):
+            return self._json(404, {'error': {'message': 'Not found'}})
+
+        with self._lock:
+            rate_limited = self._rng.random() < self.rate_limit_rate
+        if rate_limited:
+            self._count('rate_limited')
+            return self._json(
+                429,
+                {'error': {'message': 'Rate limit exceeded', 'type': 'rate_limit_error'}},
+                {'Retry-After': str(self.retry_after)}
+            )
+
+        request = json.loads(body or b'{}')
+        prompt = '\n'.join(str(message.get('content', '')) for message in request.get('messages', []))
+        content = self._answer(prompt)
+
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        return self._json(200, {
+            'id': f"chatcmpl-stub-{self.stats['requests']}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'stub'),
+            'choices': [{
+                'index': 0,
+                'finish_reason': 'stop',
+                'message': {'role': 'assistant', 'content': content}
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
+            }
+        })
+
+    def _answer(self, prompt: str) -> str:
+        """프롬프트 종류(개념 정의/배치 분석/단건 분석)에 맞는 응답 JSON 문자열"""
+        concept_match = _CONCEPT_NAME_RE.search(prompt)
+        if concept_match:
+            return json.dumps(self._definition(concept_match.group(1)), ensure_ascii=False)
+
+        markers = list(_ARTICLE_MARKER_RE.finditer(prompt))
+        if markers:
+            entries = []
+            for position, marker in enumerate(markers):
+                end = markers[position + 1].start() if position + 1 < len(markers) else len(prompt)
+                entries.append(dict(self._analysis(prompt[marker.end():end]), index=int(marker.group(1))))
+            return json.dumps(entries, ensure_ascii=False)
+
+        text = prompt.split('Article text:', 1)[-1]
+        return json.dumps(self._analysis(text), ensure_ascii=False)
+
+    @staticmethod
+    def _analysis(text: str) -> Dict:
+        lowered = text.lower()
+        concepts = []
+        for term in TECH_TERMS:
+            if re.search(rf'\b{re.escape(term)}\b', lowered):
+                concepts.append(term)
+        concepts.sort(key=lowered.find)
+        return {
+            'title_ko': f"[스텁] {text.strip()[:40]}",
+            'summary_ko': f"스텁 요약입니다. 기사에는 {', '.join(concepts[:3]) or '기술'} 관련 내용이 있습니다.",
+            'concept_names': concepts[:5] or ['technology']
+        }
+
+    @staticmethod
+    def _definition(concept_name: str) -> Dict:
+        rng = random.Random(concept_name)
+        others = [term for term in TECH_TERMS if term != concept_name.lower()]
+        return {
+            'description_ko': f"{concept_name}은(는) 스텁 정의입니다. 벤치마크용으로 생성되었습니다. 실제 의미와 다를 수 있습니다.",
+            'parent_concepts': rng.sample(others, 1),
+            'child_concepts': rng.sample(others, 2),
+            'related_concepts': rng.sample(others, 2)
+        }
+
+
+class StubEnvironment:
+    """세 스텁 서버 묶음과 ETL이 이들을 사용하도록 하는 환경 변수"""
+
+    def __init__(
+        self,
+        gnews_latency: float = 0.2,
+        llm_latency: float = 0.8,
+        page_latency: float = 0.3,
+        jitter: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = '127.0.0.1',
+        port_base: int = 0
+    ):
+        """
+        Args:
+            gnews_latency / llm_latency / page_latency (float): 서버별 평균 응답 지연 (초)
+            jitter (float): 지연 변동 비율
+            error_rate (float): LLM/언론사 서버의 500 응답 비율
+            rate_limit_rate (float): LLM 서버의 429 응답 비율
+            seed (int, optional): 난수 시드
+            host (str): 바인드 주소
+            port_base (int): 0이 아니면 GNews/LLM/언론사 서버를 port_base, +1, +2 포트에 바인드
+        """
+        ports = (port_base, port_base + 1, port_base + 2) if port_base else (0, 0, 0)
+        self.gnews = GNewsStub(latency=gnews_latency, jitter=jitter, host=host, port=ports[0], seed=seed)
+        self.llm = ChatCompletionsStub(
+            latency=llm_latency, jitter=jitter, error_rate=error_rate,
+            rate_limit_rate=rate_limit_rate, host=host, port=ports[1], seed=seed
+        )
+        self.publisher = PublisherStub(
+            latency=page_latency, jitter=jitter, error_rate=error_rate, host=host, port=ports[2], seed=seed
+        )
+
+    def start(self) -> 'StubEnvironment':
+        for server in (self.gnews, self.llm, self.publisher):
+            server.start()
+        return self
+
+    def stop(self):
+        for server in (self.gnews, self.llm, self.publisher):
+            server.stop()
+
+    def env(self) -> Dict[str, str]:
+        """GNewsFetcher/AIAnalyzer/KnowledgeService/WebScraper가 스텁을 사용하도록 하는 환경 변수"""
+        return {
+            'GNEWS_API_KEY': 'stub',
+            'GNEWS_BASE_URL': f"{self.gnews.url}/api/v4",
+            'OPENROUTER_API_KEY': 'stub',
+            'OPENROUTER_BASE_URL': f"{self.llm.url}/v1",
+            'ETL_SCRAPE_BASE_URL': self.publisher.url
+        }
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            'gnews': dict(self.gnews.stats),
+            'llm': dict(self.llm.stats),
+            'publisher': dict(self.publisher.stats)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ETL 로컬 스텁 서버 (GNews / chat completions / 언론사 페이지)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port-base', type=int, default=8900, help='GNews 포트 (LLM +1, 언론사 +2)')
+    parser.add_argument('--gnews-latency', type=float, default=0.2)
+    parser.add_argument('--llm-latency', type=float, default=0.8)
+    parser.add_argument('--page-latency', type=float, default=0.3)
+    parser.add_argument('--jitter', type=float, default=0.5, help='지연 변동 비율')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='LLM/언론사 500 응답 비율')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='LLM 429 응답 비율')
+    args = parser.parse_args()
+
+    stubs = StubEnvironment(
+        gnews_latency=args.gnews_latency,
+        llm_latency=args.llm_latency,
+        page_latency=args.page_latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        host=args.host,
+        port_base=args.port_base
+    ).start()
+
+    print("✓ Stub servers running. Point the ETL at them with:")
+    for name, value in stubs.env().items():
+        print(f"  export {name}={value}")
+    print("(Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(60)
+            print(f"⟳ {stubs.stats()}")
+    except KeyboardInterrupt:
+        print(f"\n✓ Stub servers stopped: {stubs.stats()}")
+    finally:
+        stubs.stop()
+
+
+if __name__ == "__main__":
+    main()
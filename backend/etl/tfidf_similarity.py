@@ -0,0 +1,193 @@
+"""
+TF-IDF 기반 개념 유사도 (벡터화 모드)
+
+개념마다 이름 + description_ko로 TF-IDF 희소 벡터를 만들고,
+행 블록 단위의 희소 행렬 곱으로 코사인 유사도를 계산합니다.
+TECH_KEYWORDS에 포함된 토큰(2단어 키워드 포함)은 가중치를 높입니다.
+
+규칙 기반 점수(SimilarityCalculator)와 점수 척도는 다르지만,
+한 번의 행렬 곱으로 많은 쌍을 처리하므로 야간 전체 재계산에 적합합니다.
+numpy와 scipy가 필요합니다 (requirements.txt의 선택적 의존성).
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+from etl.similarity_calculator import SimilarityCalculator
+from etl.similarity_index import unique_pairs
+
+
+class TfidfSimilarity:
+    """개념별 상위 k개 유사 개념 계산기 (TF-IDF 코사인)"""
+
+    def __init__(
+        self,
+        threshold: float = 0.3,
+        top_k: int = 10,
+        name_weight: float = 2.0,
+        tech_boost: float = 2.0,
+        max_df_ratio: float = 0.5,
+        min_df_cutoff_concepts: int = 20,
+        max_df: Optional[int] = None,
+        block_size: int = 1024,
+        ignored_descriptions: Iterable[str] = ()
+    ):
+        """
+        Args:
+            threshold (float): 결과에 포함할 최소 코사인 유사도
+            top_k (int): 개념별로 남길 최대 이웃 수
+            name_weight (float): 이름에 등장한 토큰의 빈도 가중치
+            tech_boost (float): TECH_KEYWORDS 토큰의 가중치 배수
+            max_df_ratio (float): 전체 개념 중 이 비율보다 많이 등장하는 토큰은 제외
+            min_df_cutoff_concepts (int): 개념 수가 이보다 적으면 max_df_ratio를 적용하지 않음
+                                          (개념이 몇 개뿐이면 두 개념이 공유하는 토큰까지 제외되어 쌍이 사라짐)
+            max_df (int, optional): 이 개수보다 많은 개념에 등장하는 토큰은 제외 (개념 수와 무관한 절대 기준)
+            block_size (int): 한 번의 행렬 곱에서 처리할 행 수 (메모리 사용량 조절)
+            ignored_descriptions (iterable): 이 설명을 가진 개념은 이름만 사용
+
+        Raises:
+            ImportError: numpy/scipy가 설치되어 있지 않을 때
+        """
+        if np is None or sparse is None:
+            raise ImportError("TF-IDF similarity requires numpy and scipy (pip install numpy scipy)")
+
+        self.threshold = threshold
+        self.top_k = max(1, top_k)
+        self.name_weight = name_weight
+        self.tech_boost = tech_boost
+        self.max_df_ratio = max_df_ratio
+        self.min_df_cutoff_concepts = min_df_cutoff_concepts
+        self.max_df = max_df
+        self.block_size = max(1, block_size)
+        self.ignored_descriptions = set(ignored_descriptions)
+
+        self.concept_ids: List[int] = []
+        self._term_counts: List[Counter] = []
+
+    def add(self, concept_id: int, name: str, description_ko: Optional[str]):
+        """개념 추가 (토큰화는 여기서 한 번만 수행)"""
+        if description_ko in self.ignored_descriptions:
+            description_ko = ''
+
+        counts = Counter()
+        for token in self._terms(name):
+            counts[token] += self.name_weight
+        for token in self._terms(description_ko or ''):
+            counts[token] += 1
+
+        self.concept_ids.append(concept_id)
+        self._term_counts.append(counts)
+
+    def neighbors(self) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        개념별 유사 개념 계산
+
+        Returns:
+            dict: {concept_id: [(다른 concept_id, 점수), ...]} (점수 내림차순, 최대 top_k개)
+        """
+        matrix = self.build_matrix()
+        transposed = matrix.T.tocsr()
+        ids = np.asarray(self.concept_ids)
+        result: Dict[int, List[Tuple[int, float]]] = {}
+
+        for start in range(0, matrix.shape[0], self.block_size):
+            block = (matrix[start:start + self.block_size] @ transposed).tocsr()
+
+            for row in range(block.shape[0]):
+                lo, hi = block.indptr[row], block.indptr[row + 1]
+                columns = block.indices[lo:hi]
+                scores = block.data[lo:hi]
+
+                keep = (scores >= self.threshold) & (columns != start + row)
+                columns, scores = columns[keep], scores[keep]
+                if not len(scores):
+                    continue
+
+                if len(scores) > self.top_k:
+                    best = np.argpartition(-scores, self.top_k - 1)[:self.top_k]
+                    columns, scores = columns[best], scores[best]
+
+                order = np.lexsort((columns, -scores))
+                result[int(ids[start + row])] = [
+                    (int(ids[columns[k]]), min(float(scores[k]), 1.0))
+                    for k in order
+                ]
+
+        return result
+
+    def pairs(self) -> Iterator[Tuple[int, int, float]]:
+        """
+        어느 한쪽의 상위 k개에 포함된 개념 쌍 (중복 없음)
+
+        Yields:
+            tuple: (작은 concept_id, 큰 concept_id, 점수)
+        """
+        return unique_pairs(self.neighbors())
+
+    def build_matrix(self):
+        """
+        L2 정규화된 TF-IDF 행렬 생성
+
+        Returns:
+            scipy.sparse.csr_matrix: (개념 수 × 토큰 수), float32
+        """
+        total = len(self._term_counts)
+        document_frequency = Counter()
+        for counts in self._term_counts:
+            document_frequency.update(counts.keys())
+
+        max_df = total
+        if total >= self.min_df_cutoff_concepts:
+            max_df = max(1, int(total * self.max_df_ratio))
+        if self.max_df is not None:
+            max_df = min(max_df, self.max_df)
+
+        vocabulary: Dict[str, int] = {}
+        idf: List[float] = []
+        for token, df in document_frequency.items():
+            if df > max_df:
+                continue
+            weight = math.log((1 + total) / (1 + df)) + 1.0
+            if token in SimilarityCalculator.TECH_KEYWORDS:
+                weight *= self.tech_boost
+            vocabulary[token] = len(idf)
+            idf.append(weight)
+
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for counts in self._term_counts:
+            for token, count in counts.items():
+                column = vocabulary.get(token)
+                if column is not None:
+                    indices.append(column)
+                    data.append((1.0 + math.log(count)) * idf[column])
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+            shape=(total, len(idf))
+        )
+
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags((1.0 / norms).astype(np.float32)) @ matrix
+
+    @staticmethod
+    def _terms(text: str) -> List[str]:
+        """토큰 + TECH_KEYWORDS에 있는 2단어 키워드 (예: 'machine learning')"""
+        tokens = SimilarityCalculator.tokenize(text)
+        bigrams = [
+            f"{first} {second}"
+            for first, second in zip(tokens, tokens[1:])
+            if f"{first} {second}" in SimilarityCalculator.TECH_KEYWORDS
+        ]
+        return tokens + bigrams
@@ -0,0 +1,78 @@
+"""
+스크래핑 전 URL 중복 제거
+
+GNewsFetcher가 가져온 기사 중 이미 DB에 있거나 이번 실행에서 이미 본 기사를
+스크래핑/AI 분석 전에 걸러냅니다.
+
+- URL 정규화 (스킴/호스트 소문자, 기본 포트/fragment/추적 파라미터 제거)
+- 정규화 URL의 해시를 Article.url_hash와 IN 쿼리 한 번으로 비교
+- 정규화 URL은 중복 판단 키로만 사용하고, 이후 단계(스크래핑, 저장)에는 원본 URL을 그대로 전달
+  (정규화는 쿼리 파라미터 순서/인코딩을 바꾸므로 서명된 URL 등은 다른 리소스가 될 수 있음)
+"""
+
+import threading
+from typing import Dict, List
+
+from app.extensions import db
+from app.models import Article
+from app.utils.url_utils import canonicalize_url, url_hash
+from etl.bulk_ops import chunked
+
+
+class UrlDeduplicator:
+    """기사 URL 중복 제거기 (앱 컨텍스트 안에서 사용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seen = set()
+        self.stats = {'duplicates': 0, 'existing': 0}
+
+    def filter_new(self, articles: List[Dict]) -> List[Dict]:
+        """
+        새 기사만 남기기
+
+        Args:
+            articles (list): GNewsFetcher.fetch_articles() 결과
+
+        Returns:
+            list: DB에 없고 이번 실행에서 처음 본 기사들 (url은 앞뒤 공백만 제거한 원본 URL)
+        """
+        candidates = []
+        with self._lock:
+            for article_data in articles:
+                raw_url = (article_data.get('url') or '').strip()
+                if not raw_url:
+                    continue
+
+                url = canonicalize_url(raw_url)
+                if url in self._seen:
+                    self.stats['duplicates'] += 1
+                    continue
+
+                self._seen.add(url)
+                candidates.append((url, raw_url, article_data))
+
+        known = self._existing_urls({url for url, _, _ in candidates})
+
+        new_articles = []
+        for url, raw_url, article_data in candidates:
+            if url in known:
+                print(f"  ⊘ Already in database, skipping: {raw_url}")
+                self.stats['existing'] += 1
+                continue
+            new_articles.append(dict(article_data, url=raw_url))
+
+        return new_articles
+
+    @staticmethod
+    def _existing_urls(urls) -> set:
+        """DB에 이미 있는 정규화 URL (url_hash IN 쿼리)"""
+        by_hash = {url_hash(url): url for url in urls}
+        existing = set()
+        for chunk in chunked(sorted(by_hash)):
+            existing.update(
+                by_hash[value] for (value,) in db.session.query(Article.url_hash).filter(
+                    Article.url_hash.in_(chunk)
+                )
+            )
+        return existing
@@ -4,23 +4,106 @@
 주어진 URL에서 기사 본문을 추출합니다.
 """
 
-import requests
+import codecs
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
 from bs4 import BeautifulSoup
-from typing import Optional
+
+from etl import metrics
+from etl.html_extractor import ExtractionPool, StreamingTextExtractor, extract_text_from_soup
+from etl.scrape_cache import ScrapeCache
+
+
+# 스트리밍 모드에서 허용하는 Content-Type
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# <meta charset=...> 감지용
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+
+
+class ScrapeAborted(Exception):
+    """스크래핑을 중단해야 하는 응답 (HTML이 아닌 문서 등)"""
 
 
 class WebScraper:
     """웹 페이지 스크래핑 클래스"""
     
-    def __init__(self, timeout: int = 15):
+    def __init__(
+        self,
+        timeout: int = 15,
+        max_connections: int = 20,
+        max_per_host: int = 2,
+        streaming: bool = True,
+        max_bytes: int = 2 * 1024 * 1024,
+        chunk_size: int = 64 * 1024,
+        extraction_pool: Optional[ExtractionPool] = None,
+        cache: Optional[ScrapeCache] = None,
+        base_url: Optional[str] = None,
+        recorder=None
+    ):
         """
         Args:
             timeout (int): 요청 타임아웃 (초)
+            max_connections (int): 동시에 진행할 수 있는 전체 요청 수
+            max_per_host (int): 같은 도메인에 동시에 보낼 수 있는 요청 수
+            streaming (bool): 본문을 조각 단위로 받으면서 추출할지 여부.
+                              False면 전체 응답을 BeautifulSoup으로 파싱
+            max_bytes (int): 스트리밍 모드에서 읽을 최대 바이트 수
+            chunk_size (int): 스트리밍 모드의 읽기 단위 (바이트)
+            extraction_pool (ExtractionPool, optional): 지정하면 원본 HTML을 내려받아
+                                                        프로세스 풀에서 파싱
+            cache (ScrapeCache, optional): 지정하면 캐시된 페이지를 조건부 요청으로 재검증
+            base_url (str, optional): 지정하면 기사 URL의 scheme/host를 이 주소로 바꿔서 요청
+                                      (None이면 ETL_SCRAPE_BASE_URL 환경 변수). 로컬 스텁 서버로
+                                      벤치마크할 때 사용하며, 캐시 키와 도메인별 동시 요청 제한은 원래 URL 기준
+            recorder (CorpusRecorder, optional): 지정하면 내려받은 원본 HTML과 추출한 본문 해시를
+                                                 재생용 코퍼스에 기록 (304 응답으로 캐시를 재사용한 페이지는 제외)
         """
         self.timeout = timeout
+        self.max_connections = max(1, max_connections)
+        self.max_per_host = max(1, max_per_host)
+        self.streaming = streaming
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.extraction_pool = extraction_pool
+        self.cache = cache
+        self.base_url = base_url or os.getenv('ETL_SCRAPE_BASE_URL') or None
+        self.recorder = recorder
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        
+        # keep-alive 연결 풀 (스레드 간 공유)
+        self.client = httpx.Client(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+        )
+        
+        self._global_slots = threading.BoundedSemaphore(self.max_connections)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+    
+    def close(self):
+        """연결 풀 종료"""
+        self.client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def scrape_article(self, url: str) -> Optional[str]:
         """
@@ -32,31 +115,53 @@ class WebScraper:
         Returns:
             str: 추출된 텍스트. 실패 시 None
         """
+        cached = self.cache.get(url) if self.cache is not None else None
+        request_headers = self._conditional_headers(cached)
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
+            page = self._fetch_page(url, request_headers)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if page['not_modified']:
+                # 304 Not Modified: 캐시된 본문 재사용 (서버가 검증 헤더를 바꿨으면 갱신)
+                self.cache.touch(url, etag=page['etag'], last_modified=page['last_modified'])
+                metrics.record(cache_hits=1)
+                print(f"  ✓ Not modified, using cached {len(cached['text'])} characters: {url}")
+                return cached['text']
             
-            # 본문 추출 (여러 전략 시도)
-            article_text = self._extract_text(soup)
+            article_text = page['text']
             
             if not article_text:
                 print(f"  ✗ No content found in article: {url}")
                 return None
             
+            if self.recorder is not None and page['raw_html'] is not None:
+                self.recorder.record_page(url, page['raw_html'], article_text)
+            
+            if self.cache is not None and page['raw_html'] is not None:
+                self.cache.put(
+                    url,
+                    raw_html=page['raw_html'],
+                    text=article_text,
+                    etag=page['etag'],
+                    last_modified=page['last_modified']
+                )
+            
             print(f"  ✓ Scraped {len(article_text)} characters from {url}")
             return article_text
         
-        except requests.exceptions.Timeout:
+        except ScrapeAborted as e:
+            print(f"  ✗ {e}: {url}")
+            return None
+        
+        except httpx.TimeoutException:
             print(f"  ✗ Timeout error while scraping: {url}")
             return None
         
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             print(f"  ✗ HTTP error {e.response.status_code}: {url}")
             return None
         
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"  ✗ Request error while scraping: {e}")
             return None
         
@@ -64,43 +169,259 @@ class WebScraper:
             print(f"  ✗ Unexpected error while scraping: {e}")
             return None
     
-    def _extract_text(self, soup: BeautifulSoup) -> str:
+    def _fetch_page(self, url: str, request_headers: Dict[str, str]) -> Dict:
         """
-        BeautifulSoup 객체에서 텍스트 추출
+        페이지 요청 및 본문 추출
         
-        전략:
-        1. <article> 태그 찾기
-        2. <p> 태그들 수집
-        3. 스크립트, 스타일 제거
+        Args:
+            url (str): 기사 URL
+            request_headers (dict): 추가 요청 헤더 (조건부 요청 헤더)
+            
+        Returns:
+            dict: {
+                'text': str,
+                'raw_html': bytes or None,
+                'etag': str or None,
+                'last_modified': str or None,
+                'not_modified': bool (304 응답이면 True, text/raw_html은 None)
+            }
+            
+        Raises:
+            ScrapeAborted: HTML이 아닌 응답
+            httpx.HTTPError: 요청 실패 시
+        """
+        request_url = self._request_url(url)
+        
+        if self.extraction_pool is not None:
+            # 다운로드 슬롯은 파싱을 기다리기 전에 반납
+            with self._request_slot(url):
+                page = self._download(request_url, request_headers)
+            encoding = page.pop('encoding', None)
+            if not page['not_modified']:
+                page['text'] = self.extraction_pool.extract(page['raw_html'], encoding)
+            return page
+        
+        if self.streaming:
+            with self._request_slot(url):
+                return self._scrape_streaming(request_url, request_headers)
+        
+        with self._request_slot(url):
+            response = self.client.get(request_url, headers=request_headers)
+        if response.status_code == 304:
+            return self._not_modified(response)
+        response.raise_for_status()
+        metrics.record(bytes=len(response.content))
+        
+        soup = BeautifulSoup(response.content, 'html.parser')
+        
+        # 본문 추출 (여러 전략 시도)
+        return {
+            'text': self._extract_text(soup),
+            'raw_html': response.content,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'not_modified': False
+        }
+    
+    def _scrape_streaming(self, url: str, request_headers: Dict[str, str]) -> Dict:
+        """
+        응답 본문을 조각 단위로 읽으면서 텍스트 추출
+        
+        - HTML이 아닌 응답은 본문을 읽기 전에 중단
+        - max_bytes를 넘으면 읽기를 멈추고 그때까지 추출한 텍스트 사용
+        - <article> 본문이 확정되면 나머지 응답은 읽지 않음
+        - 캐시나 코퍼스 기록기를 사용할 때는 원본 HTML 전체를 보관해야 하므로,
+          본문이 확정된 뒤에도 (추출은 멈추고) max_bytes까지 끝까지 읽음
         
         Args:
-            soup (BeautifulSoup): 파싱된 HTML
+            url (str): 기사 URL
+            request_headers (dict): 추가 요청 헤더
             
         Returns:
-            str: 추출된 텍스트
+            dict: _fetch_page()와 같은 형식
+            
+        Raises:
+            ScrapeAborted: HTML이 아닌 응답
+            httpx.HTTPError: 요청 실패 시
         """
-        # 불필요한 태그 제거
-        for script in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            script.decompose()
+        with self.client.stream('GET', url, headers=request_headers) as response:
+            if response.status_code == 304:
+                return self._not_modified(response)
+            response.raise_for_status()
+            
+            content_type = response.headers.get('content-type', '')
+            if not self._is_html(content_type):
+                raise ScrapeAborted(f"Not an HTML page ({content_type})")
+            
+            extractor = StreamingTextExtractor()
+            decoder = None
+            received = 0
+            raw_chunks = [] if self.cache is not None or self.recorder is not None else None
+            extracting = True
+            
+            for chunk in response.iter_bytes(chunk_size=self.chunk_size):
+                if decoder is None:
+                    encoding = self._detect_encoding(response.charset_encoding, chunk)
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                
+                remaining = self.max_bytes - received
+                if len(chunk) > remaining:
+                    chunk = chunk[:remaining]
+                received += len(chunk)
+                if raw_chunks is not None:
+                    raw_chunks.append(chunk)
+                
+                if extracting:
+                    extractor.feed(decoder.decode(chunk))
+                    if extractor.article_ready:
+                        if raw_chunks is None:
+                            break
+                        extracting = False
+                
+                if received >= self.max_bytes:
+                    print(f"  ! Page exceeds {self.max_bytes} bytes, truncated: {url}")
+                    break
+            
+            metrics.record(bytes=received)
+            if decoder is not None and extracting:
+                extractor.feed(decoder.decode(b'', final=True))
+            extractor.close()
+            
+            return {
+                'text': extractor.get_text(),
+                'raw_html': b''.join(raw_chunks) if raw_chunks is not None else None,
+                'etag': response.headers.get('etag'),
+                'last_modified': response.headers.get('last-modified'),
+                'not_modified': False
+            }
+    
+    def _download(self, url: str, request_headers: Dict[str, str]) -> Dict:
+        """
+        원본 HTML 다운로드 (max_bytes까지만)
+        
+        Args:
+            url (str): 기사 URL
+            request_headers (dict): 추가 요청 헤더
+            
+        Returns:
+            dict: {
+                'raw_html': bytes,
+                'encoding': str or None (응답 헤더의 문자 인코딩),
+                'etag': str or None,
+                'last_modified': str or None,
+                'not_modified': bool (304 응답이면 True, raw_html은 None)
+            }
+            
+        Raises:
+            ScrapeAborted: HTML이 아닌 응답
+            httpx.HTTPError: 요청 실패 시
+        """
+        with self.client.stream('GET', url, headers=request_headers) as response:
+            if response.status_code == 304:
+                return self._not_modified(response)
+            response.raise_for_status()
+            
+            content_type = response.headers.get('content-type', '')
+            if not self._is_html(content_type):
+                raise ScrapeAborted(f"Not an HTML page ({content_type})")
+            
+            chunks = []
+            received = 0
+            for chunk in response.iter_bytes(chunk_size=self.chunk_size):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= self.max_bytes:
+                    print(f"  ! Page exceeds {self.max_bytes} bytes, truncated: {url}")
+                    break
+            metrics.record(bytes=received)
+            
+            return {
+                'raw_html': b''.join(chunks)[:self.max_bytes],
+                'encoding': response.charset_encoding,
+                'etag': response.headers.get('etag'),
+                'last_modified': response.headers.get('last-modified'),
+                'not_modified': False
+            }
+    
+    def _request_url(self, url: str) -> str:
+        """실제 요청 주소 (base_url이 있으면 scheme/host를 교체하고 경로와 쿼리는 유지)"""
+        if not self.base_url:
+            return url
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        path = base.path.rstrip('/') + (parts.path or '/')
+        return urlunsplit((base.scheme, base.netloc, path, parts.query, ''))
+    
+    @staticmethod
+    def _not_modified(response) -> Dict:
+        """304 응답 → 페이지 dict (본문 없음, 응답의 새 검증 헤더만)"""
+        return {
+            'text': None,
+            'raw_html': None,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'not_modified': True
+        }
+    
+    @staticmethod
+    def _conditional_headers(cached: Optional[Dict]) -> Dict[str, str]:
+        """캐시 항목의 검증 헤더로 조건부 요청 헤더 생성"""
+        headers = {}
+        if not cached:
+            return headers
+        
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        return headers
+    
+    @staticmethod
+    def _is_html(content_type: str) -> bool:
+        """Content-Type이 HTML인지 확인 (헤더가 없으면 HTML로 간주)"""
+        if not content_type:
+            return True
+        media_type = content_type.split(';', 1)[0].strip().lower()
+        return media_type in HTML_CONTENT_TYPES
+    
+    @staticmethod
+    def _detect_encoding(header_encoding: Optional[str], first_chunk: bytes) -> str:
+        """응답 헤더 → <meta charset> → UTF-8 순서로 인코딩 결정"""
+        candidates = [header_encoding]
+        
+        match = _META_CHARSET_RE.search(first_chunk[:4096])
+        if match:
+            candidates.append(match.group(1).decode('ascii', 'ignore'))
         
-        # 전략 1: <article> 태그 찾기
-        article_tag = soup.find('article')
-        if article_tag:
-            paragraphs = article_tag.find_all('p')
-            if paragraphs:
-                text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-                if len(text) > 200:  # 최소 길이 확인
-                    return text
+        for candidate in candidates:
+            if not candidate:
+                continue
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                continue
         
-        # 전략 2: 모든 <p> 태그 수집
-        paragraphs = soup.find_all('p')
-        text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+        return 'utf-8'
+    
+    def _extract_text(self, soup: BeautifulSoup) -> str:
+        """
+        BeautifulSoup 객체에서 텍스트 추출
         
-        return text
+        Args:
+            soup (BeautifulSoup): 파싱된 HTML
+            
+        Returns:
+            str: 추출된 텍스트
+        """
+        return extract_text_from_soup(soup)
     
     def scrape_multiple(self, urls: list) -> dict:
         """
-        여러 URL을 한 번에 스크래핑
+        여러 URL을 병렬로 스크래핑
+        
+        전체 동시 요청 수는 max_connections, 도메인별 동시 요청 수는
+        max_per_host로 제한됩니다.
         
         Args:
             urls (list): URL 리스트
@@ -108,10 +429,49 @@ class WebScraper:
         Returns:
             dict: {url: content or None}
         """
-        results = {}
+        return dict(self.iter_scrape(urls))
+    
+    def iter_scrape(self, urls: list) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        여러 URL을 병렬로 스크래핑하고 완료되는 순서대로 반환
         
-        for url in urls:
-            results[url] = self.scrape_article(url)
+        Args:
+            urls (list): URL 리스트 (중복은 한 번만 요청)
+            
+        Yields:
+            tuple: (url, content or None)
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return
         
-        return results
-
+        workers = min(self.max_connections, len(unique_urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scraper') as executor:
+            futures = {
+                executor.submit(self.scrape_article, url): url
+                for url in unique_urls
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
+    @contextmanager
+    def _request_slot(self, url: str):
+        """
+        전체/도메인별 동시 요청 수 제한
+        
+        도메인 슬롯을 먼저 잡아서, 한 도메인에 몰린 요청이
+        전체 슬롯을 점유하지 않도록 합니다.
+        """
+        host_slot = self._host_slot(url)
+        with host_slot:
+            with self._global_slots:
+                yield
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = (urlsplit(url).hostname or '').lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+            return slot
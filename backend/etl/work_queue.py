@@ -0,0 +1,360 @@
+"""
+ETL 작업 큐 (DB 기반 체크포인트)
+
+가져온 기사 URL마다 ETL_WorkItem 행을 만들고, 파이프라인 단계가 끝날 때마다
+상태와 중간 결과(본문, AI 분석 결과)를 저장합니다.
+실행이 중단돼도 다음 실행은 저장된 중간 결과부터 이어서 처리하므로
+이미 끝난 스크래핑이나 유료 AI 분석을 반복하지 않습니다.
+
+- 실패한 항목은 상한이 있는 지수 백오프 후 다시 시도 (max_attempts 초과 시 failed)
+- 여러 워커 프로세스(python -m etl.worker)가 같은 큐를 처리할 수 있도록 항목은 lease로 할당하고,
+  체크포인트마다 lease를 연장하며, 만료된 lease(죽은 워커)의 항목은 다른 워커가 다시 가져감
+- 모든 메서드는 호출마다 새 앱 컨텍스트에서 실행하고 커밋하므로 워커 스레드에서 바로 호출 가능
+"""
+
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from flask import Flask
+from sqlalchemy import func, or_, update
+
+from app.extensions import db
+from app.models import Article, ETL_WorkItem
+from app.utils.url_utils import url_hash
+from etl.bulk_ops import chunked, insert_ignore
+
+
+def backoff_delay(attempts: int, base_seconds: int = 60, cap_seconds: int = 6 * 3600) -> int:
+    """
+    재시도 대기 시간 (지수 백오프, 상한 적용)
+
+    Args:
+        attempts (int): 지금까지 실패한 횟수 (1 이상)
+        base_seconds (int): 첫 실패 후 대기 시간
+        cap_seconds (int): 최대 대기 시간
+
+    Returns:
+        int: 대기 시간 (초)
+    """
+    return min(cap_seconds, base_seconds * 2 ** max(0, attempts - 1))
+
+
+# claim() 한 번에 가져올 기본 최대 항목 수.
+# lease는 체크포인트에서만 연장되므로, 한 번에 가져온 항목이 모두 lease 시간 안에
+# 다음 단계로 넘어갈 수 있을 만큼만 가져옴 (가져온 항목이 큐에서 기다리는 동안 lease가 만료되면
+# 다른 워커가 같은 항목을 가져가 LLM 비용을 다시 씀)
+DEFAULT_CLAIM_LIMIT = 50
+
+# reactivate_skipped() 기본값: 관련도 필터로 건너뛴 항목은 용어 사전이 그 평가 때보다 5% 이상 커졌고,
+# 등록된 지 7일 이내인 항목만 최신순으로 한 번에 200개까지 다시 평가 (주기마다 전체 이력을 다시 보지 않도록)
+REACTIVATE_MIN_GROWTH = 0.05
+REACTIVATE_MAX_AGE_DAYS = 7
+REACTIVATE_LIMIT = 200
+
+
+class WorkQueue:
+    """ETL_WorkItem 기반 작업 큐"""
+
+    def __init__(
+        self,
+        app: Flask,
+        max_attempts: int = 5,
+        backoff_base: int = 60,
+        backoff_cap: int = 6 * 3600,
+        worker_id: Optional[str] = None,
+        lease_seconds: int = 15 * 60,
+        claim_limit: Optional[int] = None
+    ):
+        """
+        Args:
+            app (Flask): DB 작업에 사용할 앱
+            max_attempts (int): 이 횟수만큼 실패하면 failed로 표시하고 더 시도하지 않음
+            backoff_base (int): 첫 실패 후 재시도까지 대기 시간 (초)
+            backoff_cap (int): 재시도 대기 시간 상한 (초)
+            worker_id (str, optional): lease 소유자 이름 (None이면 '호스트:PID:임의값')
+            lease_seconds (int): lease 유지 시간. 체크포인트마다 연장되며,
+                                 이 시간 동안 진행이 없으면 다른 워커가 항목을 가져감
+            claim_limit (int, optional): claim() 한 번에 가져올 기본 최대 항목 수
+                                         (None이면 DEFAULT_CLAIM_LIMIT)
+        """
+        self.app = app
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.worker_id = (worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}")[:64]
+        self.lease_seconds = lease_seconds
+        self.claim_limit = claim_limit or DEFAULT_CLAIM_LIMIT
+
+    def enqueue(self, articles: List[Dict]) -> int:
+        """
+        가져온 기사를 작업 항목으로 등록 (이미 등록된 URL은 무시)
+
+        Args:
+            articles (list): UrlDeduplicator.filter_new() 결과 (url_hash는 정규화 URL 기준)
+
+        Returns:
+            int: 새로 등록된 항목 수
+        """
+        now = datetime.utcnow()
+        rows = {}
+        for article_data in articles:
+            url = article_data.get('url')
+            if url:
+                rows.setdefault(url_hash(url), {
+                    'url_hash': url_hash(url),
+                    'url': url,
+                    'state': 'fetched',
+                    'payload': {'article': article_data},
+                    'attempts': 0,
+                    'created_at': now,
+                    'updated_at': now
+                })
+
+        with self.app.app_context():
+            added = 0
+            for chunk in chunked(list(rows.values())):
+                added += insert_ignore(ETL_WorkItem, list(chunk)).rowcount
+            db.session.commit()
+            return added
+
+    def claim(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        지금 처리할 항목을 lease로 가져오기
+
+        처리할 단계가 남았고, 재시도 대기 시간이 지났고, 다른 워커의 lease가 없거나 만료된 항목을
+        이 워커 소유로 표시합니다.
+        - MySQL/PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 고르는 중인 행은 건너뜀
+        - SQLite: FOR UPDATE가 없지만 쓰기가 직렬화되므로 아래 조건부 UPDATE가 같은 역할을 함
+        두 경우 모두 UPDATE 조건에 lease 만료 여부를 다시 넣으므로 한 항목은 한 워커만 가져갑니다.
+
+        Args:
+            limit (int, optional): 최대 항목 수 (None이면 claim_limit)
+
+        Returns:
+            list: [{'article': dict, 'content': str(있으면), 'analysis': dict(있으면), 'state': str}, ...]
+        """
+        limit = limit or self.claim_limit
+        now = datetime.utcnow()
+        unleased = or_(ETL_WorkItem.lease_expires_at.is_(None), ETL_WorkItem.lease_expires_at <= now)
+
+        with self.app.app_context():
+            query = db.session.query(ETL_WorkItem.item_id).filter(
+                ETL_WorkItem.state.in_(ETL_WorkItem.ACTIVE_STATES),
+                or_(ETL_WorkItem.next_attempt_at.is_(None), ETL_WorkItem.next_attempt_at <= now),
+                unleased
+            ).order_by(ETL_WorkItem.item_id).with_for_update(skip_locked=True)
+            if limit:
+                query = query.limit(limit)
+
+            item_ids = [item_id for (item_id,) in query]
+            if not item_ids:
+                db.session.commit()
+                return []
+
+            db.session.execute(
+                update(ETL_WorkItem)
+                .where(ETL_WorkItem.item_id.in_(item_ids), unleased)
+                .values(lease_owner=self.worker_id, lease_expires_at=self._lease_expiry())
+            )
+            db.session.commit()
+
+            rows = db.session.query(ETL_WorkItem.state, ETL_WorkItem.payload).filter(
+                ETL_WorkItem.item_id.in_(item_ids),
+                ETL_WorkItem.lease_owner == self.worker_id
+            ).order_by(ETL_WorkItem.item_id)
+            return [dict(payload, state=state) for state, payload in rows]
+
+    def release(self) -> int:
+        """
+        이 워커가 가진 lease 모두 반환 (실행 종료 시 호출, 남은 항목은 다른 워커가 바로 가져갈 수 있음)
+
+        Returns:
+            int: 반환한 항목 수
+        """
+        with self.app.app_context():
+            result = db.session.execute(
+                update(ETL_WorkItem)
+                .where(ETL_WorkItem.lease_owner == self.worker_id)
+                .values(lease_owner=None, lease_expires_at=None)
+            )
+            db.session.commit()
+            return result.rowcount
+
+    def checkpoint(self, item: Dict, state: str):
+        """
+        단계 완료 기록 (상태와 중간 결과 저장)
+
+        Args:
+            item (dict): 파이프라인 작업 항목 ('article', 'content', 'analysis')
+            state (str): 완료된 단계 ('scraped', 'analyzed')
+        """
+        item['state'] = state
+        values = {'state': state, 'payload': self._payload(item), 'last_error': None, 'next_attempt_at': None}
+        if state in ETL_WorkItem.ACTIVE_STATES:
+            values['lease_expires_at'] = self._lease_expiry()
+        else:
+            values.update(lease_owner=None, lease_expires_at=None)
+        self._update(item, **values)
+
+    def skip(self, item: Dict, vocabulary_size: int):
+        """
+        관련도 필터로 건너뛴 항목 기록 (본문은 재평가용으로 보관)
+
+        Args:
+            item (dict): 파이프라인 작업 항목 ('article', 'content')
+            vocabulary_size (int): 평가에 사용한 관련도 필터의 용어 수
+        """
+        item['state'] = 'skipped'
+        self._update(
+            item, state='skipped', payload=self._payload(item), vocabulary_size=vocabulary_size,
+            last_error=None, next_attempt_at=None, lease_owner=None, lease_expires_at=None
+        )
+
+    def reactivate_skipped(
+        self,
+        vocabulary_size: int,
+        min_growth: float = REACTIVATE_MIN_GROWTH,
+        max_age_days: int = REACTIVATE_MAX_AGE_DAYS,
+        limit: int = REACTIVATE_LIMIT
+    ) -> int:
+        """
+        용어 사전이 그때보다 충분히 커졌으면 관련도 필터로 건너뛴 최근 항목을 다시 처리 대상으로 되돌림
+
+        되돌린 항목은 fetched 상태지만 본문이 저장되어 있으므로 다시 스크래핑하지 않고 관련도만 재평가합니다.
+        재평가에서 다시 건너뛰면 그때의 용어 수가 기록되므로, 같은 항목은 사전이 다시 min_growth만큼
+        커지기 전까지 되돌리지 않습니다.
+
+        Args:
+            vocabulary_size (int): 현재 관련도 필터의 용어 수
+            min_growth (float): 평가 당시보다 이 비율 이상 커진 경우만 (0.05 = 5%)
+            max_age_days (int): 등록된 지 이 일수 이내인 항목만
+            limit (int): 한 번에 되돌릴 최대 항목 수 (최신 항목부터)
+
+        Returns:
+            int: 되돌린 항목 수
+        """
+        threshold = vocabulary_size / (1 + max(0.0, min_growth))
+        created_after = datetime.utcnow() - timedelta(days=max_age_days)
+
+        with self.app.app_context():
+            item_ids = [
+                item_id for (item_id,) in db.session.query(ETL_WorkItem.item_id).filter(
+                    ETL_WorkItem.state == 'skipped',
+                    ETL_WorkItem.created_at >= created_after,
+                    or_(
+                        ETL_WorkItem.vocabulary_size.is_(None),
+                        ETL_WorkItem.vocabulary_size <= threshold
+                    )
+                ).order_by(ETL_WorkItem.item_id.desc()).limit(limit)
+            ]
+            if not item_ids:
+                db.session.commit()
+                return 0
+
+            result = db.session.execute(
+                update(ETL_WorkItem)
+                .where(ETL_WorkItem.item_id.in_(item_ids), ETL_WorkItem.state == 'skipped')
+                .values(state='fetched', next_attempt_at=None, updated_at=datetime.utcnow())
+            )
+            db.session.commit()
+            return result.rowcount
+
+    def mark_loaded(self, item: Dict) -> bool:
+        """
+        적재 완료 기록 (기사가 실제로 DB에 있을 때만, 없으면 실패로 처리)
+
+        Returns:
+            bool: 적재 완료로 기록했는지 여부
+        """
+        with self.app.app_context():
+            article_id = db.session.query(Article.article_id).filter(
+                Article.url_hash == url_hash(item['article']['url'])
+            ).scalar()
+
+        if article_id is None:
+            self.fail(item, 'Article was not saved')
+            return False
+
+        item['state'] = 'loaded'
+        # 적재 후에는 본문이 필요 없으므로 기사 정보와 분석 결과만 남김
+        payload = {key: value for key, value in self._payload(item).items() if key != 'content'}
+        self._update(
+            item, state='loaded', payload=payload, article_id=article_id,
+            last_error=None, next_attempt_at=None, lease_owner=None, lease_expires_at=None
+        )
+        return True
+
+    def fail(self, item: Dict, error: str) -> bool:
+        """
+        실패 기록 (마지막으로 완료된 단계는 유지하고 백오프 후 재시도)
+
+        Args:
+            item (dict): 파이프라인 작업 항목
+            error (str): 오류 메시지
+
+        Returns:
+            bool: 다시 시도할 예정이면 True, 최대 시도 횟수를 넘어 failed가 되었으면 False
+        """
+        hash_value = url_hash(item['article']['url'])
+        with self.app.app_context():
+            attempts = (db.session.query(ETL_WorkItem.attempts).filter(
+                ETL_WorkItem.url_hash == hash_value
+            ).scalar() or 0) + 1
+
+        values = {
+            'attempts': attempts,
+            'last_error': str(error)[:1000],
+            'payload': self._payload(item),
+            'lease_owner': None,
+            'lease_expires_at': None
+        }
+        if attempts >= self.max_attempts:
+            values['state'] = 'failed'
+        else:
+            delay = backoff_delay(attempts, self.backoff_base, self.backoff_cap)
+            values['next_attempt_at'] = datetime.utcnow() + timedelta(seconds=delay)
+
+        self._update(item, **values)
+        return attempts < self.max_attempts
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 항목 수"""
+        with self.app.app_context():
+            return dict(
+                db.session.query(ETL_WorkItem.state, func.count(ETL_WorkItem.item_id)).group_by(
+                    ETL_WorkItem.state
+                ).all()
+            )
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _update(self, item: Dict, **values):
+        """
+        이 워커가 lease를 가진 항목만 갱신
+
+        lease가 만료되어 다른 워커가 가져간 항목은 그 워커의 결과를 덮어쓰지 않습니다.
+        """
+        values['updated_at'] = datetime.utcnow()
+        with self.app.app_context():
+            result = db.session.execute(
+                update(ETL_WorkItem)
+                .where(ETL_WorkItem.url_hash == url_hash(item['article']['url']))
+                .where(ETL_WorkItem.lease_owner == self.worker_id)
+                .values(**values)
+            )
+            db.session.commit()
+
+        if not result.rowcount:
+            print(f"  ! Lease lost, not recording progress: {item['article']['url']}")
+
+    def _lease_expiry(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    @staticmethod
+    def _payload(item: Dict) -> Dict:
+        return {key: item[key] for key in ('article', 'content', 'analysis') if item.get(key) is not None}
@@ -0,0 +1,150 @@
+"""
+ETL 워커 프로세스
+
+ETL_WorkItem 작업 큐에서 항목을 lease로 가져와 처리하는 독립 프로세스입니다.
+같은 DB를 바라보는 워커를 한 서버 또는 여러 서버에서 여러 개 띄우면
+각 항목은 한 워커만 처리하고, 처리량은 워커 수에 비례해 늘어납니다.
+워커가 죽으면 그 워커의 lease가 만료된 뒤 다른 워커가 항목을 이어서 처리합니다.
+
+사용법:
+    python -m etl.worker                      # 큐가 빌 때까지 처리하고 대기 (Ctrl+C로 종료)
+    python -m etl.worker --enqueue 100        # GNews 기사 100개를 큐에 넣고 처리 시작
+    python -m etl.worker --exit-when-empty    # 큐가 비면 종료 (백필용)
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+from flask import current_app
+
+from app import create_app
+from etl.components import ETLComponents
+from etl.gnews_fetcher import GNewsFetcher
+from etl.run import check_environment
+from etl.url_deduper import UrlDeduplicator
+
+
+def enqueue_articles(components: ETLComponents, max_articles: int) -> int:
+    """
+    GNews 기사를 가져와 작업 큐에 등록
+
+    Returns:
+        int: 새로 등록된 항목 수
+    """
+    articles = GNewsFetcher().fetch_articles(max_results=max_articles)
+    new_articles = UrlDeduplicator().filter_new(articles)
+    added = components.work_queue.enqueue(new_articles)
+    print(f"✓ Enqueued {added} work items ({len(articles)} fetched, {len(new_articles)} new)")
+    return added
+
+
+def run_worker(
+    worker_id: Optional[str] = None,
+    claim_limit: int = 20,
+    poll_interval: float = 30.0,
+    exit_when_empty: bool = False,
+    enqueue: int = 0,
+    **options
+) -> Dict[str, int]:
+    """
+    작업 큐 처리 루프 (활성화된 앱 컨텍스트 안에서 호출)
+
+    Args:
+        worker_id (str, optional): lease 소유자 이름 (None이면 호스트/프로세스 기반으로 생성)
+        claim_limit (int): 한 번에 lease할 최대 항목 수
+        poll_interval (float): 처리할 항목이 없을 때 다시 확인하기까지 대기 시간 (초)
+        exit_when_empty (bool): 처리할 항목이 없으면 종료
+        enqueue (int): 시작 전에 GNews에서 가져와 큐에 넣을 기사 수 (0이면 가져오지 않음)
+        **options: ETLComponents 설정 (scrape_concurrency, analyze_batch_size 등)
+
+    Returns:
+        dict: 누적 파이프라인 통계
+    """
+    required_vars = ('GNEWS_API_KEY', 'OPENROUTER_API_KEY') if enqueue else ('OPENROUTER_API_KEY',)
+    if not check_environment(required_vars):
+        return {}
+
+    components = ETLComponents(
+        current_app._get_current_object(),
+        resume=True,
+        worker_id=worker_id,
+        claim_limit=claim_limit,
+        run_kind='worker',
+        **options
+    )
+    work_queue = components.work_queue
+    print(f"✓ Worker {work_queue.worker_id} started ({components.describe()})")
+
+    totals = Counter()
+    try:
+        if enqueue:
+            enqueue_articles(components, enqueue)
+
+        while True:
+            stats = components.pipeline.run([])
+            totals.update(stats)
+
+            if stats['items']:
+                print(
+                    f"✓ Batch done: {stats['processed']} processed, {stats['skipped']} skipped, "
+                    f"{stats['errors']} errors, {stats['resumed']} resumed"
+                )
+                continue
+
+            if exit_when_empty:
+                print("⊘ No work items due. Exiting.")
+                break
+            time.sleep(poll_interval)
+
+    except KeyboardInterrupt:
+        print("\n⊘ Worker interrupted. Releasing leases.")
+        work_queue.release()
+    finally:
+        components.close()
+
+    print(f"✓ Worker {work_queue.worker_id} finished: {dict(totals)}")
+    print(f"⟳ Work queue: {work_queue.stats()}")
+    return dict(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ETL 작업 큐 워커')
+    parser.add_argument('--worker-id', help='lease 소유자 이름 (기본값: 호스트:PID:임의값)')
+    parser.add_argument('--claim', type=int, default=20, help='한 번에 lease할 최대 항목 수')
+    parser.add_argument('--poll-interval', type=float, default=30.0, help='항목이 없을 때 대기 시간 (초)')
+    parser.add_argument('--exit-when-empty', action='store_true', help='처리할 항목이 없으면 종료')
+    parser.add_argument('--enqueue', type=int, default=0, help='시작 전에 GNews에서 가져와 큐에 넣을 기사 수')
+    parser.add_argument('--scrape-concurrency', type=int, default=4)
+    parser.add_argument('--analyze-concurrency', type=int, default=2)
+    parser.add_argument('--analyze-batch-size', type=int, default=1)
+    parser.add_argument('--load-batch-size', type=int, default=10)
+    parser.add_argument('--parse-processes', type=int, default=0)
+    parser.add_argument('--no-define', action='store_true', help='새 개념 정의 단계 생략')
+    parser.add_argument('--no-metrics', action='store_true', help='실행 기록(etl_runs.jsonl) 저장 안 함')
+    args = parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        run_worker(
+            worker_id=args.worker_id,
+            claim_limit=args.claim,
+            poll_interval=args.poll_interval,
+            exit_when_empty=args.exit_when_empty,
+            enqueue=args.enqueue,
+            scrape_concurrency=args.scrape_concurrency,
+            analyze_concurrency=args.analyze_concurrency,
+            analyze_batch_size=args.analyze_batch_size,
+            load_batch_size=args.load_batch_size,
+            parse_processes=args.parse_processes,
+            define_concepts=not args.no_define,
+            record_metrics=not args.no_metrics
+        )
+
+
+if __name__ == "__main__":
+    main()